@@ -12,6 +12,7 @@ For more details on variables used here, refer to docs.txt.
 
 # Import essential gameplay and logic functions from the core library.
 from chess.lib.core import (
+    positionHash,     # [positionHash](Source/chess/lib/core.py)
     getType,          # [getType](Source/chess/lib/core.py)
     isOccupied,       # [isOccupied](Source/chess/lib/core.py)
     isChecked,        # [isChecked](Source/chess/lib/core.py)
@@ -19,6 +20,8 @@ from chess.lib.core import (
     isValidMove,      # [isValidMove](Source/chess/lib/core.py)
     availableMoves,   # [availableMoves](Source/chess/lib/core.py)
     makeMove,         # [makeMove](Source/chess/lib/core.py)
+    move,             # [move](Source/chess/lib/core.py)
+    updateFlags,      # [updateFlags](Source/chess/lib/core.py)
 )
 
 # Import GUI-related items from the gui module.
@@ -40,6 +43,7 @@ from chess.lib.gui import (
 from chess.lib.utils import (
     encode,           # [encode](Source/chess/lib/utils.py)
     decode,           # [decode](Source/chess/lib/utils.py)
+    decodeMany,       # [decodeMany](Source/chess/lib/utils.py)
     initBoardVars,    # [initBoardVars](Source/chess/lib/utils.py)
     undo,             # [undo](Source/chess/lib/utils.py)
     getSFpath,        # [getSFpath](Source/chess/lib/utils.py)
@@ -49,25 +53,47 @@ from chess.lib.utils import (
     saveGame,         # [saveGame](Source/chess/lib/utils.py)
 )
 
+# A prebuilt green marker, blitted onto every square a selected piece can move to.
+GREEN_MARKER = pygame.Surface((10, 10))
+GREEN_MARKER.fill((0, 255, 0))
+
+# Colors of the dark and light board tiles, as drawn by drawBoard.
+DARK_TILE = (180, 100, 30)
+LIGHT_TILE = (220, 240, 240)
+
+# The board area, which every frame of showScreen redraws.
+BOARD_RECT = pygame.Rect(50, 50, 400, 400)
+
+# The position, selection and dirty rects of the last frame drawn by showScreen.
+_lastFrame = [None, []]
+
+# Whether showClock still has to refresh the whole display for this frame.
+_fullRefresh = [False]
+
 
 def convertMoves(moves):
     """Convert a list of algebraic move strings into the internal board representation.
 
     Automatically initializes the board using [`initBoardVars`](Source/chess/lib/utils.py),
-    decodes each move via [`decode`](Source/chess/lib/utils.py), and applies the move
-    using [`makeMove`](Source/chess/lib/core.py).
+    decodes the moves via [`decodeMany`](Source/chess/lib/utils.py), and applies each move
+    in place using [`move`](Source/chess/lib/core.py) and
+    [`updateFlags`](Source/chess/lib/core.py), so the whole game is replayed on a
+    single board without copying it for every ply.
 
     Args:
         moves (list[str]): A list of move strings in long algebraic notation (e.g., "e2e4").
 
     Returns:
         tuple: (side, board, flags) representing the current side to move, updated board,
-               and castling/en passant flags after applying all moves.
+               and castling/en passant flags after applying all moves. The board is
+               the replay buffer itself, freshly created on every call.
     """
     side, board, flags = initBoardVars()
 
-    for fro, to, promote in map(decode, moves):
-        side, board, flags = makeMove(side, board, fro, to, flags, promote)
+    for fro, to, promote in decodeMany(moves):
+        move(side, board, fro, to, promote)
+        flags = updateFlags(side, board, fro, to, flags)
+        side = not side
 
     return side, board, flags
 
@@ -107,7 +133,8 @@ def showClock(win, side, mode, timer, start_time, timedelta):
     If the game mode is -1, the clock is effectively paused, and elapsed time is added to
     the side's timer. Otherwise, the elapsed time is subtracted. It calls
     [`showTimeOver`](Source/chess/lib/gui.py) if time runs out, and uses
-    [`putClock`](Source/chess/lib/gui.py) for rendering.
+    [`putClock`](Source/chess/lib/gui.py) for rendering. It also presents the full
+    frame when [`showScreen`](#showscreen) left that to the clock.
 
     Args:
         win (pygame.Surface): Game window surface for drawing the clock.
@@ -121,7 +148,9 @@ def showClock(win, side, mode, timer, start_time, timedelta):
         list[int] or None: Updated timer array if still valid, or None if time ended or no timer given.
     """
     if timer is None:
-        pygame.display.update()
+        if _fullRefresh[0]:
+            _fullRefresh[0] = False
+            pygame.display.update()
         return None
 
     ret = list(timer)
@@ -139,14 +168,18 @@ def showClock(win, side, mode, timer, start_time, timedelta):
             return None
 
     putClock(win, ret)
+    if _fullRefresh[0]:
+        _fullRefresh[0] = False
+        pygame.display.update()
     return ret
 
 
 def showAvailMoves(win, side, board, pos, flags, flip):
     """Visualize legal moves by drawing green squares for the selected piece.
 
-    This function iterates over all possible moves from
-    [`availableMoves`](Source/chess/lib/core.py) and draws small markers on each valid square.
+    This function collects all possible moves from
+    [`availableMoves`](Source/chess/lib/core.py) and blits the small
+    [`GREEN_MARKER`](Source/chess/lib/__init__.py) on each valid square in one batch.
 
     Args:
         win (pygame.Surface): The game window surface.
@@ -156,19 +189,22 @@ def showAvailMoves(win, side, board, pos, flags, flip):
         flags (list): Castling/en passant flags.
         flip (bool): If True, the board display is inverted for the opponent's perspective.
     """
-    piece = pos + [getType(side, board, pos)]
-    for i in availableMoves(side, board, piece, flags):
-        x = 470 - i[0] * 50 if flip else i[0] * 50 + 20
-        y = 470 - i[1] * 50 if flip else i[1] * 50 + 20
-        pygame.draw.rect(win, (0, 255, 0), (x, y, 10, 10))
+    piece = (pos[0], pos[1], getType(side, board, pos))
+    if flip:
+        dests = [(470 - i[0] * 50, 470 - i[1] * 50) for i in availableMoves(side, board, piece, flags)]
+    else:
+        dests = [(i[0] * 50 + 20, i[1] * 50 + 20) for i in availableMoves(side, board, piece, flags)]
+    win.blits([(GREEN_MARKER, dest) for dest in dests], False)
 
 
 def animate(win, side, board, fro, to, load, player=None):
     """Create a smooth animation of moving a piece from origin to destination.
 
     This plays a drag sound before moving, smoothly transitions the piece, and finally
-    plays a move sound. It relies on [`drawBoard`](Source/chess/lib/gui.py) and
-    [`drawPieces`](Source/chess/lib/gui.py) to refresh the board at each frame.
+    plays a move sound. The static scene is drawn once with
+    [`drawBoard`](Source/chess/lib/gui.py) and [`drawPieces`](Source/chess/lib/gui.py)
+    into an off-screen surface; each frame then only restores and flushes the
+    piece's previous and new rects.
 
     Args:
         win (pygame.Surface): The game window surface.
@@ -180,11 +216,8 @@ def animate(win, side, board, fro, to, load, player=None):
         player (int, optional): Indicates which side is controlled by the local player. Defaults to None.
     """
     sound.play_drag(load)
-    if player is None:
-        # In multiplayer, the 'side' is also the local player
-        FLIP = side and load["flip"]
-    else:
-        FLIP = player and load["flip"]
+    # In multiplayer, the 'side' is also the local player
+    FLIP = (side if player is None else player) and load["flip"]
 
     piece = CHESS.PIECES[side][getType(side, board, fro)]
     x1, y1 = fro[0] * 50, fro[1] * 50
@@ -197,17 +230,32 @@ def animate(win, side, board, fro, to, load, player=None):
     stepy = (y2 - y1) / 50.0
 
     # Determine tile color for the origin square; helps redraw background cleanly
-    col = (180, 100, 30) if (fro[0] + fro[1]) % 2 else (220, 240, 240)
-    
-    clk = pygame.time.Clock()
-    for i in range(51):
-        clk.tick_busy_loop(100)
-        drawBoard(win)
-        drawPieces(win, board, FLIP)
-
-        pygame.draw.rect(win, col, (x1, y1, 50, 50))
-        win.blit(piece, (x1 + (i * stepx), y1 + (i * stepy)))
-        pygame.display.update()
+    col = DARK_TILE if (fro[0] + fro[1]) % 2 else LIGHT_TILE
+
+    # Render the board with every piece except the moving one just once
+    bg = pygame.Surface(win.get_size())
+    drawBoard(bg)
+    drawPieces(bg, board, FLIP)
+    pygame.draw.rect(bg, col, (x1, y1, 50, 50))
+
+    win.blit(bg, (0, 0))
+    win.blit(piece, (x1, y1))
+    pygame.display.flip()
+
+    # Bind the per-frame calls to locals to skip attribute lookups in the loop
+    blit, update, Rect = win.blit, pygame.display.update, pygame.Rect
+    tick = pygame.time.Clock().tick
+
+    prev = Rect(x1, y1, 50, 50)
+    for i in range(1, 51):
+        # Sleep between frames rather than spinning a core at 100 FPS
+        tick(100)
+        rect = Rect(x1 + (i * stepx), y1 + (i * stepy), 50, 50)
+        # Only the piece's old and new spots have changed
+        blit(bg, prev, prev)
+        blit(piece, rect)
+        update([prev, rect])
+        prev = rect
 
     sound.play_move(load)
 
@@ -217,7 +265,9 @@ def showScreen(win, side, board, flags, pos, load, player=None, online=False):
 
     This includes drawing the board, flipping for opponents, indicating check/checkmate,
     showing legal moves, and placing interactive buttons. Called on each iteration of
-    the game loop to keep the display current.
+    the game loop to keep the display current. When neither the position nor the
+    selection changed since the last frame, only the board and the rects blitted in
+    this or the last frame are flushed to the display.
 
     Args:
         win (pygame.Surface): The main window surface.
@@ -238,33 +288,35 @@ def showScreen(win, side, board, flags, pos, load, player=None, online=False):
 
     # Basic board and menu elements
     drawBoard(win)
-    win.blit(BACK, (460, 0))  # A background or a "back" button placeholder
+    dirty = [BOARD_RECT, win.blit(BACK, (460, 0))]  # A background or a "back" button placeholder
 
     # For single-player, display whose turn it is
     if not multi:
-        win.blit(CHESS.TURN[int(side == player)], (10, 460))
+        dirty.append(win.blit(CHESS.TURN[int(side == player)], (10, 460)))
 
     # If offline, show undo/save icons
     if not online:
         if load["allow_undo"]:
-            win.blit(CHESS.UNDO, (10, 12))
-        win.blit(CHESS.SAVE, (350, 462))
+            dirty.append(win.blit(CHESS.UNDO, (10, 12)))
+        dirty.append(win.blit(CHESS.SAVE, (350, 462)))
 
-    # Check if the game has ended or if there's a check
+    # Check if the game has ended or if there's a check; both queries are
+    # served from the position cache in core after the first frame
+    checked = isChecked(side, board)
     if isEnd(side, board, flags):
-        if isChecked(side, board):
-            win.blit(CHESS.CHECKMATE, (100, 12))
-            win.blit(CHESS.LOST, (320, 12))
-            win.blit(CHESS.PIECES[side]["k"], (270, 0))
+        if checked:
+            dirty.append(win.blit(CHESS.CHECKMATE, (100, 12)))
+            dirty.append(win.blit(CHESS.LOST, (320, 12)))
+            dirty.append(win.blit(CHESS.PIECES[side]["k"], (270, 0)))
         else:
-            win.blit(CHESS.STALEMATE, (160, 12))
+            dirty.append(win.blit(CHESS.STALEMATE, (160, 12)))
     else:
         if online:
-            win.blit(CHESS.DRAW, (10, 12))
-            win.blit(CHESS.RESIGN, (400, 462))
+            dirty.append(win.blit(CHESS.DRAW, (10, 12)))
+            dirty.append(win.blit(CHESS.RESIGN, (400, 462)))
 
-        if isChecked(side, board):
-            win.blit(CHESS.CHECK, (200, 12))
+        if checked:
+            dirty.append(win.blit(CHESS.CHECK, (200, 12)))
 
         # Highlight the selected square if it belongs to the current player
         if isOccupied(side, board, pos) and side == player:
@@ -278,6 +330,15 @@ def showScreen(win, side, board, flags, pos, load, player=None, online=False):
     if load["show_moves"] and side == player:
         showAvailMoves(win, side, board, pos, flags, flip)
 
-    # For single-player, continuously refresh the display to reflect changes
-    if not multi:
-        pygame.display.update()
\ No newline at end of file
+    # Continuously refresh the display to reflect changes.
+    # A new position or selection may follow another screen, so refresh all of it.
+    # In local multiplayer that full refresh is left to showClock, so the clock
+    # drawn after this call is presented within the same frame.
+    frame = (positionHash(side, board, flags), tuple(pos))
+    if frame == _lastFrame[0]:
+        pygame.display.update(dirty + _lastFrame[1])
+    elif multi:
+        _fullRefresh[0] = True
+    else:
+        pygame.display.update()
+    _lastFrame[:] = frame, dirty
\ No newline at end of file
@@ -0,0 +1,351 @@
+"""
+This file is a part of the Chess application.
+In this file, we define the bitboard primitives that back the board structure
+used by the core chess functions.
+
+Squares are numbered 0..63 with SQ(x, y) = (y - 1) * 8 + (x - 1), so bit 0 is
+the [1, 1] corner and bit 63 is the [8, 8] corner. Every set of squares is kept
+as a plain Python int used as a 64-bit mask.
+"""
+
+import random
+
+# Piece types, in the order their bitboards are stored for each side.
+PTYPES = ("p", "n", "b", "r", "q", "k")
+
+# FILE_A..FILE_H hold every square with x == 1..8.
+FILE_A = 0x0101010101010101
+FILE_B = FILE_A << 1
+FILE_C = FILE_A << 2
+FILE_D = FILE_A << 3
+FILE_E = FILE_A << 4
+FILE_F = FILE_A << 5
+FILE_G = FILE_A << 6
+FILE_H = FILE_A << 7
+
+# RANK_1..RANK_8 hold every square with y == 1..8 (board coordinates, so
+# RANK_1 is black's back row and RANK_8 is white's back row).
+RANK_1 = 0xFF
+RANK_2 = RANK_1 << 8
+RANK_3 = RANK_1 << 16
+RANK_4 = RANK_1 << 24
+RANK_5 = RANK_1 << 32
+RANK_6 = RANK_1 << 40
+RANK_7 = RANK_1 << 48
+RANK_8 = RANK_1 << 56
+
+
+def SQ(x, y):
+    """Pack the board coordinates [x, y] into a square index (0..63)."""
+    return (y - 1) * 8 + (x - 1)
+
+
+# The [x, y] coordinates of every square, indexed by square number.
+SQ_TO_XY = tuple((sq % 8 + 1, sq // 8 + 1) for sq in range(64))
+
+
+def bits(bb):
+    """Yield the square index of every set bit in a bitboard, lowest first.
+
+    Args:
+        bb (int): The bitboard to walk.
+
+    Yields:
+        int: Square index (0..63) of the next set bit.
+    """
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+def _leaperMasks(deltas):
+    """Build a table of attack masks for a piece that jumps by fixed offsets.
+
+    Args:
+        deltas (tuple): The (dx, dy) offsets the piece can jump by.
+
+    Returns:
+        tuple: 64 bitboards, one for each origin square, with every on-board
+               destination set.
+    """
+    masks = []
+    for x, y in SQ_TO_XY:
+        mask = 0
+        for dx, dy in deltas:
+            if 0 < x + dx < 9 and 0 < y + dy < 9:
+                mask |= 1 << SQ(x + dx, y + dy)
+        masks.append(mask)
+    return tuple(masks)
+
+
+# Squares reached by a knight or a king from every square of the board.
+KNIGHT_ATTACKS = _leaperMasks(
+    ((1, 2), (1, -2), (-1, 2), (-1, -2), (2, 1), (2, -1), (-2, 1), (-2, -1))
+)
+KING_ATTACKS = _leaperMasks(
+    ((-1, -1), (0, -1), (1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0))
+)
+# Squares a pawn of each side attacks diagonally; white pawns (side 0) move
+# towards decreasing y and black pawns (side 1) towards increasing y.
+PAWN_ATTACKS = (
+    _leaperMasks(((1, -1), (-1, -1))),
+    _leaperMasks(((1, 1), (-1, 1))),
+)
+
+
+def _targets(masks):
+    """Expand a table of attack masks into tuples of (x, y) destinations.
+
+    Args:
+        masks (tuple): 64 bitboards, one for each origin square.
+
+    Returns:
+        tuple: 64 tuples holding the (x, y) coordinates of every set bit.
+    """
+    return tuple(tuple(SQ_TO_XY[sq] for sq in bits(mask)) for mask in masks)
+
+
+# The same knight and king tables expanded to on-board (x, y) destinations,
+# so move generation does not have to decode the masks on every call.
+KNIGHT_TARGETS = _targets(KNIGHT_ATTACKS)
+KING_TARGETS = _targets(KING_ATTACKS)
+
+# Step directions of the sliding pieces.
+BISHOP_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+ROOK_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _slide(sq, occ, dirs):
+    """Walk every direction from a square up to the board edge or the first blocker.
+
+    Args:
+        sq (int): Origin square (0..63).
+        occ (int): Bitboard of occupied squares.
+        dirs (tuple): The (dx, dy) step directions to walk.
+
+    Returns:
+        int: Bitboard of every square reached, blockers included.
+    """
+    x, y = SQ_TO_XY[sq]
+    attacks = 0
+    for dx, dy in dirs:
+        i, j = x + dx, y + dy
+        while 0 < i < 9 and 0 < j < 9:
+            bit = 1 << SQ(i, j)
+            attacks |= bit
+            if occ & bit:
+                break
+            i, j = i + dx, j + dy
+    return attacks
+
+
+def _relevantMasks(dirs):
+    """Build, for every square, the mask of squares whose occupancy can stop a slider.
+
+    The last square of each ray is left out, since a piece there never hides
+    anything behind it.
+
+    Args:
+        dirs (tuple): The (dx, dy) step directions of the slider.
+
+    Returns:
+        tuple: 64 bitboards, one for each origin square.
+    """
+    masks = []
+    for x, y in SQ_TO_XY:
+        mask = 0
+        for dx, dy in dirs:
+            i, j = x + dx, y + dy
+            while 0 < i + dx < 9 and 0 < j + dy < 9:
+                mask |= 1 << SQ(i, j)
+                i, j = i + dx, j + dy
+        masks.append(mask)
+    return tuple(masks)
+
+
+# The eight ray directions as (dx, dy) steps. The first four increase the
+# square index, so the nearest blocker along them is the lowest set bit; along
+# the last four it is the highest set bit.
+RAY_DIRS = ((1, 0), (0, 1), (1, 1), (-1, 1), (-1, 0), (0, -1), (-1, -1), (1, -1))
+BISHOP_RAYS = (2, 3, 6, 7)
+ROOK_RAYS = (0, 1, 4, 5)
+
+# RAYS[sq][d] holds every square from sq (exclusive) to the edge in direction d.
+RAYS = tuple(tuple(_slide(sq, 0, (step,)) for step in RAY_DIRS) for sq in range(64))
+
+
+def _rayAttacks(sq, occ, dirs):
+    """Compute slider attacks from the precomputed rays, one blocker lookup per ray.
+
+    The nearest blocker on each ray is found with x & -x (lowest bit) or
+    bit_length (highest bit), and everything behind it is cut off with the
+    blocker's own ray in the same direction.
+
+    Args:
+        sq (int): Origin square (0..63).
+        occ (int): Bitboard of occupied squares.
+        dirs (tuple): Indices into RAY_DIRS of the directions to follow.
+
+    Returns:
+        int: Bitboard of every square reached, blockers included.
+    """
+    attacks = 0
+    for d in dirs:
+        ray = RAYS[sq][d]
+        blockers = ray & occ
+        if blockers:
+            if d < 4:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= RAYS[first][d]
+        attacks |= ray
+    return attacks
+
+
+BISHOP_MASKS = _relevantMasks(BISHOP_DIRS)
+ROOK_MASKS = _relevantMasks(ROOK_DIRS)
+
+# Every square on the same diagonals / the same file and rank as a square, up to
+# the edges of the board. A slider off these lines can never reach the square.
+BISHOP_LINES = tuple(_slide(sq, 0, BISHOP_DIRS) for sq in range(64))
+ROOK_LINES = tuple(_slide(sq, 0, ROOK_DIRS) for sq in range(64))
+
+# Slider attack tables, one dict per square indexed by the relevant occupancy.
+# This is the magic-bitboard lookup with a Python dict standing in for the
+# magic multiply-and-shift hash; entries are filled from the rays the first
+# time each occupancy pattern is seen, which keeps import time at zero.
+_bishopTable = tuple({} for _ in range(64))
+_rookTable = tuple({} for _ in range(64))
+
+# With Numba available, compute every entry up front with the compiled kernels
+# instead, so move generation never hits the slow path.
+try:
+    from chess.lib.core_nb import fillTable
+except ImportError:
+    pass
+else:
+    fillTable(_bishopTable, BISHOP_MASKS, BISHOP_DIRS)
+    fillTable(_rookTable, ROOK_MASKS, ROOK_DIRS)
+
+
+def bishopAttacks(sq, occ):
+    """Return the bitboard of squares a bishop on sq attacks, given the occupancy.
+
+    Args:
+        sq (int): Square of the bishop (0..63).
+        occ (int): Bitboard of every occupied square.
+
+    Returns:
+        int: Attacked squares, including the first blocker in each direction.
+    """
+    key = occ & BISHOP_MASKS[sq]
+    attacks = _bishopTable[sq].get(key)
+    if attacks is None:
+        attacks = _bishopTable[sq][key] = _rayAttacks(sq, key, BISHOP_RAYS)
+    return attacks
+
+
+def rookAttacks(sq, occ):
+    """Return the bitboard of squares a rook on sq attacks, given the occupancy.
+
+    Args:
+        sq (int): Square of the rook (0..63).
+        occ (int): Bitboard of every occupied square.
+
+    Returns:
+        int: Attacked squares, including the first blocker in each direction.
+    """
+    key = occ & ROOK_MASKS[sq]
+    attacks = _rookTable[sq].get(key)
+    if attacks is None:
+        attacks = _rookTable[sq][key] = _rayAttacks(sq, key, ROOK_RAYS)
+    return attacks
+
+
+# Zobrist keys: one random 64-bit number for every side, piece type and square.
+# A board's key is the XOR of the keys of all its pieces, so it can be updated
+# incrementally whenever a single piece is placed or lifted. A fixed seed keeps
+# the keys identical across runs.
+_rand = random.Random(0x5EED)
+ZOBRIST = tuple(
+    {ptype: tuple(_rand.getrandbits(64) for _ in range(64)) for ptype in PTYPES}
+    for _ in range(2)
+)
+
+
+class Board:
+    """A chess position stored as one bitboard per side and piece type.
+
+    Indexing a Board with a side (board[side]) still returns the legacy list
+    of (x, y, ptype) pieces, so GUI code that walks the pieces of a side (like
+    [`drawPieces`](Source/chess/lib/gui.py)) keeps working unchanged.
+
+    Attributes:
+        bb (list): Two dicts, one per side, mapping a piece type to its bitboard.
+        occ (list): Two bitboards holding every square occupied by each side.
+        key (int): Zobrist hash of the piece placement, kept up to date by
+                   [`put`](Source/chess/lib/bitboard.py) and
+                   [`remove`](Source/chess/lib/bitboard.py).
+        kings (list): The square of each side's king, or None if it has none.
+        squares (list): 64 entries indexed by square, each a (side, ptype) tuple
+                        or None for an empty square, mirroring the bitboards.
+    """
+
+    __slots__ = ("bb", "occ", "key", "kings", "squares")
+
+    def __init__(self, pieces=((), ())):
+        """Build a board from two lists of (x, y, ptype) pieces."""
+        self.bb = [dict.fromkeys(PTYPES, 0), dict.fromkeys(PTYPES, 0)]
+        self.occ = [0, 0]
+        self.key = 0
+        self.kings = [None, None]
+        self.squares = [None] * 64
+        for side in range(2):
+            for x, y, ptype in pieces[side]:
+                self.put(side, ptype, SQ(x, y))
+
+    def __getitem__(self, side):
+        """Return the legacy [(x, y, ptype), ...] piece list of one side."""
+        return [
+            (*SQ_TO_XY[sq], ptype)
+            for ptype, bb in self.bb[side].items() for sq in bits(bb)
+        ]
+
+    def put(self, side, ptype, sq):
+        """Place a piece of the given side and type on a square."""
+        bit = 1 << sq
+        if not self.bb[side][ptype] & bit:
+            self.bb[side][ptype] |= bit
+            self.occ[side] |= bit
+            self.key ^= ZOBRIST[side][ptype][sq]
+            self.squares[sq] = (side, ptype)
+            if ptype == "k":
+                self.kings[side] = sq
+
+    def remove(self, side, ptype, sq):
+        """Lift a piece of the given side and type off a square."""
+        bit = 1 << sq
+        if self.bb[side][ptype] & bit:
+            self.bb[side][ptype] ^= bit
+            self.occ[side] ^= bit
+            self.key ^= ZOBRIST[side][ptype][sq]
+            self.squares[sq] = None
+            if ptype == "k":
+                self.kings[side] = None
+
+    def copy(self):
+        """Return an independent copy of this board.
+
+        The bitboards are immutable ints, so shallow copies of the two dicts
+        and the lists are enough; __init__ is skipped entirely.
+        """
+        new = Board.__new__(Board)
+        bb0, bb1 = self.bb
+        new.bb = [bb0.copy(), bb1.copy()]
+        new.occ = self.occ[:]
+        new.key = self.key
+        new.kings = self.kings[:]
+        new.squares = self.squares[:]
+        return new
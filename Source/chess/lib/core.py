@@ -2,111 +2,265 @@
 This file is a part of the Chess application.
 In this file, we define the core chess-related functions.
 For a better understanding of the variables used here, refer to docs.txt.
+
+The board is a [`Board`](Source/chess/lib/bitboard.py) holding one bitboard per
+side and piece type, so square lookups are single bit tests on small integers.
 """
 
+from chess.lib.bitboard import (
+    BISHOP_LINES, KING_ATTACKS, KING_TARGETS, KNIGHT_ATTACKS, KNIGHT_TARGETS,
+    PAWN_ATTACKS, ROOK_LINES, SQ, SQ_TO_XY, bishopAttacks, bits, rookAttacks
+)
+
+
+def _square(pos):
+    """Return the square index of [x, y], or None if it lies off the board."""
+    x, y = pos
+    if 0 < x < 9 and 0 < y < 9:
+        return (y - 1) * 8 + x - 1
+    return None
+
+
+# Results of recent legal-move and check queries, keyed by positionHash. Each
+# distinct position gets its own key, so entries never need invalidating; the
+# oldest entries are simply dropped once a cache grows past CACHESIZE.
+CACHESIZE = 4096
+_movecache = {}
+_checkcache = {}
+
+
+def _remember(cache, key, value):
+    """Store a value in one of the bounded caches, evicting the oldest entry if full."""
+    if len(cache) >= CACHESIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+    return value
+
+
+def positionHash(side, board, flags=[None, None]):
+    """Build a hashable key that identifies a position.
+
+    Combines the incrementally maintained Zobrist key of the board with the
+    side to move and the castling/en passant flags.
+
+    Args:
+        side (int): Side to move (0 or 1).
+        board (Board): Board data structure.
+        flags (list, optional): Castling and en passant flags. Defaults to [None, None].
+
+    Returns:
+        tuple: A key usable in a dict, equal for identical positions.
+    """
+    castle = None if flags[0] is None else tuple(flags[0])
+    enP = None if flags[1] is None else tuple(flags[1])
+    return board.key, bool(side), castle, enP
+
 
 def copy(board):
     """Produce a deep copy of the provided board structure.
 
-    This function creates a new list of lists, ensuring changes to the
+    Only the bitboards are duplicated, ensuring changes to the
     copied board do not affect the original.
     """
-    return [[list(j) for j in board[i]] for i in range(2)]
+    return board.copy()
 
 
 def getType(side, board, pos):
     """Retrieve the piece type at the given position for the specified side.
 
+    Reads the square straight from the board's 64-entry piece array.
+
     Args:
         side (int): Indicates the side (0 or 1).
-        board (list): Two lists containing piece data for both sides.
+        board (Board): Bitboards containing piece data for both sides.
         pos (list): [x, y] coordinates on the board.
 
     Returns:
         str or None: The piece type string (e.g., 'k', 'q', 'p') if found,
                      or None if the square is empty.
     """
-    for piece in board[side]:
-        if piece[:2] == pos:
-            return piece[2]
+    sq = _square(pos)
+    if sq is not None:
+        entry = board.squares[sq]
+        if entry is not None and entry[0] == side:
+            return entry[1]
 
 
 def isOccupied(side, board, pos):
     """Check if a given position is occupied by any piece of the specified side.
 
-    Utilizes [`getType`](Source/chess/lib/core.py) to determine if a piece
-    is present at the position.
+    Tests the position's bit in the occupancy bitboard of that side.
 
     Args:
         side (int): Indicates the side to test (0 or 1).
-        board (list): Board data structure.
+        board (Board): Board data structure.
         pos (list): [x, y] coordinates.
 
     Returns:
         bool: True if a piece of the given side occupies the position, False otherwise.
     """
-    return getType(side, board, pos) is not None
+    sq = _square(pos)
+    return sq is not None and bool((board.occ[side] >> sq) & 1)
 
 
 def isEmpty(board, *poslist):
     """Verify that one or more board positions are empty, regardless of side.
 
-    Iterates through each position in poslist, checking if
-    [`isOccupied`](Source/chess/lib/core.py) indicates a piece is present.
+    Builds a mask of every position in poslist and tests it against the
+    occupancy of both sides at once. Positions off the board count as empty.
 
     Args:
-        board (list): Main board structure.
+        board (Board): Main board structure.
         *poslist: One or more [x, y] positions to verify.
 
     Returns:
         bool: True if all specified positions are empty, False otherwise.
     """
+    mask = 0
     for pos in poslist:
-        for side in range(2):
-            if isOccupied(side, board, pos):
-                return False
+        sq = _square(pos)
+        if sq is not None:
+            mask |= 1 << sq
+    return not ((board.occ[0] | board.occ[1]) & mask)
+
+
+def isEmpty1(board, pos):
+    """Fast path of [`isEmpty`](Source/chess/lib/core.py) for a single position.
+
+    Args:
+        board (Board): Main board structure.
+        pos (list): The [x, y] position to verify.
+
+    Returns:
+        bool: True if the position is empty or off the board, False otherwise.
+    """
+    x, y = pos
+    if 0 < x < 9 and 0 < y < 9:
+        return not ((board.occ[0] | board.occ[1]) >> ((y - 1) * 8 + x - 1)) & 1
     return True
 
 
+def isEmpty2(board, pos1, pos2):
+    """Fast path of [`isEmpty`](Source/chess/lib/core.py) for two positions.
+
+    Args:
+        board (Board): Main board structure.
+        pos1 (list): The first [x, y] position to verify.
+        pos2 (list): The second [x, y] position to verify.
+
+    Returns:
+        bool: True if both positions are empty or off the board, False otherwise.
+    """
+    occ = board.occ[0] | board.occ[1]
+    for x, y in (pos1, pos2):
+        if 0 < x < 9 and 0 < y < 9 and (occ >> ((y - 1) * 8 + x - 1)) & 1:
+            return False
+    return True
+
+
+def squareAttacked(board, sq, side):
+    """Check whether any piece of the given side attacks a square.
+
+    Looks up the precomputed pawn, knight and king attack masks and the slider
+    attack tables for the square, and tests them against the matching pieces
+    of the attacking side. The slider tables are only consulted when a bishop,
+    rook or queen actually stands on one of the square's diagonals or lines.
+
+    Args:
+        board (Board): Current board data.
+        sq (int): The square index (0..63) to test.
+        side (int): The attacking side (0 or 1).
+
+    Returns:
+        bool: True if the square is attacked, otherwise False.
+    """
+    bb = board.bb[side]
+    if (
+        PAWN_ATTACKS[not side][sq] & bb["p"]
+        or KNIGHT_ATTACKS[sq] & bb["n"]
+        or KING_ATTACKS[sq] & bb["k"]
+    ):
+        return True
+
+    diagonal = BISHOP_LINES[sq] & (bb["b"] | bb["q"])
+    straight = ROOK_LINES[sq] & (bb["r"] | bb["q"])
+    if not (diagonal or straight):
+        return False
+
+    occ = board.occ[0] | board.occ[1]
+    return bool(
+        diagonal and bishopAttacks(sq, occ) & diagonal
+        or straight and rookAttacks(sq, occ) & straight
+    )
+
+
 def isChecked(side, board):
     """Determine if the current side's king is in check.
 
-    The function locates the king for the given side, then scans
-    the opposing side's possible raw moves to see if the king's position is threatened.
+    The function reads the king's square from the board's king index, then asks
+    [`squareAttacked`](Source/chess/lib/core.py) whether the opposing side attacks it.
+    Results are cached per board key and side.
 
     Args:
         side (int): Side whose king status is being evaluated.
-        board (list): Current board data.
+        board (Board): Current board data.
 
     Returns:
         bool: True if the king is in check, otherwise False.
     """
-    for piece in board[side]:
-        if piece[2] == "k":
-            for opp_piece in board[not side]:
-                # If the king's position is within the opponent's raw moves, it's in check.
-                if piece[:2] in rawMoves(not side, board, opp_piece):
-                    return True
-            return False
+    key = (board.key, bool(side))
+    if key in _checkcache:
+        return _checkcache[key]
+
+    king = board.kings[side]
+    checked = king is not None and squareAttacked(board, king, not side)
+    return _remember(_checkcache, key, checked)
+
+
+def _legalSquares(side, board, flags):
+    """Return every legal move of a position as (origin, destination) square indices.
+
+    Combines [`availableMoves`](Source/chess/lib/core.py) for each piece. The moves
+    of a position are computed once and then served from a cache keyed by
+    [`positionHash`](Source/chess/lib/core.py).
+
+    Args:
+        side (int): Side to evaluate (0 or 1).
+        board (Board): Board data structure.
+        flags (list): Castling and en passant flags.
+
+    Returns:
+        tuple: Pairs of square indices (0..63), one for each legal move.
+    """
+    key = positionHash(side, board, flags)
+    moves = _movecache.get(key)
+    if moves is None:
+        moves = []
+        for ptype, bb in board.bb[side].items():
+            for sq in bits(bb):
+                x, y = SQ_TO_XY[sq]
+                for pos in availableMoves(side, board, (x, y, ptype), flags):
+                    moves.append((sq, SQ(*pos)))
+        moves = _remember(_movecache, key, tuple(moves))
+    return moves
 
 
 def legalMoves(side, board, flags):
     """Generate all possible legal moves for the specified side.
 
-    Combines [`availableMoves`](Source/chess/lib/core.py) for each piece
-    to produce a generator of valid [origin, destination] pairs.
+    Unpacks the cached square pairs of [`_legalSquares`](Source/chess/lib/core.py)
+    into a generator of valid [origin, destination] pairs.
 
     Args:
         side (int): Side to evaluate (0 or 1).
-        board (list): Board data structure.
+        board (Board): Board data structure.
         flags (list): Castling and en passant flags.
 
     Yields:
         list: A pair of positions [[x1, y1], [x2, y2]] indicating a possible move.
     """
-    for piece in board[side]:
-        for pos in availableMoves(side, board, piece, flags):
-            yield [piece[:2], pos]
+    for fro, to in _legalSquares(side, board, flags):
+        yield [list(SQ_TO_XY[fro]), list(SQ_TO_XY[to])]
 
 
 def isEnd(side, board, flags):
@@ -117,15 +271,13 @@ def isEnd(side, board, flags):
 
     Args:
         side (int): Side to evaluate (0 or 1).
-        board (list): Board data structure.
+        board (Board): Board data structure.
         flags (list): Castling and en passant flags.
 
     Returns:
         bool: True if the side has no legal moves, False otherwise.
     """
-    for _ in legalMoves(side, board, flags):
-        return False
-    return True
+    return not _legalSquares(side, board, flags)
 
 
 def move(side, board, fro, to, promote="p"):
@@ -136,76 +288,123 @@ def move(side, board, fro, to, promote="p"):
 
     Args:
         side (int): The side making the move (0 or 1).
-        board (list): Board data structure (directly modified here).
+        board (Board): Board data structure (directly modified here).
+        fro (list[int]): Origin [x, y].
+        to (list[int]): Destination [x, y].
+        promote (str, optional): Promotion piece type, defaults to 'p'.
+
+    Returns:
+        Board: An updated reference to the modified board.
+    """
+    _apply(side, board, fro, to, promote)
+    return board
+
+
+def _apply(side, board, fro, to, promote="p"):
+    """Perform a move in place, recording every change so it can be reverted.
+
+    Makes the same changes as [`move`](Source/chess/lib/core.py); pass the
+    returned record to [`_unapply`](Source/chess/lib/core.py) to restore the
+    board exactly as it was.
+
+    Args:
+        side (int): The side making the move (0 or 1).
+        board (Board): Board data structure (directly modified here).
         fro (list[int]): Origin [x, y].
         to (list[int]): Destination [x, y].
         promote (str, optional): Promotion piece type, defaults to 'p'.
 
     Returns:
-        list: An updated reference to the modified board.
+        list: Undo record of (placed, side, ptype, square) changes, in the order made.
     """
     UP = 8 if side else 1
     DOWN = 1 if side else 8
+    undo = []
     # en passant is allowed if a diagonal move leads to an otherwise empty square
-    ALLOWENP = fro[1] == 4 + side and to[0] != fro[0] and isEmpty(board, to)
+    ALLOWENP = fro[1] == 4 + side and to[0] != fro[0] and isEmpty1(board, to)
+    tosq = SQ(*to)
     # Remove captured piece from the opposite side if it occupies the 'to' square
-    for piece in board[not side]:
-        if piece[:2] == to:
-            board[not side].remove(piece)
-            break
+    captured = getType(not side, board, to)
+    if captured is not None:
+        board.remove(not side, captured, tosq)
+        undo.append((False, not side, captured, tosq))
 
     # Move the piece for the acting side
-    for piece in board[side]:
-        if piece[:2] == fro:
-            piece[:2] = to
-            # Handle castling by moving the rook if needed
-            if piece[2] == "k":
-                if fro[0] - to[0] == 2:
-                    move(side, board, [1, DOWN], [4, DOWN])
-                elif to[0] - fro[0] == 2:
-                    move(side, board, [8, DOWN], [6, DOWN])
-
-            # Handle pawn promotion or en passant capture
-            if piece[2] == "p":
-                if to[1] == UP:
-                    board[side].remove(piece)
-                    board[side].append([to[0], UP, promote])
-                if ALLOWENP:
-                    board[not side].remove([to[0], fro[1], "p"])
-            break
+    ptype = getType(side, board, fro)
+    if ptype is not None:
+        board.remove(side, ptype, SQ(*fro))
+        board.put(side, ptype, tosq)
+        undo.append((False, side, ptype, SQ(*fro)))
+        undo.append((True, side, ptype, tosq))
+        # Handle castling by moving the rook if needed
+        if ptype == "k":
+            if fro[0] - to[0] == 2:
+                undo += _apply(side, board, [1, DOWN], [4, DOWN])
+            elif to[0] - fro[0] == 2:
+                undo += _apply(side, board, [8, DOWN], [6, DOWN])
+
+        # Handle pawn promotion or en passant capture
+        if ptype == "p":
+            if to[1] == UP:
+                board.remove(side, "p", tosq)
+                board.put(side, promote, tosq)
+                undo.append((False, side, "p", tosq))
+                undo.append((True, side, promote, tosq))
+            if ALLOWENP and getType(not side, board, [to[0], fro[1]]) == "p":
+                board.remove(not side, "p", SQ(to[0], fro[1]))
+                undo.append((False, not side, "p", SQ(to[0], fro[1])))
+
+    return undo
+
+
+def _unapply(board, undo):
+    """Revert the changes made by [`_apply`](Source/chess/lib/core.py), newest first.
 
-    return board
+    Args:
+        board (Board): The board the move was applied to (directly modified here).
+        undo (list): The undo record returned by _apply.
+    """
+    for placed, side, ptype, sq in reversed(undo):
+        if placed:
+            board.remove(side, ptype, sq)
+        else:
+            board.put(side, ptype, sq)
 
 
 def moveTest(side, board, fro, to):
     """Test if a hypothetical move would leave the acting side's king in check.
 
-    Clones the board using [`copy`](Source/chess/lib/core.py) before moving pieces,
-    so the actual game state remains unaffected.
+    Plays the move in place with [`_apply`](Source/chess/lib/core.py) and takes
+    it back with [`_unapply`](Source/chess/lib/core.py), so the actual game state
+    remains unaffected without cloning the board.
 
     Args:
         side (int): Side making the hypothetical move (0 or 1).
-        board (list): Board data structure.
+        board (Board): Board data structure.
         fro (list[int]): Origin square [x, y].
         to (list[int]): Destination square [x, y].
 
     Returns:
         bool: True if the king is NOT in check after the move, False if still in check.
     """
-    return not isChecked(side, move(side, copy(board), fro, to))
+    undo = _apply(side, board, fro, to)
+    checked = isChecked(side, board)
+    _unapply(board, undo)
+    return not checked
 
 
 def isValidMove(side, board, flags, fro, to):
     """Check whether a move is valid within board boundaries and piece constraints.
 
-    Ensures the destination is within standard board limits and not occupied
-    by the same side. Also checks if [`rawMoves`](Source/chess/lib/core.py)
-    confirm the move and [`moveTest`](Source/chess/lib/core.py) verifies
-    that the king is not placed in check.
+    Ensures both squares are within standard board limits, then looks the pair of
+    square indices up among the legal moves of the position from
+    [`_legalSquares`](Source/chess/lib/core.py), which already account for
+    [`rawMoves`](Source/chess/lib/core.py), the same-side occupancy test and
+    [`moveTest`](Source/chess/lib/core.py).
 
     Args:
         side (int): Side attempting the move (0 or 1).
-        board (list): Main board data.
+        board (Board): Main board data.
         flags (list): Castling/en passant flags.
         fro (list[int]): Origin [x, y].
         to (list[int]): Destination [x, y].
@@ -213,10 +412,10 @@ def isValidMove(side, board, flags, fro, to):
     Returns:
         bool: True if the move is valid, False otherwise.
     """
-    if 0 < to[0] < 9 and 0 < to[1] < 9 and not isOccupied(side, board, to):
-        piece = fro + [getType(side, board, fro)]
-        if to in rawMoves(side, board, piece, flags):
-            return moveTest(side, board, fro, to)
+    frosq, tosq = _square(fro), _square(to)
+    if frosq is None or tosq is None:
+        return False
+    return (frosq, tosq) in _legalSquares(side, board, flags)
 
 
 def makeMove(side, board, fro, to, flags, promote="q"):
@@ -228,7 +427,7 @@ def makeMove(side, board, fro, to, flags, promote="q"):
 
     Args:
         side (int): The side making the move.
-        board (list): Board data structure to modify.
+        board (Board): Board data structure to modify.
         fro (list[int]): Origin [x, y].
         to (list[int]): Destination [x, y].
         flags (list): Castling and en passant flags.
@@ -237,7 +436,7 @@ def makeMove(side, board, fro, to, flags, promote="q"):
     Returns:
         tuple: (next_side, resulting_board, updated_flags)
                next_side (bool): The new side (True or False).
-               resulting_board (list): The updated board.
+               resulting_board (Board): The updated board.
                updated_flags (list): The new flags.
     """
     newboard = move(side, copy(board), fro, to, promote)
@@ -245,15 +444,24 @@ def makeMove(side, board, fro, to, flags, promote="q"):
     return not side, newboard, newflags
 
 
+# The castling rights lost when a piece moves from, or is captured on, each
+# home square of a king or rook (indices into the castling flags).
+CASTLE_SQUARES = {
+    (5, 8): (0, 1), (1, 8): (0,), (8, 8): (1,),
+    (5, 1): (2, 3), (1, 1): (2,), (8, 1): (3,),
+}
+
+
 def updateFlags(side, board, fro, to, flags):
     """Adjust castling and en passant flags after a completed move.
 
-    Checks if rooks or kings have moved to disable castling rights, and sets
-    or removes en passant coordinates based on the last move of a pawn.
+    Disables castling rights whose king or rook has just left (or been captured on)
+    its home square, and sets or removes en passant coordinates based on the last
+    move of a pawn.
 
     Args:
         side (int): The side that just moved.
-        board (list): Current board data (with move already applied).
+        board (Board): Current board data (with move already applied).
         fro (list[int]): The origin square [x, y].
         to (list[int]): The destination square [x, y].
         flags (list): Existing flags ([castling_info], en_passant_pos).
@@ -262,15 +470,10 @@ def updateFlags(side, board, fro, to, flags):
         list: Updated flags reflecting castling or en passant changes.
     """
     castle = list(flags[0])
-    # Disable castling if the king or its respective rook has moved
-    if [5, 8, "k"] not in board[0] or [1, 8, "r"] not in board[0]:
-        castle[0] = False
-    if [5, 8, "k"] not in board[0] or [8, 8, "r"] not in board[0]:
-        castle[1] = False
-    if [5, 1, "k"] not in board[1] or [1, 1, "r"] not in board[1]:
-        castle[2] = False
-    if [5, 1, "k"] not in board[1] or [8, 1, "r"] not in board[1]:
-        castle[3] = False
+    # Disable castling if the king or its respective rook has moved or been captured
+    for pos in (fro, to):
+        for i in CASTLE_SQUARES.get((pos[0], pos[1]), ()):
+            castle[i] = False
 
     enP = None
     # Set en passant if a pawn moved forward two squares
@@ -292,126 +495,132 @@ def availableMoves(side, board, piece, flags):
 
     Args:
         side (int): The side of the piece.
-        board (list): Board data structure.
-        piece (list): Piece data in form [x, y, 'ptype'].
+        board (Board): Board data structure.
+        piece (tuple): Piece data in form (x, y, 'ptype').
         flags (list): Castling and en passant flags.
 
     Yields:
         list[int]: Valid destination coordinates [dest_x, dest_y].
     """
+    fro = (piece[0], piece[1])
     for dest in rawMoves(side, board, piece, flags):
         if 0 < dest[0] < 9 and 0 < dest[1] < 9 and not isOccupied(side, board, dest):
-            if moveTest(side, board, piece[:2], dest):
+            if moveTest(side, board, fro, dest):
                 yield dest
 
 
-def rawMoves(side, board, piece, flags=[None, None]):
-    """Compute all possible moves for a piece, ignoring legality checks like self-check.
+# Home squares of the white and black kings.
+KING_HOMES = (SQ(5, 8), SQ(5, 1))
 
-    This includes castling moves (if flags are given) and en passant captures. 
-    Note that many moves returned may still be illegal if they place the king in check.
 
-    Args:
-        side (int): The side of the piece (0 or 1).
-        board (list): Board representation where board[0] and board[1] hold each side’s pieces.
-        piece (list): A piece in the format [x, y, 'ptype'].
-        flags (list, optional): [castling_info, en_passant_pos]. Defaults to [None, None].
+def _noMoves(side, board, x, y, flags):
+    """Yield nothing; used for squares without a piece of the given side."""
+    return
+    yield
 
-    Yields:
-        list[int]: Candidate move [destination_x, destination_y], which may or may not be ultimately valid.
-    """
-    x, y, ptype = piece
-    # Pawn handling (forward moves, captures, two-step moves, en passant)
-    if ptype == "p":
-        if not side:
-            # White pawns move upward (decreasing y)
-            if y == 7 and isEmpty(board, [x, 6], [x, 5]):
-                yield [x, 5]
-            if isEmpty(board, [x, y - 1]):
-                yield [x, y - 1]
-            for diag in ([x + 1, y - 1], [x - 1, y - 1]):
-                if isOccupied(1, board, diag) or flags[1] == diag:
-                    yield diag
-        else:
-            # Black pawns move downward (increasing y)
-            if y == 2 and isEmpty(board, [x, 3], [x, 4]):
-                yield [x, 4]
-            if isEmpty(board, [x, y + 1]):
-                yield [x, y + 1]
-            for diag in ([x + 1, y + 1], [x - 1, y + 1]):
-                if isOccupied(0, board, diag) or flags[1] == diag:
-                    yield diag
-
-    elif ptype == "n":
-        # Knight's L-shaped moves
-        yield from (
-            [x + 1, y + 2], [x + 1, y - 2], [x - 1, y + 2], [x - 1, y - 2],
-            [x + 2, y + 1], [x + 2, y - 1], [x - 2, y + 1], [x - 2, y - 1]
-        )
-
-    elif ptype == "b":
-        # Diagonal movement in four directions
-        for i in range(1, 8):
-            yield [x + i, y + i]
-            if not isEmpty(board, [x + i, y + i]):
-                break
-        for i in range(1, 8):
-            yield [x + i, y - i]
-            if not isEmpty(board, [x + i, y - i]):
-                break
-        for i in range(1, 8):
-            yield [x - i, y + i]
-            if not isEmpty(board, [x - i, y + i]):
-                break
-        for i in range(1, 8):
-            yield [x - i, y - i]
-            if not isEmpty(board, [x - i, y - i]):
-                break
-
-    elif ptype == "r":
-        # Straight-line rook moves
-        for i in range(1, 8):
-            yield [x + i, y]
-            if not isEmpty(board, [x + i, y]):
-                break
-        for i in range(1, 8):
-            yield [x - i, y]
-            if not isEmpty(board, [x - i, y]):
-                break
-        for i in range(1, 8):
-            yield [x, y + i]
-            if not isEmpty(board, [x, y + i]):
-                break
-        for i in range(1, 8):
-            yield [x, y - i]
-            if not isEmpty(board, [x, y - i]):
-                break
-
-    elif ptype == "q":
-        # Queen moves are a combination of bishop + rook moves
-        yield from rawMoves(side, board, [x, y, "b"], flags)
-        yield from rawMoves(side, board, [x, y, "r"], flags)
-
-    elif ptype == "k":
-        # King moves plus castling (if not in check and squares are empty)
-        if flags[0] is not None and not isChecked(side, board):
+
+def _pawnMoves(side, board, x, y, flags):
+    """Yield pawn pushes, two-step moves, captures and en passant captures."""
+    if not side:
+        # White pawns move upward (decreasing y)
+        if y == 7 and isEmpty2(board, [x, 6], [x, 5]):
+            yield [x, 5]
+        if isEmpty1(board, [x, y - 1]):
+            yield [x, y - 1]
+    else:
+        # Black pawns move downward (increasing y)
+        if y == 2 and isEmpty2(board, [x, 3], [x, 4]):
+            yield [x, 4]
+        if isEmpty1(board, [x, y + 1]):
+            yield [x, y + 1]
+
+    # Diagonal captures, including the en passant square, from the attack table
+    targets = board.occ[not side]
+    if flags[1] is not None:
+        targets |= 1 << SQ(*flags[1])
+    for sq in bits(PAWN_ATTACKS[side][SQ(x, y)] & targets):
+        yield list(SQ_TO_XY[sq])
+
+
+def _knightMoves(side, board, x, y, flags):
+    """Yield the knight's L-shaped moves from the precomputed destination table."""
+    for pos in KNIGHT_TARGETS[SQ(x, y)]:
+        yield list(pos)
+
+
+def _bishopMoves(side, board, x, y, flags):
+    """Yield diagonal moves in four directions, up to and including a blocker."""
+    for sq in bits(bishopAttacks(SQ(x, y), board.occ[0] | board.occ[1])):
+        yield list(SQ_TO_XY[sq])
+
+
+def _rookMoves(side, board, x, y, flags):
+    """Yield straight-line moves in four directions, up to and including a blocker."""
+    for sq in bits(rookAttacks(SQ(x, y), board.occ[0] | board.occ[1])):
+        yield list(SQ_TO_XY[sq])
+
+
+def _queenMoves(side, board, x, y, flags):
+    """Yield queen moves, a combination of bishop and rook moves."""
+    sq, occ = SQ(x, y), board.occ[0] | board.occ[1]
+    for sq in bits(bishopAttacks(sq, occ) | rookAttacks(sq, occ)):
+        yield list(SQ_TO_XY[sq])
+
+
+def _kingMoves(side, board, x, y, flags):
+    """Yield single-square king moves plus castling (if not in check and squares are empty)."""
+    sq = SQ(x, y)
+    # Only the king's own side may castle, from its home square.
+    if flags[0] is not None and not isChecked(side, board):
+        if not side and sq == KING_HOMES[0]:
             # White castling
             if flags[0][0] and isEmpty(board, [2, 8], [3, 8], [4, 8]):
                 if moveTest(0, board, [5, 8], [4, 8]):
                     yield [3, 8]
-            if flags[0][1] and isEmpty(board, [6, 8], [7, 8]):
+            if flags[0][1] and isEmpty2(board, [6, 8], [7, 8]):
                 if moveTest(0, board, [5, 8], [6, 8]):
                     yield [7, 8]
+        elif side and sq == KING_HOMES[1]:
             # Black castling
             if flags[0][2] and isEmpty(board, [2, 1], [3, 1], [4, 1]):
                 if moveTest(1, board, [5, 1], [4, 1]):
                     yield [3, 1]
-            if flags[0][3] and isEmpty(board, [6, 1], [7, 1]):
+            if flags[0][3] and isEmpty2(board, [6, 1], [7, 1]):
                 if moveTest(1, board, [5, 1], [6, 1]):
                     yield [7, 1]
 
-        # Single-square king moves in all directions
-        yield from (
-            [x - 1, y - 1], [x, y - 1], [x + 1, y - 1], [x - 1, y],
-            [x - 1, y + 1], [x, y + 1], [x + 1, y + 1], [x + 1, y]
-        )
\ No newline at end of file
+    # Single-square king moves in all directions, from the precomputed table
+    for pos in KING_TARGETS[sq]:
+        yield list(pos)
+
+
+# Move generator of each piece type, used by rawMoves instead of an if/elif chain.
+MOVERS = {
+    "p": _pawnMoves,
+    "n": _knightMoves,
+    "b": _bishopMoves,
+    "r": _rookMoves,
+    "q": _queenMoves,
+    "k": _kingMoves,
+}
+
+
+def rawMoves(side, board, piece, flags=[None, None]):
+    """Compute all possible moves for a piece, ignoring legality checks like self-check.
+
+    Dispatches on the piece type through [`MOVERS`](Source/chess/lib/core.py)
+    to one small generator per piece type.
+    This includes castling moves (if flags are given) and en passant captures. 
+    Note that many moves returned may still be illegal if they place the king in check.
+
+    Args:
+        side (int): The side of the piece (0 or 1).
+        board (Board): Board representation holding the bitboards of each side’s pieces.
+        piece (tuple): A piece in the format (x, y, 'ptype').
+        flags (list, optional): [castling_info, en_passant_pos]. Defaults to [None, None].
+
+    Returns:
+        generator: Yields candidate moves [destination_x, destination_y], which may or may not be ultimately valid.
+    """
+    x, y, ptype = piece
+    return MOVERS.get(ptype, _noMoves)(side, board, x, y, flags)
@@ -0,0 +1,87 @@
+"""
+This file is a part of the Chess application.
+In this file, we define Numba-compiled kernels for the bitboard tables used by
+the core chess functions.
+
+Numba is optional: importing this module raises ImportError when Numba (or
+NumPy) is not installed, and [bitboard.py](Source/chess/lib/bitboard.py) then
+falls back to filling its tables lazily in pure Python.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, boundscheck=False)
+def _slide(sq, occ, dirs):
+    """Compiled twin of the pure Python ray walk in bitboard.py.
+
+    Args:
+        sq (int): Origin square (0..63).
+        occ (int): Bitboard of occupied squares on the relevant mask.
+        dirs (numpy.ndarray): An (n, 2) array of (dx, dy) step directions.
+
+    Returns:
+        numpy.uint64: Bitboard of every square reached, blockers included.
+    """
+    x = sq % 8 + 1
+    y = sq // 8 + 1
+    attacks = np.uint64(0)
+    for k in range(dirs.shape[0]):
+        dx = dirs[k, 0]
+        dy = dirs[k, 1]
+        i = x + dx
+        j = y + dy
+        while 0 < i < 9 and 0 < j < 9:
+            bit = np.uint64(1) << np.uint64((j - 1) * 8 + i - 1)
+            attacks |= bit
+            if np.uint64(occ) & bit:
+                break
+            i += dx
+            j += dy
+    return attacks
+
+
+@njit(cache=True, boundscheck=False)
+def _attackTable(sq, mask, dirs):
+    """Compute the slider attacks of a square for every subset of its relevant mask.
+
+    Subsets are enumerated with the carry-rippler trick, sub = (sub - mask) & mask.
+    The relevant masks never include the corner square 63, so they fit in int64.
+
+    Args:
+        sq (int): Origin square (0..63).
+        mask (int): Relevant-occupancy mask of the square.
+        dirs (numpy.ndarray): An (n, 2) array of (dx, dy) step directions.
+
+    Returns:
+        tuple: (keys, attacks) arrays, one entry per subset of the mask.
+    """
+    count = 0
+    rest = mask
+    while rest:
+        rest &= rest - 1
+        count += 1
+
+    keys = np.empty(1 << count, np.int64)
+    attacks = np.empty(1 << count, np.uint64)
+    sub = 0
+    for k in range(1 << count):
+        keys[k] = sub
+        attacks[k] = _slide(sq, sub, dirs)
+        sub = (sub - mask) & mask
+    return keys, attacks
+
+
+def fillTable(table, masks, dirs):
+    """Fill a per-square slider attack table for every possible occupancy.
+
+    Args:
+        table (tuple): 64 dicts mapping a masked occupancy to an attack bitboard.
+        masks (tuple): The relevant-occupancy mask of every square.
+        dirs (tuple): The (dx, dy) step directions of the slider.
+    """
+    dirs = np.array(dirs, dtype=np.int64)
+    for sq in range(64):
+        keys, attacks = _attackTable(sq, masks[sq], dirs)
+        table[sq].update(zip(keys.tolist(), attacks.tolist()))
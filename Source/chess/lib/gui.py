@@ -8,20 +8,111 @@ refer to the [tools.loader.py](tools/loader.py) and the documentation in docs.tx
 """
 
 import pygame
-from tools.loader import CHESS, BACK, putNum, putLargeNum
+from tools.loader import CHESS, BACK, BLNUM, putNum, putLargeNum
 from tools import sound
+from chess.lib.bitboard import SQ_TO_XY
 
+# The screen areas of the clock and of the time over dialog.
+CLOCK_RECT = pygame.Rect(50, 450, 280, 50)
+TIMEUP_RECT = pygame.Rect(100, 190, 300, 120)
 
-def convertPieces(win):
-    """Convert piece images to alpha-optimized surfaces for faster rendering.
+# The screen areas of the promotion menu and of the prompt dialog.
+CHOICE_RECT = pygame.Rect(0, 0, 500, 50)
+PROMPT_RECT = pygame.Rect(110, 160, 280, 130)
 
-    Iterates through each piece image in [`CHESS.PIECES`](tools/loader.py)
-    and applies convert_alpha for better performance when drawing.
+# The Yes and No buttons of prompt, with the value each one returns.
+PROMPT_BUTTONS = (
+    (pygame.Rect(140, 240, 60, 28), True),
+    (pygame.Rect(300, 240, 50, 28), False),
+)
+
+# The screen position of every square (0..63), as seen unflipped and flipped.
+SQUARE_POS = tuple((x * 50, y * 50) for x, y in SQ_TO_XY)
+FLIPPED_POS = tuple((450 - x * 50, 450 - y * 50) for x, y in SQ_TO_XY)
+
+# The pieces of the intro animation in blit order, as (side, ptype) pairs:
+# the pawns of both sides file by file, then the other pieces the same way.
+INTRO_PIECES = tuple(
+    (side, ptype) for ptype in "pppppppprnbqkbnr" for side in range(2)
+)
+
+
+def _introFrame(i):
+    """Return the positions of the INTRO_PIECES in frame i of the intro animation.
+
+    Pawns move 1.25 px per frame and the other pieces 1.75 px per frame away
+    from the center of the board, while spreading out sideways.
+
+    Args:
+        i (int): The frame number, from 0 to 100.
+
+    Returns:
+        tuple: One (x, y) position per entry of INTRO_PIECES.
     """
-    for i in range(2):
-        for key, val in CHESS.PIECES[i].items():
-            # Minimizes rendering overhead by using hardware-friendly pixel formats.
-            CHESS.PIECES[i][key] = val.convert_alpha(win)
+    ret = []
+    for j, speed in enumerate([1.25] * 8 + [1.75] * 8):
+        x = 0.5 * i * (j % 8 + 1)
+        ret.append((x, 225 + speed * i))
+        ret.append((x, 225 - speed * i))
+    return tuple(ret)
+
+
+# The intro animation only depends on the frame number, so its whole schedule
+# is computed once at import time.
+INTRO_FRAMES = tuple(_introFrame(i) for i in range(101))
+
+# The static board image, rendered once by drawBoard and reused on every frame.
+_board_cache = None
+
+# The static parts of the dialogs, keyed by dialog and variant, rendered on first use.
+_dialog_cache = {}
+
+# The timer values last drawn by putClock, and a copy of the clock strip drawn for them.
+_clock_cache = [None, None]
+
+# Two-digit clock numbers already rendered by putClock, keyed by their value.
+_digit_cache = {}
+
+
+def _blitMany(win, seq):
+    """Blit a sequence of (surface, position) pairs in a single call.
+
+    Uses pygame-ce's `Surface.fblits` where available, and falls back to
+    `Surface.blits` without building the list of returned rects otherwise.
+
+    Args:
+        win (pygame.Surface): The surface to draw onto.
+        seq (list): A list of (pygame.Surface, (x, y)) pairs.
+    """
+    if hasattr(win, "fblits"):
+        win.fblits(seq)
+    else:
+        win.blits(seq, False)
+
+
+def _dialogLayer(key, rect, paint, alpha=False):
+    """Return the static layer of a dialog, painting it only the first time.
+
+    Args:
+        key (tuple): Identifies the dialog and its variant in the cache.
+        rect (pygame.Rect): The screen area the layer covers.
+        paint (callable): Called with the new layer and the (x, y) offset to subtract
+                          from screen coordinates, to draw the dialog onto it.
+        alpha (bool, optional): If True, the layer is transparent where nothing is
+                                painted. Defaults to False.
+
+    Returns:
+        pygame.Surface: The cached layer, ready to be blitted at rect.
+    """
+    layer = _dialog_cache.get(key)
+    if layer is None:
+        if alpha:
+            layer = pygame.Surface(rect.size, pygame.SRCALPHA).convert_alpha()
+        else:
+            layer = pygame.Surface(rect.size).convert()
+        paint(layer, rect.topleft)
+        _dialog_cache[key] = layer
+    return layer
 
 
 def getChoice(win, side):
@@ -37,25 +128,22 @@ def getChoice(win, side):
     Returns:
         str: A single-character code representing the chosen piece (e.g., "q", "b", "r", "n").
     """
-    win.blit(CHESS.CHOOSE, (130, 10))
-    win.blit(CHESS.PIECES[side]["q"], (250, 0))
-    win.blit(CHESS.PIECES[side]["b"], (300, 0))
-    win.blit(CHESS.PIECES[side]["r"], (350, 0))
-    win.blit(CHESS.PIECES[side]["n"], (400, 0))
-    pygame.display.update((0, 0, 500, 50))
+    def paint(layer, offset):
+        layer.blit(CHESS.CHOOSE, (130, 10))
+        for cnt, ptype in enumerate("qbrn"):
+            layer.blit(CHESS.PIECES[side][ptype], (250 + cnt * 50, 0))
+
+    win.blit(_dialogLayer(("choice", side), CHOICE_RECT, paint, True), CHOICE_RECT)
+    pygame.display.update(CHOICE_RECT)
 
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if 0 < event.pos[1] < 50:
-                    if 250 < event.pos[0] < 300:
-                        return "q"
-                    elif 300 < event.pos[0] < 350:
-                        return "b"
-                    elif 350 < event.pos[0] < 400:
-                        return "r"
-                    elif 400 < event.pos[0] < 450:
-                        return "n"
+        # Only clicks matter here, so let SDL filter the queue for them.
+        for event in pygame.event.get(pygame.MOUSEBUTTONDOWN):
+            x, y = event.pos
+            # The pieces sit in 50 px wide slots, so the slot index picks the piece.
+            if 250 < x < 450 and 0 < y < 50:
+                return "qbrn"[(x - 250) // 50]
+        pygame.time.wait(10)  # Wait idly instead of spinning a CPU core.
 
 
 def showTimeOver(win, side):
@@ -67,22 +155,45 @@ def showTimeOver(win, side):
         win (pygame.Surface): The window surface on which the message is rendered.
         side (int): Indicates which side has run out of time (0 or 1).
     """
-    pygame.draw.rect(win, (0, 0, 0), (100, 190, 300, 120))
-    pygame.draw.rect(win, (255, 255, 255), (100, 190, 300, 120), 4)
+    def paint(layer, offset):
+        ox, oy = offset
+        pygame.draw.rect(layer, (0, 0, 0), TIMEUP_RECT.move(-ox, -oy))
+        pygame.draw.rect(layer, (255, 255, 255), TIMEUP_RECT.move(-ox, -oy), 4)
 
-    win.blit(CHESS.TIMEUP[0], (220, 200))
-    win.blit(CHESS.TIMEUP[1], (105, 220))
-    win.blit(CHESS.TIMEUP[2], (115, 240))
+        layer.blit(CHESS.TIMEUP[0], (220 - ox, 200 - oy))
+        layer.blit(CHESS.TIMEUP[1], (105 - ox, 220 - oy))
+        layer.blit(CHESS.TIMEUP[2], (115 - ox, 240 - oy))
 
-    win.blit(CHESS.OK, (230, 270))
-    pygame.draw.rect(win, (255, 255, 255), (225, 270, 50, 30), 2)
+        layer.blit(CHESS.OK, (230 - ox, 270 - oy))
+        pygame.draw.rect(layer, (255, 255, 255), (225 - ox, 270 - oy, 50, 30), 2)
 
-    pygame.display.update()
+    win.blit(_dialogLayer(("timeup",), TIMEUP_RECT, paint), TIMEUP_RECT)
+    pygame.display.update(TIMEUP_RECT)
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if 225 < event.pos[0] < 275 and 270 < event.pos[1] < 300:
-                    return
+        for event in pygame.event.get(pygame.MOUSEBUTTONDOWN):
+            if 225 < event.pos[0] < 275 and 270 < event.pos[1] < 300:
+                return
+        pygame.time.wait(10)
+
+
+def _twoDigits(num):
+    """Return a surface showing a number as two black digits, rendering it only once.
+
+    Args:
+        num (int): The number to show, between 0 and 99.
+
+    Returns:
+        pygame.Surface: A transparent surface with the digits drawn by
+                        [`putLargeNum`](tools/loader.py).
+    """
+    surf = _digit_cache.get(num)
+    if surf is None:
+        height = max(digit.get_height() for digit in BLNUM)
+        width = 14 + max(digit.get_width() for digit in BLNUM)
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        putLargeNum(surf, format(num, "02"), (0, 0), False)
+        _digit_cache[num] = surf
+    return surf
 
 
 def putClock(win, timer):
@@ -90,6 +201,8 @@ def putClock(win, timer):
 
     Takes a pair of millisecond values in the form [time_side0, time_side1],
     converts them to MM:SS format, and draws them at the bottom of the screen.
+    While the displayed values stay the same, the previously drawn clock strip
+    is blitted back in one call and the display is not updated again.
 
     Args:
         win (pygame.Surface): The window surface onto which the clock is drawn.
@@ -101,55 +214,81 @@ def putClock(win, timer):
     m1, s1 = divmod(timer[0] // 1000, 60)
     m2, s2 = divmod(timer[1] // 1000, 60)
 
-    # Display side 0's time.
-    putLargeNum(win, format(m1, "02"), (100, 460), False)
-    win.blit(CHESS.COL, (130, 460))
-    putLargeNum(win, format(s1, "02"), (140, 460), False)
+    # The clock only changes once a second, so reuse the strip drawn last time.
+    # It still has to be blitted, as the board redraw paints over it every frame.
+    key = (m1, s1, m2, s2)
+    if key == _clock_cache[0]:
+        win.blit(_clock_cache[1], CLOCK_RECT)
+        return
+
+    _blitMany(win, [
+        # Display side 0's time.
+        (_twoDigits(m1), (100, 460)),
+        (CHESS.COL, (130, 460)),
+        (_twoDigits(s1), (140, 460)),
 
-    # Display side 1's time.
-    putLargeNum(win, format(m2, "02"), (210, 460), False)
-    win.blit(CHESS.COL, (240, 460))
-    putLargeNum(win, format(s2, "02"), (250, 460), False)
+        # Display side 1's time.
+        (_twoDigits(m2), (210, 460)),
+        (CHESS.COL, (240, 460)),
+        (_twoDigits(s2), (250, 460)),
 
-    # Show small king icons to indicate which side's clock is displayed.
-    win.blit(CHESS.PIECES[0]["k"], (50, 450))
-    win.blit(CHESS.PIECES[1]["k"], (278, 450))
+        # Show small king icons to indicate which side's clock is displayed.
+        (CHESS.PIECES[0]["k"], (50, 450)),
+        (CHESS.PIECES[1]["k"], (278, 450)),
+    ])
+    _clock_cache[:] = key, win.subsurface(CLOCK_RECT).copy()
 
-    pygame.display.update()
+    # Only the clock changes from one call to the next, so present just that strip.
+    pygame.display.update(CLOCK_RECT)
 
 
 def drawBoard(win):
     """Draw the chessboard background and squares.
 
-    Fills the screen with a base color, then draws an 8x8 board with alternating tile colors.
+    The base color and the 8x8 board with alternating tile colors are rendered
+    only once into a cached surface, which is then blitted in a single call.
+    The cache is rebuilt whenever the target surface changes size, by tiling a
+    prebuilt 2x2 block of squares over the board.
 
     Args:
         win (pygame.Surface): The window surface where the board is drawn.
     """
-    win.fill((100, 200, 200))
-    pygame.draw.rect(win, (180, 100, 30), (50, 50, 400, 400))
-    for y in range(1, 9):
-        for x in range(1, 9):
-            if (x + y) % 2 == 0:
-                pygame.draw.rect(win, (220, 240, 240), (50 * x, 50 * y, 50, 50))
+    global _board_cache
+    if _board_cache is None or _board_cache.get_size() != win.get_size():
+        _board_cache = pygame.Surface(win.get_size()).convert()
+        _board_cache.fill((100, 200, 200))
+
+        # The squares repeat every two ranks and files, so one 100x100 block
+        # holding a light and a dark pair is blitted 16 times.
+        block = pygame.Surface((100, 100)).convert()
+        block.fill((180, 100, 30))
+        block.fill((220, 240, 240), (0, 0, 50, 50))
+        block.fill((220, 240, 240), (50, 50, 50, 50))
+        _blitMany(_board_cache, [
+            (block, (50 + 100 * x, 50 + 100 * y)) for y in range(4) for x in range(4)
+        ])
+
+    win.blit(_board_cache, (0, 0))
 
 
 def drawPieces(win, board, flip):
     """Render all chess pieces onto the board.
 
-    Checks if the board should be flipped for the second player,
-    then draws the pieces in their correct positions.
+    Walks the square array of the board once and looks up each occupied square's
+    screen position in a precomputed table, picked by whether the board is flipped
+    for the second player.
 
     Args:
         win (pygame.Surface): The window surface onto which pieces are drawn.
-        board (list): A 2D data structure representing piece positions for each side.
+        board (Board): The [`Board`](Source/chess/lib/bitboard.py) whose pieces are drawn.
         flip (bool): If True, invert the board to show from the second player's perspective.
     """
-    for side in range(2):
-        for x, y, ptype in board[side]:
-            if flip:
-                x, y = 9 - x, 9 - y
-            win.blit(CHESS.PIECES[side][ptype], (x * 50, y * 50))
+    PIECES = CHESS.PIECES
+    pos = FLIPPED_POS if flip else SQUARE_POS
+    _blitMany(win, [
+        (PIECES[piece[0]][piece[1]], pos[sq])
+        for sq, piece in enumerate(board.squares) if piece is not None
+    ])
 
 
 def prompt(win, msg=None):
@@ -165,70 +304,79 @@ def prompt(win, msg=None):
     Returns:
         bool: True if Yes is clicked, False if No is clicked.
     """
-    pygame.draw.rect(win, (0, 0, 0), (110, 160, 280, 130))
-    pygame.draw.rect(win, (255, 255, 255), (110, 160, 280, 130), 4)
-
-    pygame.draw.rect(win, (255, 255, 255), (120, 160, 260, 60), 2)
-
-    win.blit(CHESS.YES, (145, 240))
-    win.blit(CHESS.NO, (305, 240))
-    pygame.draw.rect(win, (255, 255, 255), (140, 240, 60, 28), 2)
-    pygame.draw.rect(win, (255, 255, 255), (300, 240, 50, 28), 2)
-
-    if msg is None:
-        win.blit(CHESS.MESSAGE[0], (130, 160))
-        win.blit(CHESS.MESSAGE[1], (190, 190))
-    elif msg == -1:
-        win.blit(CHESS.MESSAGE[0], (130, 160))
-        win.blit(CHESS.MESSAGE[1], (190, 190))
-        win.blit(CHESS.SAVE_ERR, (115, 270))
-    else:
-        win.blit(CHESS.MESSAGE2[0], (123, 160))
-        win.blit(CHESS.MESSAGE2[1], (145, 190))
-        win.blit(CHESS.MSG, (135, 270))
+    # Only the saved game number varies, so the dialog comes in three static variants.
+    variant = "ask" if msg is None else "error" if msg == -1 else "saved"
+
+    def paint(layer, offset):
+        ox, oy = offset
+        pygame.draw.rect(layer, (0, 0, 0), PROMPT_RECT.move(-ox, -oy))
+        pygame.draw.rect(layer, (255, 255, 255), PROMPT_RECT.move(-ox, -oy), 4)
+
+        pygame.draw.rect(layer, (255, 255, 255), (120 - ox, 160 - oy, 260, 60), 2)
+
+        layer.blit(CHESS.YES, (145 - ox, 240 - oy))
+        layer.blit(CHESS.NO, (305 - ox, 240 - oy))
+        for rect, _ in PROMPT_BUTTONS:
+            pygame.draw.rect(layer, (255, 255, 255), rect.move(-ox, -oy), 2)
+
+        if variant == "saved":
+            layer.blit(CHESS.MESSAGE2[0], (123 - ox, 160 - oy))
+            layer.blit(CHESS.MESSAGE2[1], (145 - ox, 190 - oy))
+            layer.blit(CHESS.MSG, (135 - ox, 270 - oy))
+        else:
+            layer.blit(CHESS.MESSAGE[0], (130 - ox, 160 - oy))
+            layer.blit(CHESS.MESSAGE[1], (190 - ox, 190 - oy))
+            if variant == "error":
+                layer.blit(CHESS.SAVE_ERR, (115 - ox, 270 - oy))
+
+    win.blit(_dialogLayer(("prompt", variant), PROMPT_RECT, paint), PROMPT_RECT)
+    if variant == "saved":
         putNum(win, msg, (345, 270))
 
-    pygame.display.flip()
+    pygame.display.update(PROMPT_RECT)
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if 240 < event.pos[1] < 270:
-                    if 140 < event.pos[0] < 200:
-                        return True
-                    elif 300 < event.pos[0] < 350:
-                        return False
+        for event in pygame.event.get(pygame.MOUSEBUTTONDOWN):
+            for rect, choice in PROMPT_BUTTONS:
+                if rect.collidepoint(event.pos):
+                    return choice
+        pygame.time.wait(10)
 
 
 def start(win, load):
-    """Play a short introduction animation and initialize piece images for a new game.
+    """Play a short introduction animation for a new game.
 
-    Converts all piece images to optimized formats using [`convertPieces`](#convertpieces),
-    plays the opening sound via [`sound.play_start`](tools/sound.py),
+    Plays the opening sound via [`sound.play_start`](tools/sound.py),
     and creates a quick animation by drawing pieces moving across the board.
+    The animation is skipped when the "animations" preference is off.
 
     Args:
         win (pygame.Surface): The window where the animation is displayed.
         load (dict): User preferences or settings controlling sound and visual effects.
     """
-    convertPieces(win)
     sound.play_start(load)  # Audio feedback for game start.
 
-    clk = pygame.time.Clock()
-    for i in range(101):
-        # Use tick_busy_loop for more precise timing in short loops.
-        clk.tick_busy_loop(140)
+    # The animation paints over the clock, so the first clock of the game is drawn anew.
+    _clock_cache[0] = None
 
-        # Draw the board background so the moving pieces appear on top of it.
+    if not load["animations"]:
+        # Still replace the previous screen, which the game only partly redraws.
         drawBoard(win)
+        pygame.display.flip()
+        return
+
+    # Pair the precomputed positions of each frame with the piece images.
+    surfs = [CHESS.PIECES[side][ptype] for side, ptype in INTRO_PIECES]
 
-        # Animate pawns moving from the center outward.
-        for j in range(8):
-            win.blit(CHESS.PIECES[0]["p"], (0.5 * i * (j + 1), 225 + 1.25 * i))
-            win.blit(CHESS.PIECES[1]["p"], (0.5 * i * (j + 1), 225 - 1.25 * i))
+    clk = pygame.time.Clock()
+    for pos in INTRO_FRAMES:
+        # A sleeping tick is accurate enough for a cosmetic intro and, unlike
+        # tick_busy_loop, does not keep a CPU core spinning while it waits.
+        clk.tick(140)
 
-        # Animate other pieces in a similar style, giving a sense of progression.
-        for j, pc in enumerate(["r", "n", "b", "q", "k", "b", "n", "r"]):
-            win.blit(CHESS.PIECES[0][pc], (0.5 * i * (j + 1), 225 + 1.75 * i))
-            win.blit(CHESS.PIECES[1][pc], (0.5 * i * (j + 1), 225 - 1.75 * i))
+        # Draw the board background so the moving pieces appear on top of it.
+        drawBoard(win)
+        _blitMany(win, list(zip(surfs, pos)))
 
-        pygame.display.update()
\ No newline at end of file
+        # The whole screen changes every frame, and flip() presents it without
+        # building a list of dirty rects first.
+        pygame.display.flip()
\ No newline at end of file
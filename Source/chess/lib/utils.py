@@ -8,16 +8,29 @@ from datetime import datetime
 import os
 import time
 
+from chess.lib.bitboard import Board
+
 # Maps numeric columns (1..8) to their corresponding letter identifiers as used in algebraic notation.
 LETTER = ["", "a", "b", "c", "d", "e", "f", "g", "h"]
 
+# The reverse of LETTER, mapping a column letter to its number in O(1).
+COLUMN = {letter: col for col, letter in enumerate(LETTER) if letter}
+
+# Maps a rank digit to its internal row (1..8), rows counting down from rank 8.
+ROW = {str(9 - row): row for row in range(1, 9)}
+
+# The name of every square, SQUARE[x][y] being e.g. "e2" for [5, 7].
+SQUARE = [[""] * 9] + [
+    [""] + [f"{LETTER[x]}{9 - y}" for y in range(1, 9)] for x in range(1, 9)
+]
+
 
 def encode(fro, to, promote=None):
     """Convert internal game move notation to a standard algebraic notation string.
 
-    This function uses the global [`LETTER`](Source/chess/lib/utils.py) array
-    to build a 4-character string (e.g., "e2e4") and appends the promotion piece
-    type if provided.
+    This function joins the two square names of the global
+    [`SQUARE`](Source/chess/lib/utils.py) table into a 4-character string
+    (e.g., "e2e4") and appends the promotion piece type if provided.
 
     Args:
         fro (list[int, int]): A pair [x, y] denoting the origin square in internal format.
@@ -29,7 +42,7 @@ def encode(fro, to, promote=None):
         str: Algebraic notation for the move, optionally including a promotion piece
              (e.g., "e7e8q").
     """
-    data = LETTER[fro[0]] + str(9 - fro[1]) + LETTER[to[0]] + str(9 - to[1])
+    data = SQUARE[fro[0]][fro[1]] + SQUARE[to[0]][to[1]]
     if promote is not None:
         return data + promote
     return data
@@ -49,44 +62,64 @@ def decode(data):
         list: A list with two coordinate pairs and a promotion character (or None),
               e.g. [[4, 6], [4, 4], 'q'].
     """
-    ret = [
-        [LETTER.index(data[0]), 9 - int(data[1])],
-        [LETTER.index(data[2]), 9 - int(data[3])],
+    return [
+        [COLUMN[data[0]], ROW[data[1]]],
+        [COLUMN[data[2]], ROW[data[3]]],
+        data[4] if len(data) == 5 else None,
+    ]
+
+
+def decodeMany(moves):
+    """Convert a whole list of move strings with [`decode`](#decode).
+
+    Used when a saved or replayed game is loaded, so the lookups are bound once
+    for the whole list instead of once per move.
+
+    Args:
+        moves (list[str]): Move strings in standard notation (e.g., ["e2e4", "e7e5"]).
+
+    Returns:
+        list: One [fro, to, promote] list per move, as returned by decode.
+    """
+    col, row = COLUMN, ROW
+    return [
+        [
+            [col[data[0]], row[data[1]]],
+            [col[data[2]], row[data[3]]],
+            data[4] if len(data) == 5 else None,
+        ]
+        for data in moves
     ]
-    if len(data) == 5:
-        ret.append(data[4])
-    else:
-        ret.append(None)
-    return ret
 
 
 def initBoardVars():
     """Set up the initial board state, including side-to-move and other flags.
 
-    The board is represented as two lists that track the piece positions for each side.
+    The board is a [`Board`](Source/chess/lib/bitboard.py) built from two lists of
+    (x, y, ptype) tuples that track the piece positions for each side.
     The side variable (bool) indicates which side is active (False for one side, True for the other),
     while the flags array holds castling or other special conditions.
 
     Returns:
         tuple: A tuple containing (side, board, flags).
                side (bool): Indicates which side is active (False or True).
-               board (list): 2D list of piece placements for both sides.
+               board (Board): Bitboards of the piece placements for both sides.
                flags (list): Additional game flags (castling rights, etc.).
     """
     side = False
-    board = [
+    board = Board([
         [
-            [1, 7, "p"], [2, 7, "p"], [3, 7, "p"], [4, 7, "p"],
-            [5, 7, "p"], [6, 7, "p"], [7, 7, "p"], [8, 7, "p"],
-            [1, 8, "r"], [2, 8, "n"], [3, 8, "b"], [4, 8, "q"],
-            [5, 8, "k"], [6, 8, "b"], [7, 8, "n"], [8, 8, "r"],
+            (1, 7, "p"), (2, 7, "p"), (3, 7, "p"), (4, 7, "p"),
+            (5, 7, "p"), (6, 7, "p"), (7, 7, "p"), (8, 7, "p"),
+            (1, 8, "r"), (2, 8, "n"), (3, 8, "b"), (4, 8, "q"),
+            (5, 8, "k"), (6, 8, "b"), (7, 8, "n"), (8, 8, "r"),
         ], [
-            [1, 2, "p"], [2, 2, "p"], [3, 2, "p"], [4, 2, "p"],
-            [5, 2, "p"], [6, 2, "p"], [7, 2, "p"], [8, 2, "p"],
-            [1, 1, "r"], [2, 1, "n"], [3, 1, "b"], [4, 1, "q"],
-            [5, 1, "k"], [6, 1, "b"], [7, 1, "n"], [8, 1, "r"],
+            (1, 2, "p"), (2, 2, "p"), (3, 2, "p"), (4, 2, "p"),
+            (5, 2, "p"), (6, 2, "p"), (7, 2, "p"), (8, 2, "p"),
+            (1, 1, "r"), (2, 1, "n"), (3, 1, "b"), (4, 1, "q"),
+            (5, 1, "k"), (6, 1, "b"), (7, 1, "n"), (8, 1, "r"),
         ]
-    ]
+    ])
     flags = [[True for _ in range(4)], None]
     return side, board, flags
 
@@ -159,24 +192,27 @@ def updateTimer(side, mode, timer):
         timer (list[int]): Two-element list representing the time for each side in milliseconds.
 
     Returns:
-        list or None: An updated list of millisecond timers. Returns None if timer is None.
+        tuple or None: The updated millisecond timers. Callers only read them, so a
+                       tuple is built directly instead of copying into a list.
+                       Returns None if timer is None.
     """
     if timer is None:
         return None
 
-    ret = list(timer)
-    if mode != -1:
-        ret[side] += (mode * 1000)
-    return ret
+    if mode == -1:
+        return tuple(timer)
+    inc = mode * 1000
+    return (timer[0], timer[1] + inc) if side else (timer[0] + inc, timer[1])
 
 
 def saveGame(moves, gametype="multi", player=0, level=0, mode=None, timer=None, cnt=0):
     """Persist a chess game into a TXT file under 'res/savedGames'.
 
-    Files are named sequentially (game0.txt, game1.txt, etc.). If the chosen file name
-    already exists, the function attempts the next number recursively up to 20 times.
-    The file stores all moves in algebraic notation, along with the date/time and some
-    custom data depending on the game mode.
+    Files are named sequentially (game0.txt, game1.txt, etc.). The directory is listed
+    once, and the first of the 20 names from 'cnt' onwards that is not taken is used.
+    The directory is created if it does not exist yet.
+    The file is written atomically and stores all moves in algebraic notation, along
+    with the date/time and some custom data depending on the game mode.
 
     Args:
         moves (list[str]): A list of moves in long algebraic notation (e.g., "e2e4").
@@ -186,18 +222,24 @@ def saveGame(moves, gametype="multi", player=0, level=0, mode=None, timer=None,
         level (int, optional): Difficulty level if the gametype is single-player. Defaults to 0.
         mode (int or None, optional): Additional mode parameter (e.g., time control). Defaults to None.
         timer (list[int] or None, optional): Two-element list of time left for each side. Defaults to None.
-        cnt (int, optional): Internal counter for file naming attempts. Defaults to 0.
+        cnt (int, optional): The first file index to try. Defaults to 0.
 
     Returns:
         int: The file index if the game was saved successfully, or -1 if saving was aborted.
     """
-    if cnt >= 20:
+    folder = os.path.join("res", "savedGames")
+    try:
+        # A single directory listing replaces a stat() call per candidate name.
+        with os.scandir(folder) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        os.makedirs(folder)
+        existing = set()
+
+    cnt = next((i for i in range(cnt, 20) if "game" + str(i) + ".txt" not in existing), -1)
+    if cnt == -1:
         return -1
-
-    name = os.path.join("res", "savedGames", "game" + str(cnt) + ".txt")
-    if os.path.isfile(name):
-        # If file exists, increment 'cnt' and try again
-        return saveGame(moves, gametype, player, level, mode, timer, cnt + 1)
+    name = os.path.join(folder, "game" + str(cnt) + ".txt")
 
     # Build up a string detailing the game type, date/time, moves, and additional info.
     if gametype == "single":
@@ -205,22 +247,19 @@ def saveGame(moves, gametype="multi", player=0, level=0, mode=None, timer=None,
     elif gametype == "mysingle":
         gametype += " " + str(player)
 
+    # Fields are not zero-padded, which strftime can't express portably.
     dt = datetime.now()
-    date = "/".join(map(str, [dt.day, dt.month, dt.year]))
-    cur_time = ":".join(map(str, [dt.hour, dt.minute, dt.second]))
-    datentime = " ".join([date, cur_time])
+    datentime = f"{dt.day}/{dt.month}/{dt.year} {dt.hour}:{dt.minute}:{dt.second}"
 
     movestr = " ".join(moves)
-    extra_info = []
+    extra_info = ""
     if mode is not None:
-        extra_info.append(str(mode))
-        if timer is not None:
-            extra_info.extend(map(str, timer))
-    extra_info = " ".join(extra_info)
-
-    text = "\n".join([gametype, datentime, movestr, extra_info])
-
-    # Write the final string to a new text file.
-    with open(name, "w") as file:
-        file.write(text)
+        extra_info = " ".join(map(str, [mode, *(timer or ())]))
+
+    # Write the lines to a temporary file first and move it into place in one
+    # step, so a crash mid-write can never leave a truncated save behind.
+    tmpname = name + ".tmp"
+    with open(tmpname, "w") as file:
+        file.writelines([gametype, "\n", datentime, "\n", movestr, "\n", extra_info])
+    os.replace(tmpname, name)
     return cnt
\ No newline at end of file
@@ -1,32 +1,31 @@
 # Programming Language: Python
 # Project Type: Multiplayer Chess Game
 # Key Functionalities: Managing online chess gameplay, socket connection initialization,
-#                      background thread management, and error handling for online lobby.
+#                      selector-based message receiving, and error handling for online lobby.
 # Target Users: Developers maintaining or extending the Chess application.
 # Code Style: PEP8 with Google-style docstrings and inline comments
 
 '''
 This file is a part of the Chess application.
 It manages the chess gameplay for the online section of the application by initializing
-socket connections to the server, handling background thread communication, and invoking
+socket connections to the server, attaching them for message receiving, and invoking
 the lobby interface. It uses functions from the online library for connection handling.
 See [chess.onlinelib](Source/chess/onlinelib) for more details.
 '''
 
 import socket
-import threading
 
-from chess.onlinelib import showLoading, write, read, lobby, flush, bgThread  # Reference to [chess.onlinelib](Source/chess/onlinelib)
+from chess.onlinelib import showLoading, write, read, lobby, flush, attach, detach  # Reference to [chess.onlinelib](Source/chess/onlinelib)
 
-VERSION = "v1.0"  # Application version for online compatibility checks.
+VERSION = "v1.1"  # Application version for online compatibility checks.
 PORT = 26104      # Network port to connect to the chess server.
 
 def main(win, addr, load, ipv6=False):
     """Initialize the online chess session and transition to the online lobby.
 
     This function displays a loading screen, establishes a socket connection
-    (IPv4 or IPv6 based on the parameter), launches a background thread to handle
-    asynchronous communication, and invokes the lobby interface based on server response.
+    (IPv4 or IPv6, whichever the address resolves to), attaches it to receive the server's
+    messages, and invokes the lobby interface based on server response.
     Appropriate error messages are shown for version mismatches, server busy state,
     or if the server is locked.
 
@@ -34,7 +33,9 @@ def main(win, addr, load, ipv6=False):
         win (pygame.Surface): The display surface where loading screens and messages are shown.
         addr (str): The server address to connect to.
         load (dict): User configuration loaded from preferences to pass to the lobby.
-        ipv6 (bool, optional): Flag indicating whether to use IPv6. Defaults to False.
+        ipv6 (bool, optional): Whether the user picked IPv6 in the online menu. The address
+                               family is now resolved from the address itself, so this is
+                               only kept for the menu's call signature. Defaults to False.
 
     Returns:
         int: Status code indicating outcome. Returns 1 for errors or when the back button is selected,
@@ -43,29 +44,26 @@ def main(win, addr, load, ipv6=False):
     # Show initial loading screen before starting connection.
     showLoading(win)
     
-    # Create a socket using IPv6 or IPv4 depending on the flag.
-    if ipv6:
-        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-        servaddr = (addr, PORT, 0, 0)
-    else:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        servaddr = (addr, PORT)
-
     try:
-        # Attempt to connect to the server.
-        sock.connect(servaddr)
+        # Attempt to connect to the server. create_connection tries every IPv4 or IPv6
+        # address the name resolves to, and the timeout keeps the window from hanging.
+        sock = socket.create_connection((addr, PORT), timeout=5)
     except Exception:
         # If connection fails, show error loading screen with error code 1.
         showLoading(win, 1)
         return 1
 
-    # Start a background thread for asynchronous communication.
-    thread = threading.Thread(target=bgThread, args=(sock,))
-    thread.start()
+    # Moves are tiny messages, so send them right away instead of letting
+    # Nagle's algorithm hold them back, and block normally for the session.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(None)
+
+    # Watch the socket for incoming messages, which are then received whenever
+    # the game loops check for them (see [sockutils](Source/chess/onlinelib/sockutils.py)).
+    attach(sock)
     
-    # Send application identifier and version over the socket.
-    write(sock, "PyChess")
-    write(sock, VERSION)
+    # Send application identifier and version over the socket, in one send.
+    write(sock, "PyChess", VERSION)
 
     ret = 1  # Default return code for error scenarios.
     msg = read()  # Read the response from the server.
@@ -88,10 +86,11 @@ def main(win, addr, load, ipv6=False):
         print(msg)
         showLoading(win, 5)
 
-    # Terminate the connection by signaling a quit message.
+    # Terminate the connection by signaling a quit message, and stop watching
+    # the socket before closing it.
     write(sock, "quit")
+    detach()
     sock.close()
-    thread.join()
     flush()  # Clear any buffered network data.
 
     # If lobby returns a code indicating special handling, display appropriate loading screen.
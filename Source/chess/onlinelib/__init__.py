@@ -10,15 +10,48 @@ import pygame.event
 # Importing all required symbols from [chess.lib.__init__.py](Source/chess/lib/__init__.py)
 # See [chess/lib/__init__.py](Source/chess/lib/__init__.py) for more details.
 from chess.lib import (
-    start, isOccupied, isValidMove, animate, makeMove, encode,
+    start, isOccupied, isValidMove, getPromote, animate, makeMove, encode,
     decode, initBoardVars, isEnd, sound, showScreen
 )
 
 # Importing helper functions for the online lobby and popups from
-# [chess.onlinelib.utils](Source/chess/onlinelib/utils.py).
+# [chess.onlinelib.utils](Source/chess/onlinelib/utils.py), and the socket
+# helpers from [chess.onlinelib.sockutils](Source/chess/onlinelib/sockutils.py).
 from chess.onlinelib.utils import (
-    getPlayers, showLobby, request, draw, readable, read, flush, write, showUpdateList, showLoading
+    showLobby, request, draw, popup, readable, read, write, showUpdateList, showLoading
 )
+from chess.onlinelib.sockutils import getPlayers, flush, attach, detach
+
+# Clickable regions of the lobby screen, as (x0, x1, y0, y1, name); a click hits
+# a region if it falls strictly inside it.
+LOBBY_REGIONS = (
+    (460, 500, 0, 50, "back"),       # "Go back" button, top-right corner
+    (270, 300, 85, 115, "refresh"),  # "Refresh" button next to the list title
+)
+
+
+def _lobbyClick(x, y, count):
+    """Find what a click on the lobby screen hits.
+
+    Args:
+        x (int): Horizontal position of the click.
+        y (int): Vertical position of the click.
+        count (int): The number of players shown in the list.
+
+    Returns:
+        str or int or None: The name of the region in LOBBY_REGIONS, the index of
+        the player whose "Request" button was clicked, or None if nothing was hit.
+    """
+    for x0, x1, y0, y1, name in LOBBY_REGIONS:
+        if x0 < x < x1 and y0 < y < y1:
+            return name
+
+    # The "Request" buttons of the player rows are 30 pixels apart, so the row
+    # index follows from y directly.
+    i = (y - 122) // 30
+    if 300 < x < 475 and 0 <= i < count and 122 + 30 * i < y < 148 + 30 * i:
+        return i
+    return None
 
 
 def lobby(win, sock, key, load):
@@ -46,6 +79,9 @@ def lobby(win, sock, key, load):
     """
     clock = pygame.time.Clock()
     playerList = getPlayers(sock)  # Fetch initial list of active players.
+    # Whether the next frame must present the whole screen, rather than the list
+    # area only: true for the first frame and after a game took over the screen.
+    full = True
 
     while True:
         clock.tick(10)  # Update at 10 FPS to avoid resource overuse.
@@ -55,55 +91,53 @@ def lobby(win, sock, key, load):
             return 2
 
         # Render the lobby UI with current player list.
-        showLobby(win, key, playerList)
+        showLobby(win, key, playerList, full)
+        full = False
 
         # Process all Pygame events (e.g., mouse clicks, window close requests).
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                # If user closes the entire window, inform server and exit.
-                write(sock, "quit")
+                # If user closes the entire window, exit. The server is told by
+                # [`main`](Source/chess/online.py), which sends "quit" for every exit.
                 return 0
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                x, y = event.pos
+                hit = _lobbyClick(*event.pos, len(playerList))
                 # Clicking top-right area triggers a "back to main menu" request.
-                if 460 < x < 500 and 0 < y < 50:
-                    write(sock, "quit")
+                if hit == "back":
                     return 1
 
                 # Clicking "Refresh" button to reload player list.
-                if 270 < x < 300 and 85 < y < 115:
+                elif hit == "refresh":
                     playerList = getPlayers(sock)
 
                 # Clicking any "Request" button in the player list area.
-                if 300 < x < 475:
-                    for i in range(len(playerList)):
-                        if 122 + 30 * i < y < 148 + 30 * i:
-                            write(sock, "rg" + playerList[i][:4])
-                            msg = read()
-
-                            # If connection is closed or broken after we attempt a match.
-                            if msg == "close":
-                                return 2
-
-                            elif msg == "msgOk":
-                                # Show a request popup for user to confirm or decline match.
-                                ret = request(win, sock)
-                                if ret in [0, 1, 2]:
-                                    return ret
-                                elif ret == 4:
-                                    # Start a chess game as the initiating player.
-                                    newret = chess(win, sock, 0, load)
-                                    if newret in [0, 1, 2]:
-                                        return newret
-
-                            elif msg.startswith("err"):
-                                # Show an update/error popup if the server responded with an error.
-                                showUpdateList(win)
-
-                            # Refresh the player list after the request is processed.
-                            playerList = getPlayers(sock)
-                            break
+                elif hit is not None:
+                    write(sock, "rg" + playerList[hit][:4])
+                    msg = read()
+
+                    # If connection is closed or broken after we attempt a match.
+                    if msg == "close":
+                        return 2
+
+                    elif msg == "msgOk":
+                        # Show a request popup for user to confirm or decline match.
+                        ret = request(win, sock)
+                        if ret in [0, 1, 2]:
+                            return ret
+                        elif ret == 4:
+                            # Start a chess game as the initiating player.
+                            newret = chess(win, sock, 0, load)
+                            if newret in [0, 1, 2]:
+                                return newret
+                            full = True
+
+                    elif msg.startswith("err"):
+                        # Show an update/error popup if the server responded with an error.
+                        showUpdateList(win)
+
+                    # Refresh the player list after the request is processed.
+                    playerList = getPlayers(sock)
 
         # Check for any unsolicited messages (e.g., incoming game requests).
         if readable():
@@ -114,19 +148,81 @@ def lobby(win, sock, key, load):
             elif msg.startswith("gr"):
                 # "gr" indicates another player is requesting a game with us.
                 ret = request(win, sock, msg[2:])
+                pending = ()
                 if ret == 4:
                     # Local player accepted; notify server we are ready.
                     write(sock, "gmOk" + msg[2:])
                     newret = chess(win, sock, 1, load)
                     if newret in [0, 1, 2]:
                         return newret
+                    full = True
+                elif ret == 2:
+                    # If the server closed, propagate the code.
+                    return ret
                 else:
-                    # If declined or the server closed, inform server and propagate the code.
-                    write(sock, "gmNo" + msg[2:])
-                    if ret == 2:
-                        return ret
+                    # Declined, so inform the server along with the refresh below.
+                    pending = ("gmNo" + msg[2:],)
                 # Refresh the list in case of changes after the request.
-                playerList = getPlayers(sock)
+                playerList = getPlayers(sock, *pending)
+
+
+def _onClose(win, sock, msg, load, player, side, board, flags):
+    """The connection dropped entirely."""
+    return 2, side, board, flags
+
+
+def _onLeave(win, sock, msg, load, player, side, board, flags):
+    """The opponent quit or resigned."""
+    return popup(win, sock, msg), side, board, flags
+
+
+def _onEnd(win, sock, msg, load, player, side, board, flags):
+    """The opponent ended the game, either after a checkmate or by abandoning it."""
+    msg = "end" if isEnd(side, board, flags) else "abandon"
+    return popup(win, sock, msg), side, board, flags
+
+
+def _onDrawOffer(win, sock, msg, load, player, side, board, flags):
+    """The opponent offers a draw, so let the local player accept or reject it."""
+    ret = draw(win, sock, False)
+    return (ret if ret in [2, 3] else None), side, board, flags
+
+
+def _onMove(win, sock, msg, load, player, side, board, flags):
+    """The opponent made a move, so apply it locally."""
+    if side == player:
+        # Not the opponent's turn, ignore the message.
+        return None, side, board, flags
+
+    fro, to, promote = decode(msg[3:])
+    if not isValidMove(side, board, flags, fro, to):
+        # If there's an invalid move, assume a desync or error.
+        return 2, side, board, flags
+
+    animate(win, side, board, fro, to, load, player)
+    return (None, *makeMove(side, board, fro, to, flags, promote))
+
+
+# Handlers of the messages received during a game, looked up by the first three
+# characters of the message (the "mov" prefix of moves, which are by far the most
+# frequent messages, and "end"), or else by the whole message. No other key is
+# three characters long, so the two lookups can never disagree.
+# Each handler returns the code chess() should return (None to go on), along
+# with the updated side, board and flags.
+GAME_HANDLERS = {
+    "close": _onClose,
+    "quit": _onLeave,
+    "resign": _onLeave,
+    "end": _onEnd,
+    "draw?": _onDrawOffer,
+    "mov": _onMove,
+}
+
+
+# Board coordinate of a click, indexed by the pixel coordinate // 50, for the
+# normal and the flipped board; chess() picks one of them for the whole game.
+BOARD_COORDS = tuple(range(10))
+FLIPPED_COORDS = tuple(9 - i for i in range(10))
 
 
 def chess(win, sock, player, load):
@@ -160,6 +256,14 @@ def chess(win, sock, player, load):
 
     clock = pygame.time.Clock()
     sel = prevsel = [0, 0]  # Track current and previous selections for piece movement.
+    # The board is flipped for the second player if the preference asks so; this
+    # cannot change during a game, so pick the coordinate table once.
+    coords = FLIPPED_COORDS if load["flip"] and player else BOARD_COORDS
+    # Whether the screen must be redrawn. Idle frames, with no click and no
+    # message from the server, leave the screen as it is.
+    dirty = True
+    # Whether the game is over in the current position, updated after every move.
+    ended = isEnd(side, board, flags)
 
     while True:
         # Limit frame rate to 25 FPS for smoother rendering.
@@ -168,11 +272,16 @@ def chess(win, sock, player, load):
         # Check user input from mouse or window events.
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                # User closed entire window, so we inform the server and exit.
-                write(sock, "quit")
+                # User closed entire window, so exit; the caller informs the server.
                 return 0
 
+            elif event.type == pygame.VIDEOEXPOSE:
+                # The window was uncovered, so present the screen again.
+                dirty = True
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                # A click may change the selection, make a move or open a popup.
+                dirty = True
                 x, y = event.pos
 
                 # Clicking top-right area requests to end the current match safely.
@@ -182,10 +291,7 @@ def chess(win, sock, player, load):
 
                 # If click is on the board area, attempt to move locally if it's our turn.
                 if 50 < x < 450 and 50 < y < 450:
-                    x, y = x // 50, y // 50
-                    # If the board is flipped for the second player, invert coordinates.
-                    if load["flip"] and player:
-                        x, y = 9 - x, 9 - y
+                    x, y = coords[x // 50], coords[y // 50]
 
                     # Play an audio cue if the clicked square is occupied (and it's our side).
                     if isOccupied(side, board, [x, y]) and side == player:
@@ -207,8 +313,9 @@ def chess(win, sock, player, load):
                         # Animate the movement locally for a polished user experience.
                         animate(win, player, board, prevsel, sel, load, player)
                         side, board, flags = makeMove(side, board, prevsel, sel, flags, promote)
+                        ended = isEnd(side, board, flags)
 
-                elif not isEnd(side, board, flags):
+                elif not ended:
                     # If the board state isn't terminal, check for optional draw/resign triggers.
                     if 0 < x < 70 and 0 < y < 50:
                         # Send a draw request to opponent.
@@ -224,38 +331,23 @@ def chess(win, sock, player, load):
 
         # Refresh the on-screen board, highlighting selected squares, etc.
         # See [`showScreen`](Source/chess/lib/__init__.py).
-        showScreen(win, side, board, flags, sel, load, player, True)
+        if dirty:
+            showScreen(win, side, board, flags, sel, load, player, True)
+            dirty = False
 
-        # Process incoming messages from the server.
+        # Process incoming messages from the server, see GAME_HANDLERS.
         if readable():
             msg = read()
-
-            # If connection dropped entirely.
-            if msg == "close":
-                return 2
-
-            # Opponent or server indicates quitting/resigning.
-            elif msg == "quit" or msg == "resign":
-                return popup(win, sock, msg)
-
-            elif msg == "end":
-                # If the board state is ended by checkmate, or abrupt abandon.
-                msg = "end" if isEnd(side, board, flags) else "abandon"
-                return popup(win, sock, msg)
-
-            elif msg == "draw?":
-                # Handle draw request from opponent.
-                ret = draw(win, sock, False)
-                if ret in [2, 3]:
+            handler = GAME_HANDLERS.get(msg[:3]) or GAME_HANDLERS.get(msg)
+            if handler is not None:
+                # A handled message either moves a piece or draws a popup over the screen.
+                dirty = True
+                ret, newside, board, flags = handler(
+                    win, sock, msg, load, player, side, board, flags
+                )
+                if ret is not None:
                     return ret
-
-            # If the opponent made a move, apply it locally.
-            elif msg.startswith("mov") and side != player:
-                fro, to, promote = decode(msg[3:])
-                if isValidMove(side, board, flags, fro, to):
-                    animate(win, side, board, fro, to, load, player)
-                    side, board, flags = makeMove(side, board, fro, to, flags, promote)
+                if newside != side:
+                    side = newside
                     sel = [0, 0]  # Reset our selection after applying a remote move.
-                else:
-                    # If there's an invalid move, assume a desync or error.
-                    return 2
\ No newline at end of file
+                    ended = isEnd(side, board, flags)
\ No newline at end of file
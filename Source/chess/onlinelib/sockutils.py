@@ -1,125 +1,260 @@
 """
 This file is part of the Chess application.
 It provides utility functions and wrappers for socket-related operations, including:
- - A background thread to continuously read messages from the server
+ - Receiving messages from the server through a selector, without a background thread
  - Convenience methods for sending, receiving, and flushing messages
  - Helper functions to track and list connected players
 """
 
-import queue
+import selectors
 import socket
+import time
+from collections import deque
 
-# Queue used as an in-memory buffer to safely handle incoming messages from the server.
-q = queue.Queue()
+# Deque used as an in-memory buffer for the messages received from the server,
+# filled by [`receive`](#receive) whenever the main thread checks for messages.
+q = deque()
 
-# Indicates whether the background thread is still running (False) or has stopped (True).
-# Combined with q.empty(), it shows if there's any pending or new message.
+# Selector watching the server socket for incoming data, and the socket itself
+# while a connection is attached (see [`attach`](#attach)).
+selector = selectors.DefaultSelector()
+conn = None
+
+# Preallocated receive buffer. The received but unparsed data is buf[start:end].
+buf = bytearray(4096)
+view = memoryview(buf)
+start = end = 0
+
+# Indicates whether the connection is attached and alive (False) or has ended (True).
+# Combined with an empty q, it shows that no pending or new message can come.
 isdead = True
 
+# How long getPlayers waits for the whole player list, in seconds, before it
+# gives the server up as unresponsive.
+PLAYERS_TIMEOUT = 2
 
-def bgThread(sock):
-    """Continuously receive messages from the server and store them in a shared queue.
 
-    Once this thread terminates or detects a 'close' signal from the server, it will
-    mark the connection as dead. Messages are limited by size to 8 bytes at a time.
+def attach(sock):
+    """Start receiving the messages of the server from an open socket.
 
     Args:
         sock (socket.socket): An open socket connected to the server.
     """
-    global isdead
+    global conn, isdead, start, end
+    q.clear()
+    start = end = 0
+    conn = sock
     isdead = False
-    while True:
-        try:
-            msg = sock.recv(8).decode("utf-8").strip()
-        except:
-            # If an exception occurs (e.g., socket error), break out of the loop.
-            break
+    selector.register(sock, selectors.EVENT_READ)
 
-        # Detect an empty or "close" message, signifying a disconnect intention.
-        if not msg or msg == "close":
-            break
 
-        # Ignore placeholder messages that contain only dots.
-        if msg != "........":
-            q.put(msg)
+def detach():
+    """Stop watching the socket and mark the connection as dead.
 
+    Called when the server closes the connection or sends 'close', and by the
+    caller before it closes the socket itself. Messages already received stay readable.
+    """
+    global conn, isdead
+    if conn is not None:
+        selector.unregister(conn)
+        conn = None
     isdead = True
 
 
+def receive(timeout):
+    """Receive the data the server sent, and queue every complete message in it.
+
+    Every message is framed by a single length byte (see [`write`](#write)), so
+    the data is read in large chunks, and all complete messages in it are split
+    out at once. The data is received straight into the preallocated buffer, and
+    the messages are decoded from views of it, so only the message strings are allocated.
+
+    Args:
+        timeout (float or None): The longest time to wait for data, in seconds.
+                                 0 only takes what already arrived, None waits until data arrives.
+    """
+    global start, end
+    if isdead or not selector.select(timeout):
+        return
+
+    try:
+        n = conn.recv_into(view[end:])
+    except OSError:
+        n = 0
+
+    # An empty read means the server has closed the connection.
+    if not n:
+        detach()
+        return
+
+    end += n
+    # Split out every message whose length byte and payload have fully arrived.
+    while start < end and end - start > buf[start]:
+        size = buf[start]
+        msg = str(view[start + 1:start + size + 1], "utf-8")
+        start += size + 1
+
+        # Detect a "close" message, signifying a disconnect intention.
+        if msg == "close":
+            detach()
+            return
+
+        q.append(msg)
+
+    if start == end:
+        start = end = 0
+    elif len(buf) - end < 256:
+        # Not enough room left for a whole message, so move the partial one to the front.
+        buf[:end - start] = buf[start:end]
+        start, end = 0, end - start
+
+
 def isDead():
-    """Check if the background thread has finished and the message queue is empty.
+    """Check if the connection has ended and the message queue is empty.
 
     Returns:
-        bool: True if no active thread is reading messages and the buffer has no messages left.
+        bool: True if no more messages can arrive and the buffer has no messages left.
     """
-    return q.empty() and isdead
+    return not q and isdead
 
 
-def read():
+def read(timeout=None):
     """Retrieve the next message from the queue if available.
 
-    If the background thread is dead and no messages remain, return 'close'
-    to indicate the connection is effectively closed.
+    If the connection is dead and no messages remain, return 'close' to indicate
+    the connection is effectively closed. Otherwise, this blocks until the server
+    sends a message, or until the timeout runs out.
+
+    Args:
+        timeout (float, optional): The longest time to wait, in seconds. Defaults to None,
+                                   which waits for as long as it takes.
 
     Returns:
-        str: The next message from the queue, or 'close' if the thread is dead and buffer is empty.
+        str or None: The next message from the queue, 'close' if the connection is dead
+                     and buffer is empty, or None if the timeout ran out first.
     """
-    if isDead():
-        return "close"
-    return q.get()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not q:
+        if isdead:
+            return "close"
+        if deadline is None:
+            receive(None)
+        else:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return None
+            receive(left)
+    return q.popleft()
 
 
 def readable():
     """Determine if any messages are available or if the connection has ended.
 
+    Takes in whatever the server sent since the last call, without waiting.
+
     Returns:
         bool: True if the connection is dead (so 'close' is effectively readable) or if
         a message exists in the queue; otherwise False.
     """
-    if isDead():
-        return True
-    return not q.empty()
+    if not q:
+        receive(0)
+    return bool(q) or isdead
+
+
+def waitReadable(timeout):
+    """Sleep until a message is readable, or until the timeout runs out.
+
+    Meant for the popup loops, which must also keep polling the pygame events:
+    instead of spinning on [`readable`](#readable), they sleep here for at most
+    one frame, and still wake up as soon as data arrives.
+
+    Args:
+        timeout (float): The longest time to wait, in seconds.
+    """
+    if not readable():
+        receive(timeout)
 
 
 def flush():
     """Clear any pending messages in the queue until it is empty or a 'close' is encountered.
 
+    The queued messages are dropped all at once rather than read one by one, so
+    when nothing is pending, this costs a single non-waiting check of the socket.
+
     Returns:
         bool: False if a 'close' signal is found in the process (indicating disconnection),
               True otherwise.
     """
     while readable():
-        if read() == "close":
+        q.clear()
+        if isdead:
             return False
     return True
 
 
-def write(sock, msg):
-    """Send a message to the server, ensuring correct padding and ignoring send failures.
+def _encodeFrame(msg):
+    """Encode a message and prefix it with a single byte holding its length."""
+    data = msg.encode("utf-8")
+    return bytes((len(data),)) + data
+
+
+# The fixed messages of the protocol, framed once at import, so sending them
+# needs no encoding or concatenation.
+_FRAMES = {
+    msg: _encodeFrame(msg) for msg in (
+        "pStat", "quit", "ready", "pass", "end", "resign", "draw?", "draw", "nodraw",
+    )
+}
+
+
+def frame(msg):
+    """Encode a message for the wire, prefixed with a single byte holding its length.
+
+    The fixed protocol messages are looked up pre-framed, only messages with an
+    argument (keys, moves) are encoded on each call.
+
+    Args:
+        msg (str): The message, at most 255 bytes once encoded.
+
+    Returns:
+        bytes: The framed message.
+    """
+    framed = _FRAMES.get(msg)
+    if framed is None:
+        framed = _encodeFrame(msg)
+    return framed
+
+
+def write(sock, *msgs):
+    """Send one or more messages to the server, ensuring correct framing and ignoring send failures.
 
-    This function pads messages to a fixed size (8 bytes). It intentionally catches
+    This function frames every message with [`frame`](#frame), and sends them all
+    with a single sendall call, so messages that always go together (like the
+    handshake) share one system call and TCP segment. It intentionally catches
     errors, avoiding exceptions if sending fails.
 
     Args:
         sock (socket.socket): An open socket connected to the server.
-        msg (str): The message to send. If empty, no data is sent.
+        *msgs (str): The messages to send. Empty messages are skipped.
     """
-    if msg:
-        buffedmsg = msg + (" " * (8 - len(msg)))
+    data = b"".join(frame(msg) for msg in msgs if msg)
+    if data:
         try:
-            sock.sendall(buffedmsg.encode("utf-8"))
+            sock.sendall(data)
         except:
             pass
 
 
-def getPlayers(sock):
+def getPlayers(sock, *msgs):
     """Request the current list of players from the server and read the results.
 
-    If the flush operation encounters a 'close' signal, or if the server closes
-    mid-request, this function will return None.
+    If the flush operation encounters a 'close' signal, if the server closes
+    mid-request, or if the whole list does not arrive within PLAYERS_TIMEOUT
+    seconds, this function will return None.
 
     Args:
         sock (socket.socket): The socket used to query the server.
+        *msgs (str): Messages to send just before the request, in the same write.
 
     Returns:
         tuple or None: A tuple of player info strings if successful, or None on failure.
@@ -127,15 +262,16 @@ def getPlayers(sock):
     if not flush():
         return None
 
-    write(sock, "pStat")
-    msg = read()
+    write(sock, *msgs, "pStat")
+    deadline = time.monotonic() + PLAYERS_TIMEOUT
+    msg = read(PLAYERS_TIMEOUT)
 
-    if msg.startswith("enum"):
+    if msg is not None and msg.startswith("enum"):
         data = []
         # The last character in "enumX" indicates how many players to read from the queue.
         for _ in range(int(msg[-1])):
-            newmsg = read()
-            if newmsg == "close":
+            newmsg = read(deadline - time.monotonic())
+            if newmsg is None or newmsg == "close":
                 return None
             else:
                 data.append(newmsg)
@@ -10,14 +10,58 @@ References:
 """
 
 import pygame
+from pygame import Rect
 
 # Networking utilities: [readable](Source/chess/onlinelib/sockutils.py),
 # [read](Source/chess/onlinelib/sockutils.py), [write](Source/chess/onlinelib/sockutils.py)
-from chess.onlinelib.sockutils import readable, read, write
+from chess.onlinelib.sockutils import readable, read, write, waitReadable
 
 # Graphical resources and helper methods: [ONLINE, BACK, putLargeNum, putNum] (Source/tools/loader.py)
 from tools.loader import ONLINE, BACK, putLargeNum, putNum
 
+# Static chrome of the lobby screen (everything but the player rows), as
+# (local player's key, surface). The key is the only varying part of it, and a
+# new one is given out on every connection, so only the latest one is kept.
+_lobby_cache = (None, None)
+
+# Pre-rendered popups, keyed by the popup and its variant, see _popupLayer.
+_popup_cache = {}
+
+# Screen geometry of the popups and their buttons.
+UPDATE_RECT = Rect(110, 220, 280, 60)         # showUpdateList
+LOADING_RECT = Rect(100, 220, 300, 80)        # showLoading
+POPUP_RECT = Rect(130, 220, 240, 80)          # popup
+REQUEST_WAIT_RECT = Rect(100, 210, 300, 100)  # request, while waiting for the opponent
+DRAW_WAIT_RECT = Rect(100, 220, 300, 60)      # draw, while waiting for the opponent
+ASK_RECT = Rect(100, 160, 300, 130)           # request and draw, when asked to accept
+GOBACK_RECT = Rect(220, 270, 65, 20)
+OK_RECT = Rect(140, 240, 50, 28)
+NO_RECT = Rect(300, 240, 50, 28)
+
+# The band of the lobby screen between the list title and the "you are" box. It
+# holds the player rows, and every popup shown over the lobby fits inside it.
+LIST_RECT = Rect(0, 116, 500, 314)
+
+
+def _popupLayer(key, rect, paint):
+    """Return the pre-rendered static part of a popup, painting it only the first time.
+
+    Args:
+        key (tuple): Identifies the popup and its variant in the cache.
+        rect (pygame.Rect): The screen area the popup covers.
+        paint (callable): Called with the new layer and the (x, y) offset to subtract
+                          from screen coordinates, to draw the popup onto it.
+
+    Returns:
+        pygame.Surface: The cached layer, ready to be blitted at the top-left of rect.
+    """
+    layer = _popup_cache.get(key)
+    if layer is None:
+        layer = pygame.Surface(rect.size).convert()
+        paint(layer, rect.topleft)
+        _popup_cache[key] = layer
+    return layer
+
 
 def showUpdateList(win):
     """Display a short popup indicating a connection error when joining a game.
@@ -26,11 +70,12 @@ def showUpdateList(win):
         win (pygame.Surface): The display surface for rendering the popup.
     """
     # Draw a dark rectangle as the popup background.
-    pygame.draw.rect(win, (0, 0, 0), (110, 220, 280, 60))
-    pygame.draw.rect(win, (255, 255, 255), (110, 220, 280, 60), 4)
+    pygame.draw.rect(win, (0, 0, 0), UPDATE_RECT)
+    pygame.draw.rect(win, (255, 255, 255), UPDATE_RECT, 4)
     win.blit(ONLINE.ERRCONN, (120, 240))  # Show error message.
 
-    pygame.display.update()
+    # Only the popup changed, so only present its area.
+    pygame.display.update(UPDATE_RECT)
     for _ in range(50):
         pygame.time.delay(50)
         # Consume any pending events to keep the UI responsive.
@@ -50,26 +95,33 @@ def showLoading(win, errcode=0):
         errcode (int, optional): The error code determining which message is displayed.
                                  Zero indicates normal loading. Defaults to 0.
     """
-    pygame.draw.rect(win, (0, 0, 0), (100, 220, 300, 80))
-    pygame.draw.rect(win, (255, 255, 255), (100, 220, 300, 80), 4)
-    win.blit(ONLINE.ERR[errcode], (115, 240))  # Select the correct message from the error list.
+    def paint(layer, offset):
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), LOADING_RECT.move(-ox, -oy), 4)
+        # Select the correct message from the error list.
+        layer.blit(ONLINE.ERR[errcode], (115 - ox, 240 - oy))
+
+        if errcode != 0:
+            # Draw a button for going back if there's an error.
+            pygame.draw.rect(layer, (255, 255, 255), GOBACK_RECT.move(-ox, -oy), 2)
+            layer.blit(ONLINE.GOBACK, (220 - ox, 270 - oy))
+
+    pygame.display.update(
+        win.blit(_popupLayer(("loading", errcode), LOADING_RECT, paint), LOADING_RECT)
+    )
 
     if errcode == 0:
-        # If no error, simply update the display and return.
-        pygame.display.update()
+        # If no error, simply return.
         return
 
-    # Draw a button for going back if there's an error.
-    pygame.draw.rect(win, (255, 255, 255), (220, 270, 65, 20), 2)
-    win.blit(ONLINE.GOBACK, (220, 270))
-    pygame.display.update()
-
     # Wait for the user to click the button before closing the popup.
     while True:
         for event in pygame.event.get():
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if 220 < event.pos[0] < 285 and 270 < event.pos[1] < 290:
                     return
+        # Sleep for about a frame, instead of spinning at full CPU.
+        pygame.time.wait(16)
 
 
 def popup(win, sock, typ):
@@ -81,20 +133,23 @@ def popup(win, sock, typ):
         typ (str): The type of popup to display, such as 'left', 'resigned', or 'draw'.
                    Used to select the corresponding message in ONLINE.POPUP.
     """
-    pygame.draw.rect(win, (0, 0, 0), (130, 220, 240, 80))
-    pygame.draw.rect(win, (255, 255, 255), (130, 220, 240, 80), 4)
-    win.blit(ONLINE.POPUP[typ], (145, 240))
+    def paint(layer, offset):
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), POPUP_RECT.move(-ox, -oy), 4)
+        layer.blit(ONLINE.POPUP[typ], (145 - ox, 240 - oy))
+
+        # Draw a "Go Back" button on the popup.
+        pygame.draw.rect(layer, (255, 255, 255), GOBACK_RECT.move(-ox, -oy), 2)
+        layer.blit(ONLINE.GOBACK, (220 - ox, 270 - oy))
 
-    # Draw a "Go Back" button on the popup.
-    pygame.draw.rect(win, (255, 255, 255), (220, 270, 65, 20), 2)
-    win.blit(ONLINE.GOBACK, (220, 270))
-    pygame.display.update()
+    pygame.display.update(
+        win.blit(_popupLayer(("popup", typ), POPUP_RECT, paint), POPUP_RECT)
+    )
 
     ret = 3  # Default return value for multi-case usage.
     while True:
         # Check if there's an incoming "close" message to terminate the connection.
         if readable() and read() == "close":
-            write(sock, "quit")
             ret = 2
 
         # Wait for user to click the button to exit the popup.
@@ -104,6 +159,9 @@ def popup(win, sock, typ):
                     write(sock, "end")
                     return ret
 
+        # Sleep for at most a frame, waking up early if a message arrives.
+        waitReadable(0.016)
+
 
 def request(win, sock, key=None):
     """Display a request popup used for game initialization steps.
@@ -121,38 +179,44 @@ def request(win, sock, key=None):
     Returns:
         int: An integer code representing next action (e.g., start, quit, pass, etc.).
     """
-    if key is None:
+    def paintWait(layer, offset):
         # Display "waiting for the opponent" message.
-        pygame.draw.rect(win, (0, 0, 0), (100, 210, 300, 100))
-        pygame.draw.rect(win, (255, 255, 255), (100, 210, 300, 100), 4)
-        win.blit(ONLINE.REQUEST1[0], (120, 220))
-        win.blit(ONLINE.REQUEST1[1], (105, 245))
-        win.blit(ONLINE.REQUEST1[2], (135, 270))
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), REQUEST_WAIT_RECT.move(-ox, -oy), 4)
+        layer.blit(ONLINE.REQUEST1[0], (120 - ox, 220 - oy))
+        layer.blit(ONLINE.REQUEST1[1], (105 - ox, 245 - oy))
+        layer.blit(ONLINE.REQUEST1[2], (135 - ox, 270 - oy))
+
+    def paintAsk(layer, offset):
+        # Display a prompt to accept/decline a match request. The key code is drawn separately.
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), ASK_RECT.move(-ox, -oy), 4)
+        layer.blit(ONLINE.REQUEST2[0], (110 - ox, 175 - oy))
+        layer.blit(ONLINE.REQUEST2[1], (200 - ox, 175 - oy))
+        layer.blit(ONLINE.REQUEST2[2], (105 - ox, 200 - oy))
+        layer.blit(ONLINE.OK, (145 - ox, 240 - oy))
+        layer.blit(ONLINE.NO, (305 - ox, 240 - oy))
+        pygame.draw.rect(layer, (255, 255, 255), OK_RECT.move(-ox, -oy), 2)
+        pygame.draw.rect(layer, (255, 255, 255), NO_RECT.move(-ox, -oy), 2)
+
+    if key is None:
+        rect = win.blit(_popupLayer(("request", True), REQUEST_WAIT_RECT, paintWait), REQUEST_WAIT_RECT)
     else:
-        # Display a prompt to accept/decline a match request using a key code.
-        pygame.draw.rect(win, (0, 0, 0), (100, 160, 300, 130))
-        pygame.draw.rect(win, (255, 255, 255), (100, 160, 300, 130), 4)
-        win.blit(ONLINE.REQUEST2[0], (110, 175))
-        win.blit(ONLINE.REQUEST2[1], (200, 175))
-        win.blit(ONLINE.REQUEST2[2], (105, 200))
+        rect = win.blit(_popupLayer(("request", False), ASK_RECT, paintAsk), ASK_RECT)
         putNum(win, key, (160, 175))
-        win.blit(ONLINE.OK, (145, 240))
-        win.blit(ONLINE.NO, (305, 240))
-        pygame.draw.rect(win, (255, 255, 255), (140, 240, 50, 28), 2)
-        pygame.draw.rect(win, (255, 255, 255), (300, 240, 50, 28), 2)
 
-    pygame.display.flip()
+    # Only the popup changed, so only present its area.
+    pygame.display.update(rect)
     while True:
         for event in pygame.event.get():
-            # If user closes game window while waiting, signal a quit.
+            # If user closes game window while waiting, signal a quit. The
+            # "quit" message itself is sent once the online session ends.
             if key is None and event.type == pygame.QUIT:
-                write(sock, "quit")
                 return 0
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # If key is None and user clicks top-right corner, treat it like a quit.
                 if key is None and 460 < event.pos[0] < 500 and 0 < event.pos[1] < 50:
-                    write(sock, "quit")
                     return 1
 
                 # If key is not None, handle accept (OK) or decline (NO).
@@ -177,6 +241,9 @@ def request(win, sock, key=None):
                     write(sock, "ready")
                     return 4
 
+        # Sleep for at most a frame, waking up early if a message arrives.
+        waitReadable(0.016)
+
 
 def draw(win, sock, requester=True):
     """Display a popup to handle draw requests between players.
@@ -193,29 +260,35 @@ def draw(win, sock, requester=True):
     Returns:
         int: Code indicating the result of the request (draw accepted, rejected, or closed).
     """
-    if requester:
+    def paintWait(layer, offset):
         # Show 'Waiting for other player's decision about draw.'
-        pygame.draw.rect(win, (0, 0, 0), (100, 220, 300, 60))
-        pygame.draw.rect(win, (255, 255, 255), (100, 220, 300, 60), 4)
-        win.blit(ONLINE.DRAW1[0], (110, 225))
-        win.blit(ONLINE.DRAW1[1], (180, 250))
-    else:
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), DRAW_WAIT_RECT.move(-ox, -oy), 4)
+        layer.blit(ONLINE.DRAW1[0], (110 - ox, 225 - oy))
+        layer.blit(ONLINE.DRAW1[1], (180 - ox, 250 - oy))
+
+    def paintAsk(layer, offset):
         # Show accept/reject draw request UI.
-        pygame.draw.rect(win, (0, 0, 0), (100, 160, 300, 130))
-        pygame.draw.rect(win, (255, 255, 255), (100, 160, 300, 130), 4)
-        win.blit(ONLINE.DRAW2[0], (120, 170))
-        win.blit(ONLINE.DRAW2[1], (170, 195))
-        win.blit(ONLINE.OK, (145, 240))
-        win.blit(ONLINE.NO, (305, 240))
-        pygame.draw.rect(win, (255, 255, 255), (140, 240, 50, 28), 2)
-        pygame.draw.rect(win, (255, 255, 255), (300, 240, 50, 28), 2
-
-    pygame.display.flip()
+        ox, oy = offset
+        pygame.draw.rect(layer, (255, 255, 255), ASK_RECT.move(-ox, -oy), 4)
+        layer.blit(ONLINE.DRAW2[0], (120 - ox, 170 - oy))
+        layer.blit(ONLINE.DRAW2[1], (170 - ox, 195 - oy))
+        layer.blit(ONLINE.OK, (145 - ox, 240 - oy))
+        layer.blit(ONLINE.NO, (305 - ox, 240 - oy))
+        pygame.draw.rect(layer, (255, 255, 255), OK_RECT.move(-ox, -oy), 2)
+        pygame.draw.rect(layer, (255, 255, 255), NO_RECT.move(-ox, -oy), 2)
+
+    if requester:
+        rect = win.blit(_popupLayer(("draw", True), DRAW_WAIT_RECT, paintWait), DRAW_WAIT_RECT)
+    else:
+        rect = win.blit(_popupLayer(("draw", False), ASK_RECT, paintAsk), ASK_RECT)
+
+    # Only the popup changed, so only present its area.
+    pygame.display.update(rect)
     while True:
         for event in pygame.event.get():
-            # If the requester closes the game window, send "quit" signal.
+            # If the requester closes the game window, quit; "quit" is sent once the session ends.
             if requester and event.type == pygame.QUIT:
-                write(sock, "quit")
                 return 0
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -244,8 +317,11 @@ def draw(win, sock, requester=True):
                     # Opponent declined the draw request.
                     return 4
 
+        # Sleep for at most a frame, waking up early if a message arrives.
+        waitReadable(0.016)
+
 
-def showLobby(win, key, playerlist):
+def showLobby(win, key, playerlist, full=True):
     """Render the online Lobby screen, showing the list of active players and statuses.
 
     Allows the local user to see their own key, other players’ keys, and whether they are
@@ -255,17 +331,33 @@ def showLobby(win, key, playerlist):
         win (pygame.Surface): Surface on which the lobby is displayed.
         key (int): The local player's unique identifier.
         playerlist (list[str]): List of player entries with their key and status.
+        full (bool, optional): Whether to present the whole screen. When the last frame
+                               presented was the lobby too, only LIST_RECT can have changed,
+                               so False presents just that. Defaults to True.
     """
-    win.fill((0, 0, 0))  # Clear the screen to black before drawing UI elements.
-    
-    # Draw a title, bounding rectangles, and a "Go Back" button.
-    win.blit(ONLINE.LOBBY, (100, 14))
-    pygame.draw.rect(win, (255, 255, 255), (65, 10, 355, 68), 4)
-    win.blit(BACK, (460, 0))
-    win.blit(ONLINE.LIST, (20, 75))
-    win.blit(ONLINE.REFRESH, (270, 85))
-    pygame.draw.line(win, (255, 255, 255), (20, 114), (190, 114), 3)
-    pygame.draw.line(win, (255, 255, 255), (210, 114), (265, 114), 3)
+    global _lobby_cache
+    if _lobby_cache[0] == key:
+        # The static chrome was drawn before, so one blit also clears the screen.
+        win.blit(_lobby_cache[1], (0, 0))
+    else:
+        win.fill((0, 0, 0))  # Clear the screen to black before drawing UI elements.
+
+        # Draw a title, bounding rectangles, and a "Go Back" button.
+        win.blit(ONLINE.LOBBY, (100, 14))
+        pygame.draw.rect(win, (255, 255, 255), (65, 10, 355, 68), 4)
+        win.blit(BACK, (460, 0))
+        win.blit(ONLINE.LIST, (20, 75))
+        win.blit(ONLINE.REFRESH, (270, 85))
+        pygame.draw.line(win, (255, 255, 255), (20, 114), (190, 114), 3)
+        pygame.draw.line(win, (255, 255, 255), (210, 114), (265, 114), 3)
+
+        # Display the local user’s key in the bottom area of the screen.
+        win.blit(ONLINE.YOUARE, (100, 430))
+        pygame.draw.rect(win, (255, 255, 255), (250, 435, 158, 40), 3)
+        win.blit(ONLINE.PLAYER, (260, 440))
+        putLargeNum(win, key, (340, 440))
+
+        _lobby_cache = (key, win.copy())
 
     # If no players are present, display an "empty" message.
     if not playerlist:
@@ -292,10 +384,7 @@ def showLobby(win, key, playerlist):
         pygame.draw.rect(win, (255, 255, 255), (300, yCord + 2, 175, 26), 2)
         win.blit(ONLINE.REQ, (300, yCord))
 
-    # Display the local user’s key in the bottom area of the screen.
-    win.blit(ONLINE.YOUARE, (100, 430))
-    pygame.draw.rect(win, (255, 255, 255), (250, 435, 158, 40), 3)
-    win.blit(ONLINE.PLAYER, (260, 440))
-    putLargeNum(win, key, (340, 440))
-
-    pygame.display.update()
\ No newline at end of file
+    if full:
+        pygame.display.update()
+    else:
+        pygame.display.update(LIST_RECT)
\ No newline at end of file
@@ -17,6 +17,30 @@ Note:
 import os
 import pygame
 
+# Fonts already loaded by a TextBox, by (font name or path, size). The online
+# menu builds a new TextBox on every visit, and this spares it parsing the font
+# file again each time.
+_font_cache = {}
+
+def _getFont(font, size):
+    """Load a font, or reuse the one loaded earlier for the same name and size.
+
+    Args:
+        font (str): The font path or name of a system font.
+        size (int): The font size.
+
+    Returns:
+        pygame.font.Font: The loaded font.
+    """
+    key = (font, size)
+    if key not in _font_cache:
+        # Ensure the font exists; otherwise, try to match built-in system font.
+        # match_font gives None when nothing matches, and Font then falls back
+        # to Pygame's default font instead of failing.
+        path = font if os.path.isfile(font) else pygame.font.match_font(font)
+        _font_cache[key] = pygame.font.Font(path, size)
+    return _font_cache[key]
+
 class TextBox:
     """A high-level interactive text box widget implemented using Pygame.
 
@@ -34,12 +58,8 @@ class TextBox:
             rect (tuple): The rectangle defining the position and size (x, y, width, height).
             text (str, optional): Initial text content. Defaults to "".
         """
-        # Ensure the font exists; otherwise, try to match built-in system font.
-        if not os.path.isfile(font):
-            font = pygame.font.match_font(font)
-            
         # Set up the font with font size adjusted to the TextBox height.
-        self.font = pygame.font.Font(font, rect[3] - 8)
+        self.font = _getFont(font, rect[3] - 8)
         self.COLOR = color
         self.RECT = rect
         self.text = text
@@ -57,9 +77,84 @@ class TextBox:
         self.time = 0
         self.visible = True  # Visibility of the blinking cursor.
         self.SWITCHTIME = 600  # Milliseconds after which the cursor toggles visibility.
+
+        # Set whenever something drawn in the box changes; draw() only composes
+        # the internal surface again while it is set.
+        self._dirty = True
+        
+        # Surfaces are converted to the display's pixel format when a window is
+        # open, so blitting them never has to convert pixels on the fly.
+        self._convert = pygame.display.get_surface() is not None
+
+        # Handlers of the keys push() treats specially, by key code.
+        self._keymap = {
+            pygame.K_TAB: self._onIgnored,
+            pygame.K_ESCAPE: self._onIgnored,
+            pygame.K_KP_ENTER: self._onIgnored,
+            pygame.K_RSHIFT: self._onShift,
+            pygame.K_LSHIFT: self._onShift,
+            pygame.K_BACKSPACE: self._onBackspace,
+            pygame.K_DELETE: self._onDelete,
+            pygame.K_RIGHT: self._onRight,
+            pygame.K_LEFT: self._onLeft,
+            pygame.K_END: self._onEnd,
+            pygame.K_HOME: self._onHome,
+            pygame.K_RETURN: self._onReturn,
+        }
         
         # Create a surface for drawing text inside the TextBox.
-        self.surf = pygame.Surface(rect[2:])
+        self.surf = self._surface(rect[2:])
+
+        # Surface the text line is drawn on before being scrolled into the box.
+        # It is reused across frames and only grows when the text outgrows it.
+        self._textsurf = self._surface((rect[2] * 4, rect[3] - 8))
+
+        # The box frame is the same every frame: a black border around a white
+        # field, with a blue outline while focused. Draw both variants once so
+        # draw() only has to blit one of them.
+        self._frames = []
+        for active in (False, True):
+            frame = self._surface(rect[2:])
+            frame.fill((0, 0, 0))
+            pygame.draw.rect(frame, (255, 255, 255), (3, 3, rect[2] - 6, rect[3] - 6))
+            if active:
+                pygame.draw.rect(frame, (0, 0, 255), (2, 2, rect[2] - 5, rect[3] - 5), 2)
+            self._frames.append(frame)
+
+        # Rendered substrings of the current text, keyed by the substring itself.
+        # draw() asks for the same few slices every frame, so the font only
+        # renders again after the text is edited.
+        self._rendered = {}
+
+        # Pixel widths of every prefix of the text: _prefixwidths[i] is the
+        # width of text[:i]. Kept up to date by insert() and remove().
+        self._prefixwidths = [0]
+        self._rebuildPrefix(0)
+
+    def _rebuildPrefix(self, index):
+        """Recompute the prefix widths from the given text index onwards.
+
+        Prefixes shorter than the index are unaffected by an edit there, so
+        only the rest of the table is measured again.
+
+        Args:
+            index (int): Position of the first edited character.
+        """
+        text, size = self.text, self.font.size
+        del self._prefixwidths[index + 1:]
+        self._prefixwidths.extend(size(text[:i])[0] for i in range(index + 1, len(text) + 1))
+
+    def _surface(self, size):
+        """Create an opaque surface, in the display's pixel format if possible.
+
+        Args:
+            size (tuple): Width and height of the surface.
+
+        Returns:
+            pygame.Surface: The new surface.
+        """
+        surf = pygame.Surface(size)
+        return surf.convert() if self._convert else surf
 
     def renderText(self, indices=None):
         """Render a portion of the text using the configured font and color.
@@ -73,8 +168,17 @@ class TextBox:
         """
         if indices is None:
             indices = [0, len(self.text)]
-        # Render only the selected substring.
-        return self.font.render(self.text[indices[0]:indices[1]], True, self.COLOR)
+        # Render only the selected substring, reusing an earlier render if any.
+        # Whole substrings are cached rather than single characters, since
+        # gluing glyphs together would lose the kerning of the font.
+        text = self.text[indices[0]:indices[1]]
+        surf = self._rendered.get(text)
+        if surf is None:
+            surf = self.font.render(text, True, self.COLOR)
+            if self._convert:
+                surf = surf.convert_alpha()
+            self._rendered[text] = surf
+        return surf
         
     def insert(self, index, text):
         """Insert text at the specified cursor index.
@@ -85,6 +189,9 @@ class TextBox:
         """
         # Insert text and preserve the existing substring.
         self.text = self.text[:index] + text + self.text[index:]
+        self._rendered.clear()  # Drop the slices of the old text.
+        self._rebuildPrefix(index)
+        self._dirty = True
     
     def remove(self, indices):
         """Remove characters specified by indices.
@@ -100,6 +207,9 @@ class TextBox:
             indices = [indices, indices + 1]
         # Remove the specified substring.
         self.text = self.text[:indices[0]] + self.text[indices[1]:]
+        self._rendered.clear()  # Drop the slices of the old text.
+        self._rebuildPrefix(indices[0])
+        self._dirty = True
     
     def getLen(self, indices=None):
         """Calculate the rendered width of the specified text segment.
@@ -111,7 +221,14 @@ class TextBox:
         Returns:
             int: The width in pixels of the rendered text.
         """
-        # Leverage renderText to get accurate width measurement.
+        # Segments starting at the beginning of the text (the cursor position,
+        # the full width) come straight from the prefix table.
+        if indices is None:
+            return self._prefixwidths[-1]
+        if indices[0] == 0:
+            return self._prefixwidths[indices[1]]
+        # Other segments are measured on their render, since the width of a
+        # slice is not exactly a difference of prefixes once kerning applies.
         return self.renderText(indices).get_width()
            
     def push(self, event):
@@ -125,6 +242,7 @@ class TextBox:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.mouseheld = True
+            self._dirty = True  # Focus and selection may change.
             x, y = event.pos
             # Check if mouse click falls within the TextBox boundaries.
             if (self.RECT[0] < x < (self.RECT[0] + self.RECT[2]) and
@@ -144,109 +262,122 @@ class TextBox:
                 self.shiftheld = False
             
         elif event.type == pygame.KEYDOWN and self.active:
-            # Ignore certain keys that are reserved for navigation.
-            if event.key in [pygame.K_TAB, pygame.K_ESCAPE, pygame.K_KP_ENTER]:
-                pass
-            
-            elif event.key == pygame.K_RSHIFT or event.key == pygame.K_LSHIFT:
-                self.shiftheld = True
-            
-            elif event.key == pygame.K_BACKSPACE:
-                # Handle backspace: remove character before cursor if no selection.
+            self._dirty = True  # Cursor, selection, text or focus may change.
+            # Editing and navigation keys have their own handler; any other key
+            # that produces a character inserts it.
+            handler = self._keymap.get(event.key)
+            if handler is not None:
+                handler()
+            elif len(event.unicode) == 1:
+                self._onChar(event.unicode)
+
+    def _onIgnored(self):
+        """Do nothing for keys reserved for navigation between widgets."""
+
+    def _onShift(self):
+        """Start extending the selection with the arrow, Home and End keys."""
+        self.shiftheld = True
+
+    def _onBackspace(self):
+        """Remove the character before the cursor, or the selected text."""
+        if self.selected is None:
+            if self.cursor > 0:
+                self.cursor -= 1
+                self.remove(self.cursor)
+        else:
+            # Remove selected text if any.
+            self.cursor = self.selected[0]
+            self.remove(self.selected)
+            self.selected = None
+
+    def _onDelete(self):
+        """Remove the character at the cursor, or the selected text."""
+        if self.selected is None:
+            if self.cursor < len(self.text):
+                self.remove(self.cursor)
+        else:
+            # Remove selected text and reset selection.
+            self.cursor = self.selected[0]
+            self.remove(self.selected)
+            self.selected = None
+
+    def _onRight(self):
+        """Move the cursor right, extending the selection if shift is held."""
+        if self.cursor < len(self.text):
+            if self.shiftheld:
                 if self.selected is None:
-                    if self.cursor > 0:
-                        self.cursor -= 1
-                        self.remove(self.cursor)
-                else:
-                    # Remove selected text if any.
-                    self.cursor = self.selected[0]
-                    self.remove(self.selected)
+                    self.selected = [self.cursor, self.cursor + 1]
+                elif self.cursor == self.selected[1]:
+                    self.selected[1] += 1
+                elif self.cursor == self.selected[0]:
+                    self.selected[0] += 1
+                # Clear selection if it collapses.
+                if self.selected[0] == self.selected[1]:
                     self.selected = None
-                    
-            elif event.key == pygame.K_DELETE:
-                # Handle deletion: remove character at cursor if no selection.
+            else:
+                self.selected = None
+            self.cursor += 1
+
+    def _onLeft(self):
+        """Move the cursor left, extending the selection if shift is held."""
+        if self.cursor > 0:
+            self.cursor -= 1
+            if self.shiftheld:
                 if self.selected is None:
-                    if self.cursor < len(self.text):
-                        self.remove(self.cursor)
-                else:
-                    # Remove selected text and reset selection.
-                    self.cursor = self.selected[0]
-                    self.remove(self.selected)
+                    self.selected = [self.cursor, self.cursor + 1]
+                elif self.cursor == self.selected[0] - 1:
+                    self.selected[0] -= 1
+                elif self.cursor == self.selected[1] - 1:
+                    self.selected[1] -= 1
+                if self.selected[0] == self.selected[1]:
                     self.selected = None
-                        
-            elif event.key == pygame.K_RIGHT:
-                # Move cursor right, update selection if shift is held.
-                if self.cursor < len(self.text):
-                    if self.shiftheld:
-                        if self.selected is None:
-                            self.selected = [self.cursor, self.cursor + 1]
-                        elif self.cursor == self.selected[1]:
-                            self.selected[1] += 1
-                        elif self.cursor == self.selected[0]:
-                            self.selected[0] += 1
-                        # Clear selection if it collapses.
-                        if self.selected[0] == self.selected[1]:
-                            self.selected = None
-                    else:
-                        self.selected = None
-                    self.cursor += 1
-
-            elif event.key == pygame.K_LEFT:
-                # Move cursor left, update selection if shift is held.
-                if self.cursor > 0:
-                    self.cursor -= 1
-                    if self.shiftheld:
-                        if self.selected is None:
-                            self.selected = [self.cursor, self.cursor + 1]
-                        elif self.cursor == self.selected[0] - 1:
-                            self.selected[0] -= 1
-                        elif self.cursor == self.selected[1] - 1:
-                            self.selected[1] -= 1
-                        if self.selected[0] == self.selected[1]:
-                            self.selected = None
-                    else:
-                        self.selected = None
-                        
-            elif event.key == pygame.K_END:
-                # Move cursor to the end of the text, optionally extending selection.
-                if self.cursor < len(self.text):
-                    if self.shiftheld:
-                        if self.selected is None:
-                            self.selected = [self.cursor, len(self.text)]
-                        else:
-                            self.selected[1] = len(self.text)
-                    else:
-                        self.selected = None
-                    self.cursor = len(self.text)
-
-            elif event.key == pygame.K_HOME:
-                # Move cursor to the beginning of the text, optionally extending selection.
-                if self.cursor > 0:
-                    if self.shiftheld:
-                        if self.selected is None:
-                            self.selected = [0, self.cursor]
-                        else:
-                            self.selected[0] = 0
-                    else:
-                        self.selected = None
-                    self.cursor = 0
-                
-            elif event.key == pygame.K_RETURN:
-                # Deactivate the TextBox on Enter.
-                self.active = False
-                
-            elif len(event.unicode) == 1:
-                # Insert character: if text is selected, replace selection.
+            else:
+                self.selected = None
+
+    def _onEnd(self):
+        """Move the cursor to the end of the text, optionally extending the selection."""
+        if self.cursor < len(self.text):
+            if self.shiftheld:
                 if self.selected is None:
-                    self.insert(self.cursor, event.unicode)
-                    self.cursor += 1
+                    self.selected = [self.cursor, len(self.text)]
                 else:
-                    self.remove(self.selected)
-                    self.cursor = self.selected[0]
-                    self.selected = None
-                    self.insert(self.cursor, event.unicode)
-                    self.cursor += 1
-                        
+                    self.selected[1] = len(self.text)
+            else:
+                self.selected = None
+            self.cursor = len(self.text)
+
+    def _onHome(self):
+        """Move the cursor to the beginning of the text, optionally extending the selection."""
+        if self.cursor > 0:
+            if self.shiftheld:
+                if self.selected is None:
+                    self.selected = [0, self.cursor]
+                else:
+                    self.selected[0] = 0
+            else:
+                self.selected = None
+            self.cursor = 0
+
+    def _onReturn(self):
+        """Deactivate the TextBox on Enter."""
+        self.active = False
+
+    def _onChar(self, char):
+        """Insert a typed character, replacing the selected text if any.
+
+        Args:
+            char (str): The character to insert.
+        """
+        if self.selected is None:
+            self.insert(self.cursor, char)
+            self.cursor += 1
+        else:
+            self.remove(self.selected)
+            self.cursor = self.selected[0]
+            self.selected = None
+            self.insert(self.cursor, char)
+            self.cursor += 1
+
     def draw(self, win):
         """Draw the TextBox onto the provided surface.
 
@@ -258,54 +389,78 @@ class TextBox:
         """
         # Update timer for blinking cursor.
         self.time += self.clock.get_time()
-        if self.time >= self.SWITCHTIME:
+        blinked = self.time >= self.SWITCHTIME
+        if blinked:
             self.time %= self.SWITCHTIME
             self.visible = not self.visible
         
-        # Clear the internal surface and draw a border.
-        self.surf.fill((0, 0, 0))
-        pygame.draw.rect(self.surf, (255, 255, 255), 
-                         (3, 3, self.RECT[2] - 6, self.RECT[3] - 6))
-        
+        # The cursor only shows while the TextBox is focused, so the blink
+        # alone needs a new composition only then.
+        if self.active and blinked:
+            self._dirty = True
+
+        # Compose the internal surface again only if something changed since
+        # the previous frame; otherwise the last composition is still valid.
+        if self._dirty:
+            self._dirty = False
+            self._compose()
+
+        # Blit the TextBox surface onto the provided window.
+        win.blit(self.surf, self.RECT[:2])
+        self.clock.tick()  # Update the clock to manage frame rate.
+
+    def _compose(self):
+        """Draw the frame, text, selection and cursor onto the internal surface.
+
+        Called by [`draw`](Source/ext/pyBox.py) whenever the TextBox is dirty.
+        """
         # Determine the pixel position of the cursor.
         cursorpos = self.getLen([0, self.cursor])
         
-        # Create a temporary surface to render the text.
-        rendered = pygame.Surface((self.getLen() + 2, self.RECT[3] - 8))
-        rendered.fill((255, 255, 255))
+        # Clear the part of the text surface this frame uses, growing the
+        # surface first if the text no longer fits.
+        width = self.getLen() + 2
+        rendered = self._textsurf
+        if width > rendered.get_width():
+            rendered = self._textsurf = self._surface((width * 2, self.RECT[3] - 8))
+        area = (0, 0, width, self.RECT[3] - 8)
+        rendered.fill((255, 255, 255), area)
         
-        # If text is selected, draw a highlighted rectangle around the selection.
+        # If text is selected, fill a highlighted rectangle behind the selection.
         if self.selected is not None:
             selrect = (self.getLen([0, self.selected[0]]), 2,
                        self.getLen(self.selected), self.RECT[3] - 12)
-            pygame.draw.rect(rendered, (128, 220, 255), selrect)
+            rendered.fill((128, 220, 255), selrect)
             
         # Render the text onto the temporary surface.
         rendered.blit(self.renderText(), (0, 0))
         
-        if self.active:
-            # Draw an active border when the TextBox is focused.
-            pygame.draw.rect(self.surf, (0, 0, 255),
-                             (2, 2, self.RECT[2] - 5, self.RECT[3] - 5), 2)
-            # Only draw the blinking cursor if it is visible.
-            if self.visible:
-                pygame.draw.line(rendered, (0, 0, 0), (cursorpos, 2),
-                                 (cursorpos, self.RECT[3] - 12), 2)
+        # Only draw the blinking cursor if the TextBox is focused and the
+        # cursor is in its visible phase.
+        if self.active and self.visible:
+            pygame.draw.line(rendered, (0, 0, 0), (cursorpos, 2),
+                             (cursorpos, self.RECT[3] - 12), 2)
         
-        # Scroll text horizontally if necessary.
-        if rendered.get_width() > self.RECT[2] - 8:
+        # Collect the blits onto the internal surface, starting with the frame
+        # (with the active border when the TextBox is focused).
+        ops = [(self._frames[self.active], (0, 0))]
+
+        # Scroll text horizontally if necessary. Moving the scroll offset
+        # leaves the text out for this frame, so compose again on the next one.
+        if width > self.RECT[2] - 8:
             if cursorpos < self.startpos + 2:
                 self.startpos = cursorpos - 2
+                self._dirty = True
             elif cursorpos > self.startpos + self.RECT[2] - 6:
                 self.startpos = cursorpos - self.RECT[2] + 6
+                self._dirty = True
             else:
-                self.surf.blit(rendered, (4 - self.startpos, 4))
+                ops.append((rendered, (4 - self.startpos, 4), area))
         else:
-            self.surf.blit(rendered, (4, 4))
-            
-        # Blit the TextBox surface onto the provided window.
-        win.blit(self.surf, self.RECT[:2])
-        self.clock.tick()  # Update the clock to manage frame rate.
+            ops.append((rendered, (4, 4), area))
+
+        # Issue them in one call, without building the list of updated rects.
+        self.surf.blits(ops, False)
 
 # Basic sample usage for pyBox module.
 if __name__ == "__main__":
@@ -13,7 +13,11 @@ the online button on the main menu.
 import pygame
 from ext.pyBox import TextBox  # Provides an interactive text input box. [ext/pyBox.py](Source/ext/pyBox.py)
 from tools.loader import ONLINEMENU, BACK, FONT  # Reference to graphical resources [tools/loader.py](Source/tools/loader.py)
-from tools.utils import rounded_rect  # Utility to draw rounded rectangles [tools/utils.py](Source/tools/utils.py)
+from tools.utils import rounded_rect  # Drawing helpers [tools/utils.py](Source/tools/utils.py)
+
+# Everything on the menu except the selection highlight, drawn by showScreen
+# on its first call.
+_screen_cache = None
 
 def showScreen(win, sel):
     """Render the online menu screen with interactive elements.
@@ -25,24 +29,30 @@ def showScreen(win, sel):
         win (pygame.Surface): The display surface.
         sel (int): Index representing the current selection highlight.
     """
-    # Set background to black.
-    win.fill((0, 0, 0))
-    
-    # Draw header and main content area with rounded edges.
-    rounded_rect(win, (255, 255, 255), (120, 10, 260, 70), 20, 4)
-    rounded_rect(win, (255, 255, 255), (20, 90, 460, 400), 14, 4)
+    global _screen_cache
+    if _screen_cache is None:
+        _screen_cache = screen = pygame.Surface(win.get_size()).convert()
 
-    # Render header title and back button.
-    win.blit(ONLINEMENU.HEAD, (175, 15))
-    win.blit(BACK, (460, 0))
-    
-    # Render informational text lines sourced from the loader.
-    for cnt, line in enumerate(ONLINEMENU.TEXT):
-        win.blit(line, (40, 100 + cnt * 18))
-    
-    # Draw connect button with a rounded rectangle.
-    rounded_rect(win, (255, 255, 255), (300, 350, 110, 30), 10, 3)
-    win.blit(ONLINEMENU.CONNECT, (300, 350))
+        # Set background to black.
+        screen.fill((0, 0, 0))
+
+        # Draw header and main content area with rounded edges.
+        rounded_rect(screen, (255, 255, 255), (120, 10, 260, 70), 20, 4)
+        rounded_rect(screen, (255, 255, 255), (20, 90, 460, 400), 14, 4)
+
+        # Render header title and back button.
+        screen.blit(ONLINEMENU.HEAD, (175, 15))
+        screen.blit(BACK, (460, 0))
+
+        # Render informational text lines sourced from the loader in one call.
+        screen.blits([(line, (40, 100 + cnt * 18)) for cnt, line in enumerate(ONLINEMENU.TEXT)], False)
+
+        # Draw connect button with a rounded rectangle.
+        rounded_rect(screen, (255, 255, 255), (300, 350, 110, 30), 10, 3)
+        screen.blit(ONLINEMENU.CONNECT, (300, 350))
+
+    # Start from the static part of the menu.
+    win.blit(_screen_cache, (0, 0))
     
     # Draw selection highlight rectangle based on user's current option.
     pygame.draw.rect(win, (255, 255, 255), (130 + sel * 160, 460, 40, 20), 3)
@@ -66,20 +76,40 @@ def main(win):
     
     # Create an interactive text box for entering connection information.
     box = TextBox(FONT, (0, 0, 0), (65, 350, 200, 35))
+
+    # Set when the whole menu has to be drawn again; otherwise only the text
+    # box is redrawn and presented.
+    dirty = True
     
     while True:
         clock.tick(24)  # Limit the loop to 24 FPS for a consistent UI frame rate.
-        showScreen(win, sel)
-        
-        # Draw the text box border for clarity.
-        pygame.draw.rect(win, (255, 255, 255), (63, 348, 204, 39))
+        if dirty:
+            showScreen(win, sel)
+            # Draw the text box border for clarity.
+            pygame.draw.rect(win, (255, 255, 255), (63, 348, 204, 39))
         box.draw(win)
+
+        if dirty:
+            pygame.display.update()
+            dirty = False
+        else:
+            pygame.display.update(box.RECT)
+
+        # Nothing on screen changes on its own while the text box is not
+        # focused (its cursor only blinks when it is), so sleep until the
+        # next event instead of polling.
+        events = pygame.event.get()
+        if not events and not box.active:
+            events = [pygame.event.wait()]
         
-        for event in pygame.event.get():
+        for event in events:
             box.push(event)  # Forward event to the TextBox for text input handling.
             
             if event.type == pygame.QUIT:
                 return 0  # Exit the online menu when quit signal is received.
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                dirty = True  # The window contents were lost, draw everything.
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 x, y = event.pos
@@ -91,11 +121,11 @@ def main(win):
                 if 460 < y < 480:
                     if 130 < x < 170:
                         sel = 0
+                        dirty = True
                     if 290 < x < 320:
                         sel = 1
+                        dirty = True
                 
                 # If connect button area is clicked, return the entered text and selection flag.
                 if 300 < x < 410 and 350 < y < 380:
-                    return box.text, bool(sel)
-                    
-        pygame.display.update()
\ No newline at end of file
+                    return box.text, bool(sel)
\ No newline at end of file
@@ -15,8 +15,10 @@ import pygame
 from tools.loader import PREF, BACK  # Reference to [tools/loader.py](Source/tools/loader.py)
 from tools.utils import rounded_rect  # Reference to [tools/utils.py](Source/tools/utils.py)
 
-# List of valid preference keys.
-KEYS = ["sounds", "flip", "slideshow", "show_moves", "allow_undo", "show_clock"]
+# List of valid preference keys. The menu shows the first six; "animations" has no
+# menu entry and is only set in preferences.txt, e.g. "animations = False" to skip
+# the intro animation at the start of every game.
+KEYS = ["sounds", "flip", "slideshow", "show_moves", "allow_undo", "show_clock", "animations"]
 
 # Default preference values.
 DEFAULTPREFS = {
@@ -25,19 +27,59 @@ DEFAULTPREFS = {
     "slideshow": True,
     "show_moves": True,
     "allow_undo": True,
-    "show_clock": False
+    "show_clock": False,
+    "animations": True
 }
 
+# The six menu rows are 40 pixels tall and start every 60 pixels from y = 90.
+# Hovering the label of a row (from x_low to x = 220) shows its tooltip, drawn
+# as a black background rect with two lines of text on it. One entry per row:
+# (x_low, background rect, name of the tooltip lines in PREF, line positions).
+TOOLTIPS = [
+    (100, (30, 90, 195, 40), "SOUNDS_H", ((45, 90), (80, 110))),
+    (25, (15, 150, 210, 50), "FLIP_H", ((50, 150), (70, 170))),
+    (40, (15, 210, 210, 40), "SLIDESHOW_H", ((40, 210), (30, 230))),
+    (100, (15, 270, 210, 40), "MOVE_H", ((35, 270), (25, 290))),
+    (25, (15, 330, 210, 40), "UNDO_H", ((60, 330), (85, 350))),
+    (25, (15, 390, 210, 40), "CLOCK_H", ((50, 390), (40, 410))),
+]
+
+# Area of the menu holding the True/False options of the six rows. showScreen
+# draws it once per combination of preference values and blits the result.
+OPTIONS_RECT = pygame.Rect(225, 90, 230, 350)
+_options_cache = {}
+
+# Events the menu has no use for, blocked while it runs. Other events the
+# application never uses are blocked for good in pychess.py.
+IGNORED_EVENTS = [pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONUP]
+
+# Everything on the menu that never changes (frames, titles, labels and the
+# save button), drawn by showScreen on its first call.
+_screen_cache = None
+
+# Values accepted in preferences.txt, matched case-insensitively.
+BOOLS = {"true": True, "false": False}
+
+# Preferences as last read from or written to preferences.txt, so that load()
+# only parses the file once and save() can skip writing unchanged values.
+_prefs_cache = None
+
 
 def save(load):
     """Save user preferences to a text file.
 
     Opens (or creates) the preferences file and writes each key-value pair
-    in the format 'key = value' for later retrieval.
+    in the format 'key = value' for later retrieval. Nothing is written if the
+    preferences are the same as those already in the file.
 
     Args:
         load (dict): The current user preferences to be saved.
     """
+    global _prefs_cache
+    if load == _prefs_cache:
+        return
+    _prefs_cache = dict(load)
+
     with open(os.path.join("res", "preferences.txt"), "w") as f:
         for key, val in load.items():
             # Write a single preference setting and move to a new line.
@@ -49,39 +91,100 @@ def load():
 
     Reads the preferences file and converts string boolean values into actual booleans.
     If the file does not exist, it creates an empty file. Any unknown keys are filtered
-    out and missing keys are assigned their default values.
+    out and missing keys are assigned their default values. The file is only read on
+    the first call; later calls return a copy of the cached preferences.
 
     Returns:
         dict: A dictionary containing validated user preferences.
     """
+    global _prefs_cache
+    if _prefs_cache is not None:
+        return dict(_prefs_cache)
+
     path = os.path.join("res", "preferences.txt")
     if not os.path.exists(path):
         # Create the file if it does not exist.
         open(path, "w").close()
     
+    # Start from the defaults, so that missing keys keep their default value.
+    mydict = dict(DEFAULTPREFS)
     with open(path, "r") as f:
-        mydict = {}
         for line in f.read().splitlines():
             # Split each line into key and value.
             lsplit = line.split("=")
             if len(lsplit) == 2:
-                # Normalize and convert the value.
-                val = lsplit[1].strip().lower()
-                if val == "true":
-                    mydict[lsplit[0].strip()] = True
-                elif val == "false":
-                    mydict[lsplit[0].strip()] = False
-
-        # Remove any keys that are not defined in KEYS.
-        for key in list(mydict.keys()):
-            if key not in KEYS:
-                mydict.pop(key)
-        
-        # Ensure all keys have a value by assigning defaults if necessary.
-        for key in KEYS:
-            if key not in mydict:
-                mydict[key] = DEFAULTPREFS[key]
-        return mydict
+                # Normalize and convert the value; keys not in KEYS and values
+                # other than true/false are ignored.
+                key = lsplit[0].strip()
+                val = BOOLS.get(lsplit[1].strip().lower())
+                if key in KEYS and val is not None:
+                    mydict[key] = val
+
+    _prefs_cache = dict(mydict)
+    return mydict
+
+
+def _row(y):
+    """Find the menu row at a vertical position.
+
+    Args:
+        y (int): Vertical mouse position.
+
+    Returns:
+        int or None: Index of the row, or None if the position is outside all rows.
+    """
+    row, offset = divmod(y - 90, 60)
+    if 0 <= row < 6 and 0 < offset < 40:
+        return row
+    return None
+
+
+def _hoveredTip(x, y):
+    """Find the tooltip shown for a mouse position.
+
+    Args:
+        x (int): Horizontal mouse position.
+        y (int): Vertical mouse position.
+
+    Returns:
+        int or None: Row of the tooltip to show, or None if no tooltip applies.
+    """
+    row = _row(y)
+    if row is not None and TOOLTIPS[row][0] < x < 220:
+        return row
+    return None
+
+
+def _optionsLayer(values):
+    """Get the drawing of the True/False options for the given preference values.
+
+    Layers are cached in _options_cache, so each combination of values is only
+    drawn once; they cover OPTIONS_RECT on the black background of the menu.
+
+    Args:
+        values (tuple): The values of the six preferences shown in the menu.
+
+    Returns:
+        pygame.Surface: The options drawn for these values.
+    """
+    layer = _options_cache.get(values)
+    if layer is None:
+        layer = pygame.Surface(OPTIONS_RECT.size).convert()
+        layer.fill((0, 0, 0))
+        ox, oy = OPTIONS_RECT.topleft
+        for i, value in enumerate(values):
+            # Colon serves as a visual separator.
+            layer.blit(PREF.COLON, (225 - ox, 90 + (i * 60) - oy))
+            # Highlight the selection based on the Boolean value.
+            if value:
+                rounded_rect(layer, (255, 255, 255), (249 - ox, 92 + (60 * i) - oy, 80, 40), 8, 2)
+            else:
+                rounded_rect(layer, (255, 255, 255), (359 - ox, 92 + (60 * i) - oy, 90, 40), 8, 2)
+            # Render the boolean text labels.
+            layer.blit(PREF.TRUE, (250 - ox, 90 + (i * 60) - oy))
+            layer.blit(PREF.FALSE, (360 - ox, 90 + (i * 60) - oy))
+        _options_cache[values] = layer
+    return layer
 
 
 def prompt(win):
@@ -123,7 +226,7 @@ def prompt(win):
                         return False  # User declined (NO)
 
 
-def showScreen(win, prefs):
+def showScreen(win, prefs, pos=None):
     """Render the complete preferences menu screen.
 
     Draws the header, preference options, tooltips, and buttons on the display surface.
@@ -132,75 +235,56 @@ def showScreen(win, prefs):
     Args:
         win (pygame.Surface): The primary display surface.
         prefs (dict): The current user preferences to be displayed.
+        pos (tuple, optional): Mouse position deciding the tooltip shown. Defaults
+                               to the current position of the mouse.
     """
-    # Fill the background with black.
-    win.fill((0, 0, 0))
-    
-    # Draw header and content areas using rounded rectangles.
-    rounded_rect(win, (255, 255, 255), (70, 10, 350, 70), 20, 4)
-    rounded_rect(win, (255, 255, 255), (10, 85, 480, 360), 12, 4)
-    
-    # Display back button and header title.
-    win.blit(BACK, (460, 0))
-    win.blit(PREF.HEAD, (110, 15))
-    
-    # Draw tip area at the bottom.
-    rounded_rect(win, (255, 255, 255), (10, 450, 310, 40), 10, 3)
-    win.blit(PREF.TIP, (20, 450))
-    win.blit(PREF.TIP2, (55, 467))
-    
-    # Render labels for each preference option.
-    win.blit(PREF.SOUNDS, (90, 90))
-    win.blit(PREF.FLIP, (25, 150))
-    win.blit(PREF.SLIDESHOW, (40, 210))
-    win.blit(PREF.MOVE, (100, 270))
-    win.blit(PREF.UNDO, (25, 330))
-    win.blit(PREF.CLOCK, (25, 390))
+    global _screen_cache
+    if _screen_cache is None:
+        _screen_cache = screen = pygame.Surface(win.get_size()).convert()
+
+        # Fill the background with black.
+        screen.fill((0, 0, 0))
+
+        # Draw header and content areas using rounded rectangles.
+        rounded_rect(screen, (255, 255, 255), (70, 10, 350, 70), 20, 4)
+        rounded_rect(screen, (255, 255, 255), (10, 85, 480, 360), 12, 4)
+
+        # Display back button and header title.
+        screen.blit(BACK, (460, 0))
+        screen.blit(PREF.HEAD, (110, 15))
+
+        # Draw tip area at the bottom.
+        rounded_rect(screen, (255, 255, 255), (10, 450, 310, 40), 10, 3)
+        screen.blit(PREF.TIP, (20, 450))
+        screen.blit(PREF.TIP2, (55, 467))
+
+        # Render labels for each preference option in one call.
+        screen.blits((
+            (PREF.SOUNDS, (90, 90)),
+            (PREF.FLIP, (25, 150)),
+            (PREF.SLIDESHOW, (40, 210)),
+            (PREF.MOVE, (100, 270)),
+            (PREF.UNDO, (25, 330)),
+            (PREF.CLOCK, (25, 390)),
+        ), False)
+
+        # Draw the save button area; it lies below the options.
+        rounded_rect(screen, (255, 255, 255), (350, 452, 85, 40), 10, 2)
+        screen.blit(PREF.BSAVE, (350, 450))
+
+    # Start from the static part of the menu.
+    win.blit(_screen_cache, (0, 0))
     
     # Render the current state (True/False) for each preference key.
-    for i in range(6):
-        # Colon serves as a visual separator.
-        win.blit(PREF.COLON, (225, 90 + (i * 60)))
-        # Highlight the selection based on the Boolean value.
-        if prefs[KEYS[i]]:
-            rounded_rect(win, (255, 255, 255), (249, 92 + (60 * i), 80, 40), 8, 2)
-        else:
-            rounded_rect(win, (255, 255, 255), (359, 92 + (60 * i), 90, 40), 8, 2)
-        # Render the boolean text labels.
-        win.blit(PREF.TRUE, (250, 90 + (i * 60)))
-        win.blit(PREF.FALSE, (360, 90 + (i * 60)))
-    
-    # Draw the save button area.
-    rounded_rect(win, (255, 255, 255), (350, 452, 85, 40), 10, 2)
-    win.blit(PREF.BSAVE, (350, 450))
+    win.blit(_optionsLayer(tuple(prefs[key] for key in KEYS[:6])), OPTIONS_RECT)
     
     # Display helpful tooltips based on current mouse position.
-    x, y = pygame.mouse.get_pos()
-    if 100 < x < 220 and 90 < y < 130:
-        pygame.draw.rect(win, (0, 0, 0), (30, 90, 195, 40))
-        win.blit(PREF.SOUNDS_H[0], (45, 90))
-        win.blit(PREF.SOUNDS_H[1], (80, 110))
-    if 25 < x < 220 and 150 < y < 190:
-        pygame.draw.rect(win, (0, 0, 0), (15, 150, 210, 50))
-        win.blit(PREF.FLIP_H[0], (50, 150))
-        win.blit(PREF.FLIP_H[1], (70, 170))
-    if 40 < x < 220 and 210 < y < 250:
-        pygame.draw.rect(win, (0, 0, 0), (15, 210, 210, 40))
-        win.blit(PREF.SLIDESHOW_H[0], (40, 210))
-        win.blit(PREF.SLIDESHOW_H[1], (30, 230))
-    if 100 < x < 220 and 270 < y < 310:
-        pygame.draw.rect(win, (0, 0, 0), (15, 270, 210, 40))
-        win.blit(PREF.MOVE_H[0], (35, 270))
-        win.blit(PREF.MOVE_H[1], (25, 290))
-    if 25 < x < 220 and 330 < y < 370:
-        pygame.draw.rect(win, (0, 0, 0), (15, 330, 210, 40))
-        win.blit(PREF.UNDO_H[0], (60, 330))
-        win.blit(PREF.UNDO_H[1], (85, 350))
-    if 25 < x < 220 and 390 < y < 430:
-        pygame.draw.rect(win, (0, 0, 0), (15, 390, 210, 40))
-        win.blit(PREF.CLOCK_H[0], (50, 390))
-        win.blit(PREF.CLOCK_H[1], (40, 410))
-
+    tip = _hoveredTip(*(pos or pygame.mouse.get_pos()))
+    if tip is not None:
+        _, rect, name, positions = TOOLTIPS[tip]
+        pygame.draw.rect(win, (0, 0, 0), rect)
+        for line, linepos in zip(getattr(PREF, name), positions):
+            win.blit(line, linepos)
 
 def main(win):
     """Run the main preferences menu loop.
@@ -215,16 +299,50 @@ def main(win):
         int: Returns an integer as an exit code. Returning 0 indicates quitting,
         while 1 indicates returning to the main menu.
     """
+    # The menu only reacts to clicks, so key presses and button releases are
+    # kept out of the event queue while it runs.
+    pygame.event.set_blocked(IGNORED_EVENTS)
+    try:
+        return _loop(win)
+    finally:
+        pygame.event.set_allowed(IGNORED_EVENTS)
+
+
+def _loop(win):
+    """Run the event loop of the preferences menu for [`main`](Source/menus/pref.py).
+
+    Args:
+        win (pygame.Surface): The display window surface.
+
+    Returns:
+        int: 0 when quitting, 1 when returning to the main menu.
+    """
     prefs = load()
     clock = pygame.time.Clock()
+    shown = None  # Row of the tooltip on screen, None if there is none.
+    dirty = True  # Set when the screen has to be drawn again.
     while True:
         clock.tick(24)  # Maintain a steady 24 FPS for smooth UI updates.
-        showScreen(win, prefs)
+
+        # Mouse motion events are blocked, so hovering is polled; the screen
+        # only changes when the hovered tooltip does or after input.
+        pos = pygame.mouse.get_pos()
+        tip = _hoveredTip(*pos)
+        if dirty or tip != shown:
+            showScreen(win, prefs, pos)
+            pygame.display.update()
+            shown = tip
+            dirty = False
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT and prompt(win):
                 return 0  # Exit the application.
+
+            elif event.type in (pygame.QUIT, pygame.VIDEOEXPOSE):
+                dirty = True  # Redraw over a declined prompt or a lost window.
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                dirty = True
                 x, y = event.pos
                 # Detect if the user clicks the BACK button.
                 if 460 < x < 500 and 0 < y < 50 and prompt(win):
@@ -235,11 +353,10 @@ def main(win):
                     save(prefs)
                     return 1
                 
-                # Process toggle events for each preference option.
-                for i in range(6):
-                    if 90 + i * 60 < y < 130 + i * 60:
-                        if 250 < x < 330:
-                            prefs[KEYS[i]] = True
-                        if 360 < x < 430:
-                            prefs[KEYS[i]] = False
-        pygame.display.update()
\ No newline at end of file
+                # Process toggle events for the preference option in the clicked row.
+                i = _row(y)
+                if i is not None:
+                    if 250 < x < 330:
+                        prefs[KEYS[i]] = True
+                    if 360 < x < 430:
+                        prefs[KEYS[i]] = False
\ No newline at end of file
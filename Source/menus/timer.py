@@ -14,7 +14,23 @@ handle mouse events for user input, and return the chosen timer settings.
 import pygame
 
 from tools.loader import TIMER, BACK, putLargeNum
-from tools.utils import rounded_rect
+from tools.utils import rounded_rect, rounded_rect_layer
+
+# Time given to each player (in milliseconds) for every option of the first row,
+# which offers 30, 15, 10, 5, 3 and 1 minute games.
+DURATIONS = tuple((minutes * 60 * 1000,) * 2 for minutes in (30, 15, 10, 5, 3, 1))
+
+# Option boxes of the first row (game duration) and the second row.
+ROW1_RECTS = [pygame.Rect(110 + 40*i, 200, 28, 23) for i in range(6)]
+ROW2_RECTS = [pygame.Rect(110 + 40*i, 290, 28, 23) for i in range(5)]
+
+# Events the timer menu has no use for, blocked while it runs. Other events
+# the application never uses are blocked for good in pychess.py.
+IGNORED_EVENTS = [pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONUP]
+
+# Everything on the timer screen except the selection highlights, drawn by
+# showScreen on its first call.
+_screen_cache = None
 
 def start(win, load):
     """Display the initial prompt and capture the user's decision regarding timer activation.
@@ -42,19 +58,20 @@ def start(win, load):
     pygame.display.flip()
 
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check if the click is within the vertical bounds for button responses.
-                if 240 < event.pos[1] < 270:
-                    # Return None if YES is clicked.
-                    if 140 < event.pos[0] < 200:
-                        return None
-                    # Allow clock display if NO is clicked and the 'show_clock' preference is enabled.
-                    elif 300 < event.pos[0] < 350:
-                        if load["show_clock"]:
-                            return -1, (0, 0)
-                        else:
-                            return None, None
+        # Sleep until the next event instead of polling the queue in a busy loop.
+        event = pygame.event.wait()
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Check if the click is within the vertical bounds for button responses.
+            if 240 < event.pos[1] < 270:
+                # Return None if YES is clicked.
+                if 140 < event.pos[0] < 200:
+                    return None
+                # Allow clock display if NO is clicked and the 'show_clock' preference is enabled.
+                elif 300 < event.pos[0] < 350:
+                    if load["show_clock"]:
+                        return -1, (0, 0)
+                    else:
+                        return None, None
 
 def showScreen(win, sel, sel2):
     """Render the timer settings screen with selectable options.
@@ -67,36 +84,41 @@ def showScreen(win, sel, sel2):
         sel (int): Index corresponding to the first row selection (timer duration).
         sel2 (int): Index corresponding to the second row selection (alternate timer duration).
     """
-    # Clear screen and set background to black.
-    win.fill((0, 0, 0))
-    
-    # Draw header section with a rounded rectangle.
-    rounded_rect(win, (255, 255, 255), (70, 5, 340, 60), 15, 4)
-    win.blit(TIMER.HEAD, (100, 7))
-    win.blit(BACK, (460, 0))
+    global _screen_cache
+    if _screen_cache is None:
+        _screen_cache = screen = pygame.Surface(win.get_size()).convert()
 
-    # Draw the main content area.
-    rounded_rect(win, (255, 255, 255), (10, 70, 480, 420), 12, 4)
-    
-    # Render each line of instruction text with proper vertical spacing.
-    for cnt, i in enumerate(TIMER.TEXT):
-        y = 75 + cnt * 18
-        win.blit(i, (20, y))
-        
-    # Draw timer option boxes for the first row.
-    for i in range(6):
-        pygame.draw.rect(win, (255, 255, 255), (110 + 40*i, 200, 28, 23), 3)
-        
-    # Draw timer option boxes for the second row.
-    for i in range(5):
-        pygame.draw.rect(win, (255, 255, 255), (110 + 40*i, 290, 28, 23), 3)
+        # Clear screen and set background to black.
+        screen.fill((0, 0, 0))
+
+        # Draw header section with a rounded rectangle, drawn once and cached.
+        screen.blit(rounded_rect_layer((255, 255, 255), (340, 60), 15, 4), (70, 5))
+        screen.blit(TIMER.HEAD, (100, 7))
+        screen.blit(BACK, (460, 0))
+
+        # Draw the main content area.
+        screen.blit(rounded_rect_layer((255, 255, 255), (480, 420), 12, 4), (10, 70))
+
+        # Render each line of instruction text with proper vertical spacing.
+        screen.blits([(i, (20, 75 + cnt * 18)) for cnt, i in enumerate(TIMER.TEXT)], False)
+
+        # Draw timer option boxes for the first row.
+        for rect in ROW1_RECTS:
+            pygame.draw.rect(screen, (255, 255, 255), rect, 3)
+
+        # Draw timer option boxes for the second row.
+        for rect in ROW2_RECTS:
+            pygame.draw.rect(screen, (255, 255, 255), rect, 3)
+
+        # Draw the confirmation button.
+        pygame.draw.rect(screen, (255, 255, 255), (300, 416, 50, 23), 3)
+
+    # Start from the static part of the screen.
+    win.blit(_screen_cache, (0, 0))
         
     # Highlight the current selections.
-    pygame.draw.rect(win, (50, 100, 150), (110 + 40*sel, 200, 28, 23), 3) 
-    pygame.draw.rect(win, (50, 100, 150), (110 + 40*sel2, 290, 28, 23), 3)
-        
-    # Draw the confirmation button.
-    pygame.draw.rect(win, (255, 255, 255), (300, 416, 50, 23), 3)    
+    pygame.draw.rect(win, (50, 100, 150), ROW1_RECTS[sel], 3)
+    pygame.draw.rect(win, (50, 100, 150), ROW2_RECTS[sel2], 3)
     pygame.display.update()
 
 def main(win, load):
@@ -113,6 +135,25 @@ def main(win, load):
         tuple: A tuple containing the selection index for the timer settings and a tuple
         of timer durations in milliseconds.
     """
+    # The timer menu only reacts to clicks, so key presses and button releases
+    # are kept out of the event queue while it runs.
+    pygame.event.set_blocked(IGNORED_EVENTS)
+    try:
+        return _loop(win, load)
+    finally:
+        pygame.event.set_allowed(IGNORED_EVENTS)
+
+
+def _loop(win, load):
+    """Run the prompt and the event loop of the timer menu for [`main`](Source/menus/timer.py).
+
+    Args:
+        win (pygame.Surface): Display window surface.
+        load (dict): User configuration and preference dictionary.
+
+    Returns:
+        tuple or int: The return value of [`main`](Source/menus/timer.py).
+    """
     # Start with the initial prompt screen.
     ret = start(win, load)
     if ret is not None:
@@ -120,15 +161,23 @@ def main(win, load):
 
     sel = sel2 = 0
     clock = pygame.time.Clock()
+    shown = None  # Selections on screen, None before the first frame.
 
     # Main event loop for managing timer option selection.
     while True:
         clock.tick(24)  # Limit the loop to 24 FPS for smooth interaction.
-        showScreen(win, sel, sel2)
+        # Only draw the screen again when a selection changed.
+        if (sel, sel2) != shown:
+            showScreen(win, sel, sel2)
+            shown = (sel, sel2)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return 0  # Exit if the Pygame QUIT event is triggered.
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                # The window contents were lost, draw them again.
+                shown = None
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 x, y = event.pos
@@ -138,29 +187,15 @@ def main(win, load):
                 
                 # When the confirmation button is clicked, return the selected timer values.
                 if 300 < x < 350 and 416 < y < 439:
-                    # Mapping selections to corresponding durations (in milliseconds).
-                    if sel == 0:
-                        temp = (30 * 60 * 1000,) * 2
-                    elif sel == 1:
-                        temp = (15 * 60 * 1000,) * 2
-                    elif sel == 2:
-                        temp = (10 * 60 * 1000,) * 2
-                    elif sel == 3:
-                        temp = (5 * 60 * 1000,) * 2
-                    elif sel == 4:
-                        temp = (3 * 60 * 1000,) * 2
-                    elif sel == 5:
-                        temp = (1 * 60 * 1000,) * 2
-                    return sel2, temp
+                    # Map the selection to its durations (in milliseconds).
+                    return sel2, DURATIONS[sel]
                 
-                # Update the first-row selection based on mouse x-coordinate.
-                for i in range(6):
-                    if 110 + 40*i < x < 138 + 40*i and 200 < y < 223:
-                        sel = i
-                        break
-                        
-                # Update the second-row selection based on mouse x-coordinate.
-                for i in range(5):
-                    if 110 + 40*i < x < 138 + 40*i and 290 < y < 313:
-                        sel2 = i
-                        break
\ No newline at end of file
+                # Update the selection of the row whose option box was clicked,
+                # testing all boxes of a row in one collidelist call.
+                point = pygame.Rect(x, y, 1, 1)
+                i = point.collidelist(ROW1_RECTS)
+                if i != -1:
+                    sel = i
+                i = point.collidelist(ROW2_RECTS)
+                if i != -1:
+                    sel2 = i
\ No newline at end of file
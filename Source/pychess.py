@@ -15,58 +15,107 @@ Usage:
     Run this file to launch the Chess application.
 """
 
-import sys  
 import pygame
 
-import chess
-import menus
-from tools.loader import MAIN
 from tools import sound
 
-# Flush stdout to ensure external programs calling this application
-# receive any pending output immediately.
-sys.stdout.flush()
-
 # Initialize Pygame and the clock for frame rate control.
 pygame.init()
 clock = pygame.time.Clock()
 
-# Set up the display window. Use Pygame's SCALED mode if using Pygame 2 or above.
+# Set up the display window. Use Pygame's SCALED mode with double buffering and
+# vsync if using Pygame 2 or above, and on pygame-ce also ask for a
+# hardware-accelerated surface.
 if pygame.version.vernum[0] >= 2:
-    win = pygame.display.set_mode((500, 500), pygame.SCALED)
+    flags = pygame.SCALED | pygame.DOUBLEBUF
+    if hasattr(pygame, "IS_CE"):
+        flags |= pygame.HWSURFACE
+    try:
+        # Present frames in step with the monitor refresh, without tearing.
+        win = pygame.display.set_mode((500, 500), flags, vsync=1)
+    except pygame.error:
+        # Not every renderer supports vsync.
+        win = pygame.display.set_mode((500, 500), flags)
 else:
     win = pygame.display.set_mode((500, 500))
+
+# Import the modules using the images and texts of tools/loader.py only now that
+# the window exists, so that the loader converts them to the display format as
+# it loads them and no blit has to convert pixels on every frame.
+import chess
+import menus
+from tools.loader import MAIN
+
 pygame.display.set_caption("Chess")
 pygame.display.set_icon(MAIN.ICON)
 
-# Define rectangle coordinates for the "Multiplayer" and "Online" buttons.
-mult = (280, 200, 200, 40)  # Multiplayer button: (x, y, width, height)
-onln = (360, 260, 120, 40)  # Online button
+# No screen reacts to mouse motion, wheel or focus events (hover effects poll
+# the mouse position instead), nor to joysticks or touch fingers, so SDL drops
+# them before they reach the queue. Text input events stay allowed: the text
+# boxes insert the unicode of key presses, which Pygame 2 takes from them.
+# The same goes for the Pygame 2 window notifications other than exposure.
+# Blocking them also keeps the menus that sleep in pygame.event.wait from
+# waking up for nothing.
+# Some of these events only exist in Pygame 2, hence the name lookup.
+pygame.event.set_blocked([
+    getattr(pygame, name) for name in (
+        "MOUSEMOTION", "MOUSEWHEEL", "ACTIVEEVENT", "JOYAXISMOTION", "JOYBALLMOTION",
+        "JOYHATMOTION", "JOYBUTTONDOWN", "JOYBUTTONUP", "FINGERMOTION", "FINGERDOWN",
+        "FINGERUP", "MULTIGESTURE", "WINDOWENTER", "WINDOWLEAVE",
+        "WINDOWFOCUSGAINED", "WINDOWFOCUSLOST", "WINDOWTAKEFOCUS", "WINDOWMOVED",
+    ) if hasattr(pygame, name)
+])
 
-def showMain(prefs):
+# Define rectangle coordinates for the "Multiplayer" and "Online" buttons.
+mult = pygame.Rect(280, 200, 200, 40)  # Multiplayer button: (x, y, width, height)
+onln = pygame.Rect(360, 260, 120, 40)  # Online button
+
+# The buttons in hit-test order and their highlighted texts; a button is
+# referred to by its index in these lists.
+BUTTONS = [mult, onln]
+BUTTON_HOVERS = [MAIN.MULTI_H, MAIN.ONLINE_H]
+
+# Areas of the window covered by the button texts, presented again when only
+# the hover highlight of the buttons changes.
+BUTTON_RECTS = [MAIN.MULTI.get_rect(topleft=mult.topleft), MAIN.ONLINE.get_rect(topleft=onln.topleft)]
+
+# Texts drawn over the background on every frame, passed to a single blits call.
+MENU_BLITS = [
+    (MAIN.HEADING, (80, 20)),
+    (MAIN.VERSION, (345, 95)),
+    (MAIN.MULTI, mult.topleft),
+    (MAIN.ONLINE, onln.topleft),
+]
+
+def showMain(prefs, hover):
     """
     Render the main menu screen.
 
     This function updates the background animation if enabled in user preferences,
-    displays the heading and version information, and renders the interactive menu buttons.
+    displays the heading and version information, and renders the interactive menu buttons,
+    highlighting the hovered ones. The window is only drawn again when what it shows
+    changes, i.e. on slideshow and fade steps or when the hover state changes.
 
     Args:
         prefs (dict): Dictionary containing user preferences and settings.
+        hover (int): Index in BUTTONS of the button under the mouse, or -1.
+
+    Returns:
+        list or None: The areas of the window to present with pygame.display.update,
+        or None when nothing changed since the previous frame.
     """
-    global cnt, img
+    global cnt, img, shown
 
     # Display the current background image based on the animation frame.
-    win.blit(MAIN.BG[img], (0, 0))
+    bg = img
+    alpha = 0
 
     if prefs["slideshow"]:
         # Increment frame counter to control slideshow timing and opacity
         cnt += 1
         if cnt >= 150:
             # Start fading effect after 5 seconds (150 frames) at approximately 30 fps.
-            s = pygame.Surface((500, 500))
-            s.set_alpha((cnt - 150) * 4)  # Gradually increase opacity for fade-out.
-            s.fill((0, 0, 0))
-            win.blit(s, (0, 0))
+            alpha = (cnt - 150) * 4  # Gradually increase opacity for fade-out.
 
         if cnt == 210:
             # Reset counter after 7 seconds and update the background image index.
@@ -77,24 +126,47 @@ def showMain(prefs):
         cnt = -150
         img = 0
 
-    # Render header and version texts along with decorative lines.
-    win.blit(MAIN.HEADING, (80, 20))
+    # Skip the frame entirely if it would look the same as the one on screen.
+    frame = (bg, alpha, hover)
+    if frame == shown:
+        return None
+    full = shown is None or frame[:2] != shown[:2]
+    shown = frame
+
+    win.blit(MAIN.BG[bg], (0, 0))
+    if alpha:
+        FADE.set_alpha(alpha)
+        win.blit(FADE, (0, 0))
+
+    # Render header and version texts and the "Multiplayer" and "Online" button
+    # texts in one call, then the decorative lines.
+    win.blits(MENU_BLITS, False)
     pygame.draw.line(win, (255, 255, 255), (80, 100), (130, 100), 4)
     pygame.draw.line(win, (255, 255, 255), (165, 100), (340, 100), 4)
-    win.blit(MAIN.VERSION, (345, 95))
 
-    # Render the "Multiplayer" and "Online" button texts at the specified positions.
-    win.blit(MAIN.MULTI, mult[:2])
-    win.blit(MAIN.ONLINE, onln[:2])
+    # Highlight the button the cursor is over.
+    if hover != -1:
+        win.blit(BUTTON_HOVERS[hover], BUTTONS[hover].topleft)
+
+    # A new background or fade step changes the whole window; a hover change
+    # only changes the buttons.
+    return [win.get_rect()] if full else BUTTON_RECTS
 
 # Initialize global variables for background animation.
 cnt = 0   # Frame counter used for slideshow timing.
 img = 0   # Index tracking the current background image.
 run = True  # Control variable for the main loop.
 
+# Black layer blitted over the background with a growing alpha to fade it out.
+FADE = pygame.Surface((500, 500)).convert()
+FADE.fill((0, 0, 0))
+
+# What the window shows, as (background image, fade alpha, hovered button);
+# None makes showMain draw the whole window on the next frame.
+shown = None
+
 # Load player settings from the preferences module.
 prefs = menus.pref.load()
-print(prefs)   # Print preferences for debugging purposes.
 
 # Start background music based on user preferences.
 music = sound.Music()
@@ -103,18 +175,14 @@ music.play(prefs)
 while run:
     # Maintain the loop at approximately 30 frames per second.
     clock.tick(30)
-    showMain(prefs)
 
     # Get current mouse position for hover effects.
-    x, y = pygame.mouse.get_pos()
+    hover = pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelist(BUTTONS)
 
-    # Highlight the Multiplayer button if the cursor is over it.
-    if mult[0] < x < sum(mult[::2]) and mult[1] < y < sum(mult[1::2]):
-        win.blit(MAIN.MULTI_H, mult[:2])
-
-    # Highlight the Online button if the cursor is over it.
-    if onln[0] < x < sum(onln[::2]) and onln[1] < y < sum(onln[1::2]):
-        win.blit(MAIN.ONLINE_H, onln[:2])
+    # Draw the menu and present only what changed.
+    dirty = showMain(prefs, hover)
+    if dirty:
+        pygame.display.update(dirty)
 
     # Process all events captured by Pygame.
     for event in pygame.event.get():
@@ -122,33 +190,35 @@ while run:
             # Terminate the application if the window is closed.
             run = False
 
+        elif event.type == pygame.VIDEOEXPOSE:
+            # The window contents were lost, draw everything on the next frame.
+            shown = None
+
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # Handle mouse click events by determining the clicked button region.
-            x, y = event.pos
-
-            if mult[0] < x < sum(mult[::2]) and mult[1] < y < sum(mult[1::2]):
+            hit = pygame.Rect(event.pos, (1, 1)).collidelist(BUTTONS)
+            if hit == 0:
                 # When Multiplayer button is clicked, provide immediate feedback and launch the multiplayer menu.
                 sound.play_click(prefs)
                 ret = menus.timermenu(win, prefs)
+                shown = None  # The menu drew over the window.
                 # Handle the return value from the timer menu.
                 if ret == 0:
                     run = False
                 elif ret != 1:
                     run = chess.multiplayer(win, ret[0], ret[1], prefs)
 
-            elif onln[0] < x < sum(onln[::2]) and onln[1] < y < sum(onln[1::2]):
+            elif hit == 1:
                 # When Online button is clicked, provide immediate feedback and launch the online menu.
                 sound.play_click(prefs)
                 ret = menus.onlinemenu(win)
+                shown = None  # The menu drew over the window.
                 # Process the online menu outcome.
                 if ret == 0:
                     run = False
                 elif ret != 1:
                     run = chess.online(win, ret[0], prefs, ret[1])
 
-    # Refresh the display after all updates.
-    pygame.display.flip()
-
 # Clean up resources after exiting the main loop.
 music.stop()
 pygame.quit()
\ No newline at end of file
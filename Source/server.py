@@ -19,9 +19,11 @@ Requirements:
     - Python 3.6 or above
 """
 
+import os
 import queue
 import random
 import socket
+import sys
 import threading
 import time
 from urllib.request import urlopen
@@ -31,9 +33,13 @@ LOG = False
 IPV6 = False
 
 # Server version and network configuration parameters.
-VERSION = "v1.0"
+VERSION = "v1.1"
 PORT = 26104
 START_TIME = time.perf_counter()
+# TCP keepalive timing of client connections: probe after 10 idle seconds, every
+# 5 seconds, and drop the connection after 3 unanswered probes.
+KEEPALIVE = (("TCP_KEEPIDLE", 10), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3))
+SOCKBUF = 4096  # Send and receive buffer size of client connections, in bytes
 LOGFILENAME = time.asctime().replace(" ", "_").replace(":", "-")
 
 # Global variables that track connected clients and server state.
@@ -41,22 +47,51 @@ busyPpl = set()    # Set of player keys currently busy in a game
 end = False        # Flag to indicate server shutdown
 lock = False       # Flag to lock the server (prevent new connections)
 logQ = queue.Queue()   # Queue to buffer log output
-players = []       # List of connected players as tuples (socket, key)
+players = {}       # Connected players, mapping each player key to its socket
+buffers = {}       # Received bytes of each client socket that do not form a full message yet
 total = totalsuccess = 0  # Statistics for total and successful connection attempts
+# Guards players, busyPpl and the statistics, which every client thread and the
+# admin thread share. Never held across socket I/O.
+stateLock = threading.Lock()
+# Bounds the client threads alive at once: the 10 players plus a few connections
+# still in their handshake. Connections beyond it are closed without a thread.
+connSlots = threading.BoundedSemaphore(16)
+
+# Framed bytes of the fixed protocol messages, so write does not encode them again
+# on every call. Other messages are framed as they are sent.
+_framed_cache = {
+    msg: bytes((len(msg),)) + msg.encode("utf-8") for msg in (
+        "quit", "start", "nostart", "msgOk", "close", "errVer", "errBusy",
+        "errLock", "errPBusy", "errKey", "ready", "draw", "resign", "end",
+    )
+}
+
+# Last public IP found by getIp, as (ip, time.perf_counter() of the lookup).
+_pubip_cache = None
+
+# Framed messages ending a game session in game.
+QUIT_FRAME = _framed_cache["quit"]
+GAME_END_FRAMES = frozenset(_framed_cache[msg] for msg in ("draw", "resign", "end"))
 
 def makeInt(num):
     """Convert a string to an integer safely.
 
+    Player keys reach this both as ints and as the digits sent by clients, so
+    ints are returned as they are and strings are checked instead of raising
+    and catching a ValueError for every invalid key.
+
     Args:
-        num (str): The input string representing a number.
+        num (str or int): The input string representing a number, or a number.
 
     Returns:
-        int or None: The converted integer or None if conversion fails.
+        int or None: The converted integer, or None if conversion fails or num
+        is neither an int nor a str (e.g. None).
     """
-    try:
-        return int(num)
-    except ValueError:
+    if isinstance(num, int):
+        return num
+    if not isinstance(num, str):
         return None
+    return int(num) if num.isdecimal() else None
 
 def getTime():
     """Calculate the elapsed time since the server started.
@@ -73,15 +108,22 @@ def getTime():
 def getIp(public):
     """Retrieve the public or private IP address of the server.
 
+    The public IP is looked up online at most every 5 minutes; lookups give up
+    after 3 seconds so the admin console is not stuck on a slow network.
+
     Args:
         public (bool): If True, fetch the public IP; otherwise, get the local address.
 
     Returns:
         str: The detected IP address. Falls back to '127.0.0.1' on error.
     """
+    global _pubip_cache
     if public:
+        if _pubip_cache is not None and time.perf_counter() - _pubip_cache[1] < 300:
+            return _pubip_cache[0]
         try:
-            ip = urlopen("https://api64.ipify.org").read().decode()
+            ip = urlopen("https://api64.ipify.org", timeout=3).read().decode()
+            _pubip_cache = (ip, time.perf_counter())
         except Exception:
             ip = "127.0.0.1"
     else:
@@ -93,6 +135,25 @@ def getIp(public):
                 ip = '127.0.0.1'
     return ip
 
+def hasConsole():
+    """Check whether messages printed to stdout can reach anyone.
+
+    Returns:
+        bool: False when there is no stdout (e.g. under pythonw) or it is
+        redirected to the null device, True otherwise.
+    """
+    if sys.stdout is None:
+        return False
+    try:
+        out = os.fstat(sys.stdout.fileno())
+        null = os.stat(os.devnull)
+    except (OSError, ValueError, AttributeError):
+        return True
+    return (out.st_dev, out.st_ino) != (null.st_dev, null.st_ino)
+
+# Whether log prints messages at all; checked once, as stdout does not change.
+CONSOLE = hasConsole()
+
 def log(data, key=None, adminput=False):
     """Log messages with context for both players and administrative commands.
 
@@ -102,6 +163,10 @@ def log(data, key=None, adminput=False):
         adminput (bool): If True, indicates an administrator command.
     """
     global logQ
+    # Skip building the message when neither the console nor a log file gets it.
+    if data is not None and not LOG and (adminput or not CONSOLE):
+        return
+
     # Construct message header based on the origin of the log message.
     if adminput:
         text = ""
@@ -113,20 +178,48 @@ def log(data, key=None, adminput=False):
     if data is not None:
         text += data
         # Print non-admin messages to stdout for real-time feedback.
-        if not adminput:
+        if not adminput and CONSOLE:
             print(text)
-        # Buffer the log message if logging is enabled.
+        # Buffer the log message if logging is enabled; the log thread adds the
+        # timestamp, so that formatting it stays off the calling thread.
         if LOG:
-            logQ.put(time.asctime() + ": " + text + "\n")
+            logQ.put((time.time(), text))
     else:
         # None signals termination of the logging thread.
         logQ.put(None)
 
+def readFrame(sock, timeout=None):
+    """Receive one message from a client socket without decoding it.
+
+    Every message is prefixed with a single byte holding its length. Data is read
+    in large chunks into a per-socket buffer, and one complete message is taken
+    from it per call, so TCP fragmentation or coalescing cannot break messages apart.
+
+    Args:
+        sock (socket.socket): The client socket.
+        timeout (float, optional): Timeout duration in seconds.
+
+    Returns:
+        bytes or None: The message with its length byte, or None if an error occurs.
+    """
+    buf = buffers.setdefault(sock, bytearray())
+    try:
+        sock.settimeout(timeout)
+        while not buf or len(buf) <= buf[0]:
+            data = sock.recv(4096)
+            if not data:
+                return None
+            buf += data
+        size = buf[0]
+        frame = bytes(buf[:size + 1])
+        del buf[:size + 1]
+    except Exception:
+        return None
+    return frame
+
 def read(sock, timeout=None):
     """Receive and decode a message from a client socket.
 
-    This function handles timeouts and ensures the message is properly formatted.
-    
     Args:
         sock (socket.socket): The client socket.
         timeout (float, optional): Timeout duration in seconds.
@@ -134,44 +227,61 @@ def read(sock, timeout=None):
     Returns:
         str: The decoded message or "quit" if an error occurs.
     """
+    frame = readFrame(sock, timeout)
     try:
-        sock.settimeout(timeout)
-        msg = sock.recv(8).decode("utf-8").strip()
+        msg = frame[1:].decode("utf-8")
     except Exception:
         msg = "quit"
     return msg if msg else "quit"
  
-def write(sock, msg):
-    """Send a message to the specified client socket with fixed-length padding.
+def write(sock, *msgs):
+    """Send one or more messages to the specified client socket, each prefixed with its length.
 
-    This wrapper ensures that messages are sent in a consistent 8-byte format
-    to handle TCP packet fragmentation and potential packet loss gracefully.
+    This wrapper frames every message with a single length byte so the client
+    can split the messages back apart, however TCP fragments or coalesces them.
+    All the messages are sent with a single sendall call.
 
     Args:
         sock (socket.socket): The target client socket.
-        msg (str): The message to be sent.
+        *msgs (str): The messages to be sent. Empty messages are skipped.
     """
-    if msg:
-        buffedmsg = msg + (" " * (8 - len(msg)))  # Pad message to 8 characters.
-        try:
-            sock.sendall(buffedmsg.encode("utf-8"))
-        except Exception:
-            pass
+    data = bytearray()
+    for msg in msgs:
+        framed = _framed_cache.get(msg)
+        if framed is not None:
+            data += framed
+        elif msg:
+            encoded = msg.encode("utf-8")
+            data.append(len(encoded))
+            data += encoded
+    if data:
+        sendRaw(sock, data)
+
+def sendRaw(sock, data):
+    """Send already framed messages to a client socket, ignoring send errors.
+
+    Args:
+        sock (socket.socket): The target client socket.
+        data (bytes or bytearray): One or more messages, each with its length byte.
+    """
+    try:
+        sock.sendall(data)
+    except Exception:
+        pass
 
 def genKey():
     """Generate a unique 4-digit key for a new player.
 
-    Iteratively generates a random key and checks that it isn't assigned to another player.
+    Draws random keys until one isn't assigned to another player. Call it with
+    stateLock held, so that the key can be registered before another thread draws.
 
     Returns:
         int: A unique player key.
     """
-    key = random.randint(1000, 9999)
-    for player in players:
-        if player[1] == key:
-            # Recursively generate a new key if collision occurs.
-            return genKey()
-    return key
+    while True:
+        key = random.randint(1000, 9999)
+        if key not in players:
+            return key
 
 def getByKey(key):
     """Retrieve the socket corresponding to the given player key.
@@ -182,35 +292,52 @@ def getByKey(key):
     Returns:
         socket.socket or None: The player's socket if found; otherwise, None.
     """
-    for player in players:
-        if player[1] == makeInt(key):
-            return player[0]
+    return players.get(makeInt(key))
+
+def rmPlayer(key):
+    """Remove a player from the connected players.
+
+    Args:
+        key (int): The player's key.
+    """
+    with stateLock:
+        players.pop(key, None)
+
+def mkBusy(key, oKey):
+    """Mark a player and the opponent they challenge as busy (engaged in a game).
 
-def mkBusy(*keys):
-    """Mark one or more players as busy (engaged in a game).
+    Nothing is marked if the opponent is busy already. The check and the marking
+    are done under the state lock, so two players challenging the same opponent
+    at once cannot both get them.
 
     Args:
-        *keys: Variable length player keys.
+        key (int): Key of the challenging player.
+        oKey (int): Key of the challenged opponent.
+
+    Returns:
+        bool: True if both players were marked busy, False if the opponent was busy.
     """
-    global busyPpl
-    for key in keys:
-        busyPpl.add(makeInt(key))
+    with stateLock:
+        if oKey in busyPpl:
+            return False
+        busyPpl.update((key, oKey))
+        return True
 
 def rmBusy(*keys):
     """Mark one or more players as no longer busy.
 
     Args:
-        *keys: Variable length player keys.
+        *keys (int): Variable length player keys.
     """
-    global busyPpl
-    for key in keys:
-        busyPpl.discard(makeInt(key))
+    with stateLock:
+        busyPpl.difference_update(keys)
 
 def game(sock1, sock2):
     """Facilitate message exchange between two players during a game session.
 
     This function relays messages from one player's socket to the other's until
-    the game ends or one player sends "quit".
+    the game ends or one player sends "quit". Messages are relayed as the framed
+    bytes they arrived in, without decoding and encoding them again.
 
     Args:
         sock1 (socket.socket): Socket of the initiating player.
@@ -220,11 +347,15 @@ def game(sock1, sock2):
         bool: True if a disconnection occurred during the match; False otherwise.
     """
     while True:
-        msg = read(sock1)
-        write(sock2, msg)
-        if msg == "quit":
+        frame = readFrame(sock1)
+        if frame is None or len(frame) == 1:
+            # Disconnected, or an empty message, which read treats as "quit" too.
+            write(sock2, "quit")
+            return True
+        sendRaw(sock2, frame)
+        if frame == QUIT_FRAME:
             return True
-        elif msg in ["draw", "resign", "end"]:
+        elif frame in GAME_END_FRAMES:
             return False
 
 def player(sock, key):
@@ -243,21 +374,28 @@ def player(sock, key):
             return
         elif msg == "pStat":
             log("Request for player statistics received.", key)
-            latestplayers = list(players)
-            latestbusy = list(busyPpl)
+            with stateLock:
+                latestplayers = list(players)
+                latestbusy = set(busyPpl)
             # Allow status reporting only when player count is within reasonable limits.
             if 0 < len(latestplayers) < 11:
-                write(sock, "enum" + str(len(latestplayers) - 1))
-                for _, i in latestplayers:
-                    if i != key:
-                        # Append status indicator: "b" for busy, "a" for active.
-                        write(sock, str(i) + ("b" if i in latestbusy else "a"))
+                # Send the count and every entry as one batch instead of one send each.
+                # Append status indicator: "b" for busy, "a" for active.
+                write(sock, "enum" + str(len(latestplayers) - 1), *(
+                    str(i) + ("b" if i in latestbusy else "a")
+                    for i in latestplayers if i != key
+                ))
         elif msg.startswith("rg"):
             log(f"Received game request to play with Player{msg[2:]}", key)
-            oSock = getByKey(msg[2:])
+            # Convert the opponent's key once; busyPpl and players hold int keys.
+            oKey = makeInt(msg[2:])
+            if oKey is None:
+                log(f"Player{key} sent an invalid key", key)
+                write(sock, "errKey")
+                continue
+            oSock = getByKey(oKey)
             if oSock is not None:
-                if makeInt(msg[2:]) not in busyPpl:
-                    mkBusy(key, msg[2:])
+                if mkBusy(key, oKey):
                     write(oSock, "gr" + str(key))
                     write(sock, "msgOk")
                     newMsg = read(sock)
@@ -296,124 +434,143 @@ def logThread():
     """Continuously flush log messages from the buffer to a server log file.
 
     This background thread ensures that all log messages are written to disk.
-    When a None message is encountered, the thread terminates.
+    It sleeps on the queue until messages arrive, writes each burst of them and
+    flushes the file, which stays open. When a None message is encountered, the
+    thread terminates.
     """
     global logQ
-    while True:
-        time.sleep(1)
-        with open("SERVER_LOG_" + LOGFILENAME + ".txt", "a") as f:
-            while not logQ.empty():
-                data = logQ.get()
+    with open("SERVER_LOG_" + LOGFILENAME + ".txt", "a") as f:
+        while True:
+            data = logQ.get()
+            while True:
                 if data is None:
                     return
-                else:
-                    f.write(data)
+                stamp, text = data
+                f.write(time.asctime(time.localtime(stamp)) + ": " + text + "\n")
+                try:
+                    data = logQ.get_nowait()
+                except queue.Empty:
+                    break
+            f.flush()
+
+def adminReport():
+    """Log the server statistics and the connected players ('report')."""
+    # Take a consistent snapshot of the state, then log outside the lock.
+    with stateLock:
+        latestplayers = list(players)
+        latestbusy = set(busyPpl)
+        attempts, successes = total, totalsuccess
+    log(f"{len(latestplayers)} players online; {len(latestplayers) - len(latestbusy)} active.")
+    log(f"{attempts} connection attempts, {successes} successful")
+    log(f"Active threads: {threading.active_count()}")
+    log(f"Uptime: {getTime()}")
+    if latestplayers:
+        log("Connected Players:")
+        for cnt, player in enumerate(latestplayers):
+            status = "Busy" if player in latestbusy else "Active"
+            log(f" {cnt+1}. Player{player} - Status: {status}")
+
+def adminPublicIp():
+    """Log the public IP of the server ('mypublicip')."""
+    log("Determining public IP; please wait...")
+    PUBIP = getIp(public=True)
+    if PUBIP == "127.0.0.1":
+        log("Error: Unable to determine public IP.")
+    else:
+        log(f"Public IP: {PUBIP}")
 
-def kickDisconnectedThread():
-    """Periodically check for and remove disconnected clients.
+def adminLock():
+    """Block new connections ('lock')."""
+    global lock
+    if lock:
+        log("Server is already locked.")
+    else:
+        lock = True
+        log("Server locked: New connections are now blocked.")
+
+def adminUnlock():
+    """Accept new connections again ('unlock')."""
+    global lock
+    if lock:
+        lock = False
+        log("Server unlocked: New connections are now accepted.")
+    else:
+        log("Server is already in an unlocked state.")
 
-    This background thread iterates over the list of players and attempts a
-    non-intrusive message send. If a client does not respond properly, the player
-    is removed from the active list.
+def adminKick(keys):
+    """Disconnect the given players ('kick <keys>').
+
+    Args:
+        keys (str): Whitespace separated player keys.
     """
-    global players
-    while True:
-        time.sleep(10)
-        for sock, key in players.copy():
-            try:
-                ret = sock.send(b"........")
-            except Exception:
-                ret = 0
-            if ret > 0:
-                cntr = 0
-                diff = 8
-                while True:
-                    cntr += 1
-                    if cntr == 8:
-                        ret = 0
-                        break
-                    if ret == diff:
-                        break
-                    diff -= ret
-                    try:
-                        ret = sock.send(b"." * diff)
-                    except Exception:
-                        ret = 0
-                        break
-            if ret == 0:
-                log(f"Player{key} disconnected. Removing from active players list.")
-                try:
-                    players.remove((sock, key))
-                except Exception:
-                    pass
+    for k in keys.split():
+        sock = getByKey(k)
+        if sock is not None:
+            write(sock, "close")
+            log(f"Kicking Player{k}")
+        else:
+            log(f"Player{k} does not exist.")
+
+def adminKickAll():
+    """Disconnect every connected player ('kickall')."""
+    log("Kicking all connected players.")
+    with stateLock:
+        socks = list(players.values())
+    for sock in socks:
+        write(sock, "close")
+
+def adminQuit():
+    """Disconnect every player and shut the server down ('quit').
+
+    Returns:
+        bool: True, which ends [`adminThread`](Source/server.py).
+    """
+    global end, lock
+    lock = True
+    log("Kicking all players and shutting down server.")
+    with stateLock:
+        socks = list(players.values())
+    for sock in socks:
+        write(sock, "close")
+    log("Exiting application – Goodbye!")
+    log(None)  # Signal log thread termination.
+    end = True
+    # Connect to self to unblock the main accept loop.
+    if IPV6:
+        with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as s:
+            s.connect(("::1", PORT, 0, 0))
+    else:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.connect(("127.0.0.1", PORT))
+    return True
+
+# Handlers of the admin commands without arguments; a handler returning True
+# ends the admin thread. 'kick <keys>' is the only command taking arguments.
+ADMIN_COMMANDS = {
+    "report": adminReport,
+    "mypublicip": adminPublicIp,
+    "lock": adminLock,
+    "unlock": adminUnlock,
+    "kickall": adminKickAll,
+    "quit": adminQuit,
+}
 
 def adminThread():
     """Process administrative commands entered via the server console.
 
-    This thread handles runtime admin commands such as 'report', 'kick', 'lock', and 'quit'.
-    It provides real-time logging and feedback for server management.
+    This thread handles runtime admin commands such as 'report', 'kick', 'lock', and 'quit',
+    looking them up in ADMIN_COMMANDS. It provides real-time logging and feedback
+    for server management.
     """
-    global end, lock
     while True:
         msg = input().strip()
         log(msg, adminput=True)
-        if msg == "report":
-            log(f"{len(players)} players online; {len(players) - len(busyPpl)} active.")
-            log(f"{total} connection attempts, {totalsuccess} successful")
-            log(f"Active threads: {threading.active_count()}")
-            log(f"Uptime: {getTime()}")
-            if players:
-                log("Connected Players:")
-                for cnt, (_, player) in enumerate(players):
-                    status = "Busy" if player in busyPpl else "Active"
-                    log(f" {cnt+1}. Player{player} - Status: {status}")
-        elif msg == "mypublicip":
-            log("Determining public IP; please wait...")
-            PUBIP = getIp(public=True)
-            if PUBIP == "127.0.0.1":
-                log("Error: Unable to determine public IP.")
-            else:
-                log(f"Public IP: {PUBIP}")
-        elif msg == "lock":
-            if lock:
-                log("Server is already locked.")
-            else:
-                lock = True
-                log("Server locked: New connections are now blocked.")
-        elif msg == "unlock":
-            if lock:
-                lock = False
-                log("Server unlocked: New connections are now accepted.")
-            else:
-                log("Server is already in an unlocked state.")
+        handler = ADMIN_COMMANDS.get(msg)
+        if handler is not None:
+            if handler():
+                return
         elif msg.startswith("kick "):
-            for k in msg[5:].split():
-                sock = getByKey(k)
-                if sock is not None:
-                    write(sock, "close")
-                    log(f"Kicking Player{k}")
-                else:
-                    log(f"Player{k} does not exist.")
-        elif msg == "kickall":
-            log("Kicking all connected players.")
-            for sock, _ in players.copy():
-                write(sock, "close")
-        elif msg == "quit":
-            lock = True
-            log("Kicking all players and shutting down server.")
-            for sock, _ in players.copy():
-                write(sock, "close")
-            log("Exiting application – Goodbye!")
-            log(None)  # Signal log thread termination.
-            end = True
-            # Connect to self to unblock the main accept loop.
-            if IPV6:
-                with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as s:
-                    s.connect(("::1", PORT, 0, 0))
-            else:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.connect(("127.0.0.1", PORT))
-            return
+            adminKick(msg[5:])
         else:
             log(f"Invalid command: '{msg}'. Refer to 'onlinehowto.txt' for command usage.")
 
@@ -428,7 +585,22 @@ def initPlayerThread(sock):
     """
     global players, total, totalsuccess
     log("New client attempting to connect.")
-    total += 1
+    with stateLock:
+        total += 1
+    # Relayed moves are tiny messages, so send them right away instead of letting
+    # Nagle's algorithm hold them back. Accepted sockets do not inherit the option
+    # on every platform, so it is set on each of them.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    # Let TCP probe idle connections, so that the blocking read of a client that
+    # vanished without closing its socket fails and its thread removes it. The
+    # timing options are not available on every platform.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Messages are at most 256 bytes, so small kernel buffers are plenty.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKBUF)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKBUF)
+    for name, value in KEEPALIVE:
+        if hasattr(socket, name):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
     # Check client's protocol header.
     if read(sock, 3) != "PyChess":
         log("Invalid client header; closing connection.")
@@ -436,27 +608,75 @@ def initPlayerThread(sock):
     elif read(sock, 3) != VERSION:
         log("Client version mismatch; closing connection.")
         write(sock, "errVer")
-    elif len(players) >= 10:
-        log("Server busy; rejecting connection.")
-        write(sock, "errBusy")
-    elif lock:
-        log("Server locked; rejecting new connection.")
-        write(sock, "errLock")
     else:
-        totalsuccess += 1
-        key = genKey()
-        log(f"Connection successful. Assigned key: {key}")
-        players.append((sock, key))
-        write(sock, "key" + str(key))
-        player(sock, key)
-        write(sock, "close")
-        log(f"Player{key} has disconnected.")
+        # Check the player limit and the lock, then draw the key and register it,
+        # all in one step, so that concurrent handshakes can neither exceed the
+        # limit nor take the same key. The rejections are sent after releasing it.
+        key = None
+        with stateLock:
+            if len(players) >= 10:
+                err = "errBusy"
+            elif lock:
+                err = "errLock"
+            else:
+                totalsuccess += 1
+                key = genKey()
+                players[key] = sock
+
+        if key is None:
+            if err == "errBusy":
+                log("Server busy; rejecting connection.")
+            else:
+                log("Server locked; rejecting new connection.")
+            write(sock, err)
+        else:
+            log(f"Connection successful. Assigned key: {key}")
+            write(sock, "key" + str(key))
+            player(sock, key)
+            write(sock, "close")
+            log(f"Player{key} has disconnected.")
+            rmPlayer(key)
+            rmBusy(key)
+    buffers.pop(sock, None)
+    sock.close()
+
+def listenSock(family):
+    """Create the listening socket of the server.
+
+    Args:
+        family (int): The address family, socket.AF_INET or socket.AF_INET6.
+
+    Returns:
+        socket.socket: A TCP socket that can be bound to PORT right after a restart,
+        serving both IPv6 and IPv4 clients in the IPv6 case.
+    """
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+        # On Windows SO_REUSEADDR would let other programs bind the same port,
+        # and lingering connections do not block binding it again anyway.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        # Bind the port again at once after a restart, while connections of the
+        # previous run still linger in TIME_WAIT.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if family == socket.AF_INET6 and hasattr(socket, "IPV6_V6ONLY"):
+        # Accept IPv4 clients on the IPv6 socket too, where the system allows it.
         try:
-            players.remove((sock, key))
-        except Exception:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+        except OSError:
             pass
-        rmBusy(key)
-    sock.close()
+    return sock
+
+def clientThread(sock):
+    """Serve a client connection and free its connection slot afterwards.
+
+    Args:
+        sock (socket.socket): The client's socket connection.
+    """
+    try:
+        initPlayerThread(sock)
+    finally:
+        connSlots.release()
 
 
 # Main server socket initialization and configuration.
@@ -465,11 +685,11 @@ log("Initializing server...")
 
 if IPV6:
     log("IPv6 configuration enabled (non-default).")
-    mainSock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+    mainSock = listenSock(socket.AF_INET6)
     mainSock.bind(("::", PORT, 0, 0))
 else:
     log("Using default IPv4 configuration.")
-    mainSock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    mainSock = listenSock(socket.AF_INET)
     mainSock.bind(("0.0.0.0", PORT))
     IP = getIp(public=False)
     if IP == "127.0.0.1":
@@ -478,12 +698,13 @@ else:
         log(f"Local IP detected: {IP}")
         log("For local clients, please use this IP address.")
     
-mainSock.listen(16)
+# A generous backlog, so that the kernel does not refuse bursts of connections
+# before the accept loop gets to them.
+mainSock.listen(128)
 log(f"Server listening on port {PORT}\n")
 
-# Start background threads for admin commands and client management.
+# Start background threads for admin commands and logging.
 threading.Thread(target=adminThread).start()
-threading.Thread(target=kickDisconnectedThread, daemon=True).start()
 if LOG:
     log("Logging enabled. Starting log thread.")
     threading.Thread(target=logThread).start()
@@ -493,6 +714,10 @@ while True:
     s, _ = mainSock.accept()
     if end:
         break
-    threading.Thread(target=initPlayerThread, args=(s,), daemon=True).start()
+    if not connSlots.acquire(blocking=False):
+        # Too many connections at once; refuse this one without starting a thread.
+        s.close()
+        continue
+    threading.Thread(target=clientThread, args=(s,), daemon=True).start()
 
 mainSock.close()
\ No newline at end of file
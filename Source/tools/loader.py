@@ -13,20 +13,74 @@ and images into classes for easy access by various parts of the application.
 """
 
 import os.path
+import sys
 import pygame
 
-# Initialize the pygame.font module so that fonts can be loaded.
+# Initialize the pygame.font module so that fonts can be loaded. It stays
+# initialized, as the text boxes of the menus create fonts of their own later.
 pygame.font.init()
 
+def _convert(surf, alpha=True):
+    """
+    Convert a loaded image or rendered text to the display format, if the window exists.
+
+    Surfaces in the display format are blitted without converting their pixels on
+    every call. [pychess.py](Source/pychess.py) creates the window before importing
+    this module; when it is imported without a window the surface is kept as is.
+
+    Args:
+        surf (pygame.Surface): The surface to convert.
+        alpha (bool): Keep per-pixel transparency (convert_alpha) or not (convert).
+
+    Returns:
+        pygame.Surface: The converted surface, or surf itself without a window.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+def _load(path, alpha=True):
+    """
+    Load an image and convert it with [`_convert`](Source/tools/loader.py).
+
+    Args:
+        path (str): Path of the image file.
+        alpha (bool): Whether the image has transparent parts.
+
+    Returns:
+        pygame.Surface: The loaded image.
+    """
+    return _convert(pygame.image.load(path), alpha)
+
+# Texts rendered by the fonts below, keyed by (font, text, antialias, color). The
+# menus draw these surfaces without ever modifying them, so a text rendered again
+# with the same font and color (the many YES/NO, "Go Back", "SinglePlayer"...)
+# shares the surface rendered the first time.
+_render_cache = {}
+
+class _Font(pygame.font.Font):
+    """
+    A font whose rendered texts are converted with [`_convert`](Source/tools/loader.py)
+    and cached in _render_cache.
+    """
+    def render(self, *args, **kwargs):
+        if kwargs:
+            return _convert(super().render(*args, **kwargs))
+
+        key = (self,) + args
+        if key not in _render_cache:
+            _render_cache[key] = _convert(super().render(*args))
+        return _render_cache[key]
+
 # Set the path for the custom font used in the application.
 FONT = os.path.join("res", "Asimov.otf")
 
 # Load fonts in various sizes for different UI elements.
-head = pygame.font.Font(FONT, 80)
-large = pygame.font.Font(FONT, 50)
-medium = pygame.font.Font(FONT, 38)
-small = pygame.font.Font(FONT, 27)
-vsmall = pygame.font.Font(FONT, 17)
+head = _Font(FONT, 80)
+large = _Font(FONT, 50)
+medium = _Font(FONT, 38)
+small = _Font(FONT, 27)
+vsmall = _Font(FONT, 17)
 
 # Define common RGB color constants for drawing text and graphics.
 WHITE = (255, 255, 255)
@@ -42,26 +96,46 @@ BLNUM = [small.render(str(i), True, BLACK) for i in range(10)]
 SLASH = vsmall.render("/", True, WHITE)
 COLON = vsmall.render(":", True, WHITE)
 
+def _twoDigits(num):
+    """
+    Compose the two pre-rendered digits of a number below 100 into one surface.
+
+    The digits are placed as [`putNum`](Source/tools/loader.py) places them, so
+    blitting the result draws the same pixels as putNum with a zero-padded number.
+
+    Args:
+        num (int): The number to compose, from 0 to 99.
+
+    Returns:
+        pygame.Surface: A transparent surface holding both digits.
+    """
+    surf = pygame.Surface((9 + NUM[0].get_width(), NUM[0].get_height()), pygame.SRCALPHA)
+    surf.blits(((NUM[num // 10], (0, 0)), (NUM[num % 10], (9, 0))), False)
+    return surf
+
+# Pre-composed "00" to "99", the fields of the date-time strings drawn by putDT.
+TWO_DIGIT = [_twoDigits(i) for i in range(100)]
+
 def putNum(win, num, pos):
     """
     Render a number string on the specified surface using very small font.
 
-    This function iterates over each character in the number, rendering it individually.
+    Every digit is drawn from its pre-rendered surface, all of them in a single blits call.
     
     Args:
         win (pygame.Surface): Surface on which the number will be drawn.
         num (int or str): The number to be rendered.
         pos (tuple): The (x, y) coordinates where the first digit will be placed.
     """
-    for cnt, i in enumerate(list(str(num))):
-        # Offset each digit to avoid visual overlap.
-        win.blit(NUM[int(i)], (pos[0] + (cnt * 9), pos[1]))
+    # Offset each digit to avoid visual overlap; ord(i) - 48 is the digit's value.
+    win.blits([(NUM[ord(i) - 48], (pos[0] + (cnt * 9), pos[1])) for cnt, i in enumerate(str(num))], False)
 
 def putLargeNum(win, num, pos, white=True):
     """
     Render a number string on the specified surface using a larger font.
 
-    The function chooses between white or black colored numbers based on the flag.
+    The function chooses between white or black colored numbers based on the flag,
+    and draws all the digits in a single blits call.
     
     Args:
         win (pygame.Surface): Surface on which the number will be drawn.
@@ -69,42 +143,48 @@ def putLargeNum(win, num, pos, white=True):
         pos (tuple): The (x, y) coordinates where the first digit will be placed.
         white (bool): If True, renders the number in white; otherwise, in black.
     """
-    for cnt, i in enumerate(list(str(num))):
-        color_choice = LNUM if white else BLNUM
-        win.blit(color_choice[int(i)], (pos[0] + (cnt * 14), pos[1]))
+    color_choice = LNUM if white else BLNUM
+    win.blits([(color_choice[ord(i) - 48], (pos[0] + (cnt * 14), pos[1])) for cnt, i in enumerate(str(num))], False)
 
 def putDT(win, DT, pos):
     """
     Display a formatted date and time string on the provided surface.
 
-    The date-time string is expected to have a format of "dd/mm/yyyy hh:mm:ss".
-    It splits the string into date and time components, renders each part, and
-    places slashes and colons accordingly to maintain the expected formatting.
+    The date-time string is expected to have a format of "d/m/yyyy h:m:s", with a
+    four-digit year. The other fields may or may not be zero-padded; the saved
+    games write them without padding, so they are found by splitting rather than
+    at fixed offsets. Each field is drawn from the pre-composed TWO_DIGIT surfaces
+    (the year as two of them), with slashes and colons in between, all in a
+    single blits call.
     
     Args:
         win (pygame.Surface): Surface on which the date-time string will be drawn.
-        DT (str): A string representing date and time (e.g., "31/12/2022 23:59:59").
+        DT (str): A string representing date and time (e.g., "31/12/2022 23:59:59"
+                  or "1/2/2022 3:04:5").
         pos (tuple): The starting (x, y) coordinates for the date portion.
     """
     var = DT.split()  # Split into [date, time]
-    date = var[0].split("/")
-    time_part = var[1].split(":")
-
-    # Render each date segment with appropriate spacing.
-    for cnt, num in enumerate(map(lambda x: format(int(x), "02"), date)):
-        putNum(win, num, (pos[0] + 24 * cnt - 5, pos[1]))
-
-    # Render the slash separators between day, month, and year.
-    win.blit(SLASH, (pos[0] + 13, pos[1]))
-    win.blit(SLASH, (pos[0] + 35, pos[1]))
-
-    # Render each time segment (hours, minutes, seconds) below the date.
-    for cnt, num in enumerate(map(lambda x: format(int(x), "02"), time_part)):
-        putNum(win, num, (pos[0] + 24 * cnt, pos[1] + 21))
-
-    # Render the colon separators between hours, minutes, and seconds.
-    win.blit(COLON, (pos[0] + 20, pos[1] + 21))
-    win.blit(COLON, (pos[0] + 44, pos[1] + 21))
+    day, month, year = map(int, var[0].split("/"))
+    hour, minute, sec = map(int, var[1].split(":"))
+    x, y = pos
+
+    win.blits((
+        # The date segments with appropriate spacing and the slash separators
+        # between day, month, and year.
+        (TWO_DIGIT[day], (x - 5, y)),
+        (TWO_DIGIT[month], (x + 19, y)),
+        (TWO_DIGIT[year // 100], (x + 43, y)),
+        (TWO_DIGIT[year % 100], (x + 61, y)),
+        (SLASH, (x + 13, y)),
+        (SLASH, (x + 35, y)),
+        # The time segments (hours, minutes, seconds) below the date, and the
+        # colon separators between them.
+        (TWO_DIGIT[hour], (x, y + 21)),
+        (TWO_DIGIT[minute], (x + 24, y + 21)),
+        (TWO_DIGIT[sec], (x + 48, y + 21)),
+        (COLON, (x + 20, y + 21)),
+        (COLON, (x + 44, y + 21)),
+    ), False)
 
 def splitstr(string, index=57):
     """
@@ -115,27 +195,57 @@ def splitstr(string, index=57):
         index (int, optional): Maximum length of each substring. Defaults to 57.
 
     Returns:
-        list[str]: A list of substrings.
+        list[str]: A list of substrings. The last one is shorter than index, and
+        empty when the length of the string is a multiple of index.
+    """
+    # Slice every substring straight out of the string; the range runs one past
+    # its end to produce the shorter (possibly empty) last substring.
+    return [string[i:i + index] for i in range(0, len(string) + 1, index)]
+
+def _renderLines(font, color, *path):
+    """
+    Render every line of a text file in res/texts as a separate text.
+
+    Args:
+        font (pygame.font.Font): The font to render the lines with.
+        color (tuple): The color (R, G, B) of the texts.
+        *path (str): Path of the file inside res/texts, e.g. "stockfish", "win.txt".
+
+    Returns:
+        list[pygame.Surface]: One rendered text per line of the file.
     """
-    data = []
-    while len(string) >= index:
-        data.append(string[:index])
-        string = string[index:]
-    data.append(string)
-    return data
+    with open(os.path.join("res", "texts", *path)) as f:
+        return [font.render(line, True, color) for line in f.read().splitlines()]
 
 # Load background image sprites and other images required by the application.
-BGSPRITE = pygame.image.load(os.path.join("res", "img", "bgsprites.jpg"))
-PSPRITE = pygame.image.load(os.path.join("res", "img", "piecesprite.png"))
-BACK = pygame.image.load(os.path.join("res", "img", "back.png"))
+BGSPRITE = _load(os.path.join("res", "img", "bgsprites.jpg"), alpha=False)
+PSPRITE = _load(os.path.join("res", "img", "piecesprite.png"))
+BACK = _load(os.path.join("res", "img", "back.png"))
+
+# Index of each piece type in the rows of the pieces sprite and in CHESS.PIECE_LIST.
+PTYPE = {"k": 0, "q": 1, "b": 2, "n": 3, "r": 4, "p": 5}
+
+def piece(side, ptype):
+    """
+    Return the image of a piece from the flat [`CHESS.PIECE_LIST`](Source/tools/loader.py).
+
+    Args:
+        side (int): Side of the piece (0 or 1).
+        ptype (str): Type of the piece, a key of PTYPE.
+
+    Returns:
+        pygame.Surface: The 50x50 image of the piece.
+    """
+    return CHESS.PIECE_LIST[side * 6 + PTYPE[ptype]]
 
 class CHESS:
     """
     Container class for chess-specific resources such as piece images and game status texts.
     
     Attributes:
-        PIECES (tuple): A tuple of two dictionaries mapping piece types to their sprite subsurfaces
-                        for each side.
+        PIECE_LIST (list): The 12 piece images, the one of a piece at index side * 6 + PTYPE[ptype].
+        PIECES (tuple): A tuple of two dictionaries mapping piece types to their images
+                        for each side, sharing the surfaces of PIECE_LIST.
         CHECK, STALEMATE, CHECKMATE, LOST: Rendered texts to indicate game status.
         CHOOSE, SAVE, UNDO: Rendered texts for in-game menu options.
         MESSAGE, MESSAGE2, YES, NO: Rendered messages for in-game prompts.
@@ -144,11 +254,16 @@ class CHESS:
         TIMEUP: Tuple of rendered texts indicating time-up scenarios.
         OK, COL: Rendered texts for menu navigation.
     """
+    # Copy each piece's image out of the general pieces sprite, as a surface of
+    # its own rather than a subsurface locking the sprite on every blit.
+    PIECE_LIST = [
+        _convert(PSPRITE.subsurface((i * 50, side * 50, 50, 50)))
+        for side in range(2) for i in range(6)
+    ]
     PIECES = ({}, {})
-    for i, ptype in enumerate(["k", "q", "b", "n", "r", "p"]):
+    for ptype, i in PTYPE.items():
         for side in range(2):
-            # Extract each piece's image from the general pieces sprite.
-            PIECES[side][ptype] = PSPRITE.subsurface((i * 50, side * 50, 50, 50))
+            PIECES[side][ptype] = PIECE_LIST[side * 6 + i]
 
     CHECK = small.render("CHECK!", True, BLACK)
     STALEMATE = small.render("STALEMATE!", True, BLACK)
@@ -190,38 +305,42 @@ class CHESS:
     OK = small.render("Ok", True, WHITE)
     COL = small.render(":", True, BLACK)
 
-class LOADGAME:
-    """
-    Contains texts and images for the "Load Game" menu interface.
-    
-    It includes headings, game list displays, deletion confirmations, and navigation controls.
-    """
-    HEAD = large.render("Load Games", True, WHITE)
-    LIST = medium.render("List of Games", True, WHITE)
-    EMPTY = small.render("There are no saved games yet.....", True, WHITE)
-    GAME = small.render("Game", True, WHITE)
-    TYPHEAD = vsmall.render("Game Type:", True, WHITE)
-    TYP = {
-        "single": vsmall.render("SinglePlayer", True, WHITE),
-        "mysingle": vsmall.render("SinglePlayer", True, WHITE),
-        "multi": vsmall.render("MultiPlayer", True, WHITE),
-    }
-    DATE = vsmall.render("Date-", True, WHITE)
-    TIME = vsmall.render("Time-", True, WHITE)
-
-    DEL = pygame.image.load(os.path.join("res", "img", "delete.jpg"))
-    LOAD = small.render("LOAD", True, WHITE)
-
-    MESSAGE = (
-        small.render("Are you sure that you", True, WHITE),
-        small.render("want to delete game?", True, WHITE),
-    )
-    YES = small.render("YES", True, WHITE)
-    NO = small.render("NO", True, WHITE)
-
-    LEFT = medium.render("<", True, WHITE)
-    RIGHT = medium.render(">", True, WHITE)
-    PAGE = [medium.render("Page " + str(i), True, WHITE) for i in range(1, 5)]
+def _buildLoadgame():
+    """Render and load the LOADGAME resources; called once, by [`__getattr__`](Source/tools/loader.py)."""
+    class LOADGAME:
+        """
+        Contains texts and images for the "Load Game" menu interface.
+
+        It includes headings, game list displays, deletion confirmations, and navigation controls.
+        """
+        HEAD = large.render("Load Games", True, WHITE)
+        LIST = medium.render("List of Games", True, WHITE)
+        EMPTY = small.render("There are no saved games yet.....", True, WHITE)
+        GAME = small.render("Game", True, WHITE)
+        TYPHEAD = vsmall.render("Game Type:", True, WHITE)
+        TYP = {
+            "single": vsmall.render("SinglePlayer", True, WHITE),
+            "multi": vsmall.render("MultiPlayer", True, WHITE),
+        }
+        # Both single player game types are shown with the same text.
+        TYP["mysingle"] = TYP["single"]
+        DATE = vsmall.render("Date-", True, WHITE)
+        TIME = vsmall.render("Time-", True, WHITE)
+
+        DEL = _load(os.path.join("res", "img", "delete.jpg"), alpha=False)
+        LOAD = small.render("LOAD", True, WHITE)
+
+        MESSAGE = (
+            small.render("Are you sure that you", True, WHITE),
+            small.render("want to delete game?", True, WHITE),
+        )
+        YES = small.render("YES", True, WHITE)
+        NO = small.render("NO", True, WHITE)
+
+        LEFT = medium.render("<", True, WHITE)
+        RIGHT = medium.render(">", True, WHITE)
+        PAGE = [medium.render("Page " + str(i), True, WHITE) for i in range(1, 5)]
+    return LOADGAME
 
 class MAIN:
     """
@@ -229,7 +348,7 @@ class MAIN:
     """
     HEADING = head.render("Py-Chess", True, WHITE)
     VERSION = vsmall.render("Version 1.0", True, WHITE)
-    ICON = pygame.image.load(os.path.join("res", "img", "icon.gif"))
+    ICON = _load(os.path.join("res", "img", "icon.gif"))
     BG = [BGSPRITE.subsurface((i * 500, 0, 500, 500)) for i in range(4)]
 
     SINGLE = medium.render("SinglePlayer", True, WHITE)
@@ -332,7 +451,7 @@ class ONLINE:
     YOUARE = medium.render("You Are", True, WHITE)
     
     ERRCONN = vsmall.render("Unable to connect to that player..", True, WHITE)
-    REFRESH = pygame.image.load(os.path.join("res", "img", "refresh.png"))
+    REFRESH = _load(os.path.join("res", "img", "refresh.png"))
 
     REQUEST1 = (
         vsmall.render("Please wait for the other player to", True, WHITE),
@@ -371,119 +490,112 @@ class ONLINEMENU:
     Resources for the online menu interface.
     """
     HEAD = large.render("Online", True, WHITE)
-    with open(os.path.join("res", "texts", "online.txt")) as f:
-        TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
+    TEXT = _renderLines(vsmall, WHITE, "online.txt")
     CONNECT = small.render("Connect", True, WHITE)
 
-class SINGLE:
-    """
-    Contains UI texts and images for the Singleplayer menu.
-    """
-    HEAD = large.render("Singleplayer", True, WHITE)
-    SELECT = pygame.image.load(os.path.join("res", "img", "select.jpg"))
-    CHOOSE = small.render("Choose:", True, WHITE)
-    START = small.render("Start Game", True, WHITE)
-    OR = medium.render("OR", True, WHITE)
-    
-    with open(os.path.join("res", "texts", "single1.txt")) as f:
-        PARA1 = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "single2.txt")) as f:
-        PARA2 = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-        
-    LEVEL = small.render("Level:", True, WHITE)
-    BACK = vsmall.render("Go Back", True, WHITE)
-    _CONFIG = (
-        "It looks like you have not configured",
-        "stockfish. To play, you have to do",
-        "that.",
-    )
-    CONFIG = [vsmall.render(i, True, WHITE) for i in _CONFIG]
-    OK = vsmall.render("Ok", True, WHITE)
-    NOTNOW = vsmall.render("Not Now", True, WHITE)
-
-class STOCKFISH:
-    """
-    Provides texts and instructions for configuring the Stockfish engine.
-    """
-    HEAD = large.render("Stockfish Engine", True, WHITE)
-    CONFIG = small.render("Configure Stockfish", True, WHITE)
-    with open(os.path.join("res", "texts", "stockfish", "stockfish.txt"), "r") as f:
-        TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "configd.txt"), "r") as f:
-        CONFIGURED = [vsmall.render(i, True, GREEN) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "nonconfigd.txt"), "r") as f:
-        NONCONFIGURED = [vsmall.render(i, True, RED) for i in f.read().splitlines()]
-
-    CLICK = vsmall.render("Click Here", True, WHITE)
-    BACK = vsmall.render("Go Back", True, WHITE)
-    INSTALL = small.render("Install", True, WHITE)
-    TEST = vsmall.render(
-        "After all steps are complete, press button below.", True, WHITE
-    )
-
-    WIN_HEAD = small.render("Installation Guide for Windows", True, WHITE)
-    LIN_HEAD = small.render("Installation Guide for Linux -", True, WHITE)
-    MAC_HEAD = small.render("Installation Guide for Mac", True, WHITE)
-    OTH_HEAD = small.render("Installation Guide for Other OS", True, WHITE)
-
-    with open(os.path.join("res", "texts", "stockfish", "win.txt"), "r") as f:
-        WIN_TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "linux.txt"), "r") as f:
-        LIN_TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "linux2.txt"), "r") as f:
-        LIN_TEXT2 = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "mac.txt"), "r") as f:
-        MAC_TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    with open(os.path.join("res", "texts", "stockfish", "other.txt"), "r") as f:
-        OTH_TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-    # Append full paths split into shorter lines for display purposes.
-    for line in splitstr(os.path.abspath("res/stockfish/build/stockfish.exe")):
-        WIN_TEXT.append(vsmall.render(line, True, WHITE))
-
-    for line in splitstr(os.path.abspath("res/stockfish/build/stockfish")):
-        LIN_TEXT2.append(vsmall.render(line, True, WHITE))
-        OTH_TEXT.append(vsmall.render(line, True, WHITE))
-
-    LOADING = head.render("Loading", True, WHITE)
-    _SUCCESS = ("Setup successful, now you can go", "back and play chess.")
-    _NOSUCCESS = (
-        "Setup unsuccessful, try to re-",
-        "configure. Follow instructions",
-        "carefully and try again.",
-    )
-    SUCCESS = [vsmall.render(i, True, GREEN) for i in _SUCCESS]
-    NOSUCCESS = [vsmall.render(i, True, RED) for i in _NOSUCCESS]
-    
-    PROMPT = (
-        small.render("Do you want to quit?", True, WHITE),
-        vsmall.render("Stockfish is not configured yet.", True, WHITE)
-    )
-    YES = small.render("Yes", True, WHITE)
-    NO = small.render("No", True, WHITE)
-
-class ABOUT:
-    """
-    Holds the 'About' texts for the application.
-    """
-    HEAD = large.render("About PyChess", True, WHITE)
-    with open(os.path.join("res", "texts", "about.txt"), "r") as f:
-        TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
-
-class HOWTO:
-    """
-    Provides instructions and help texts for new users.
-    """
-    HEAD = large.render("Chess Howto", True, WHITE)
-    with open(os.path.join("res", "texts", "howto.txt"), "r") as f:
-        TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
+def _buildSingle():
+    """Render and load the SINGLE resources; called once, by [`__getattr__`](Source/tools/loader.py)."""
+    class SINGLE:
+        """
+        Contains UI texts and images for the Singleplayer menu.
+        """
+        HEAD = large.render("Singleplayer", True, WHITE)
+        SELECT = _load(os.path.join("res", "img", "select.jpg"), alpha=False)
+        CHOOSE = small.render("Choose:", True, WHITE)
+        START = small.render("Start Game", True, WHITE)
+        OR = medium.render("OR", True, WHITE)
+
+        PARA1 = _renderLines(vsmall, WHITE, "single1.txt")
+
+        PARA2 = _renderLines(vsmall, WHITE, "single2.txt")
+
+        LEVEL = small.render("Level:", True, WHITE)
+        BACK = vsmall.render("Go Back", True, WHITE)
+        _CONFIG = (
+            "It looks like you have not configured",
+            "stockfish. To play, you have to do",
+            "that.",
+        )
+        CONFIG = [vsmall.render(i, True, WHITE) for i in _CONFIG]
+        OK = vsmall.render("Ok", True, WHITE)
+        NOTNOW = vsmall.render("Not Now", True, WHITE)
+    return SINGLE
+
+def _buildStockfish():
+    """Render and load the STOCKFISH resources; called once, by [`__getattr__`](Source/tools/loader.py)."""
+    class STOCKFISH:
+        """
+        Provides texts and instructions for configuring the Stockfish engine.
+        """
+        HEAD = large.render("Stockfish Engine", True, WHITE)
+        CONFIG = small.render("Configure Stockfish", True, WHITE)
+        TEXT = _renderLines(vsmall, WHITE, "stockfish", "stockfish.txt")
+        CONFIGURED = _renderLines(vsmall, GREEN, "stockfish", "configd.txt")
+        NONCONFIGURED = _renderLines(vsmall, RED, "stockfish", "nonconfigd.txt")
+
+        CLICK = vsmall.render("Click Here", True, WHITE)
+        BACK = vsmall.render("Go Back", True, WHITE)
+        INSTALL = small.render("Install", True, WHITE)
+        TEST = vsmall.render(
+            "After all steps are complete, press button below.", True, WHITE
+        )
+
+        WIN_HEAD = small.render("Installation Guide for Windows", True, WHITE)
+        LIN_HEAD = small.render("Installation Guide for Linux -", True, WHITE)
+        MAC_HEAD = small.render("Installation Guide for Mac", True, WHITE)
+        OTH_HEAD = small.render("Installation Guide for Other OS", True, WHITE)
+
+        WIN_TEXT = _renderLines(vsmall, WHITE, "stockfish", "win.txt")
+        LIN_TEXT = _renderLines(vsmall, WHITE, "stockfish", "linux.txt")
+        LIN_TEXT2 = _renderLines(vsmall, WHITE, "stockfish", "linux2.txt")
+        MAC_TEXT = _renderLines(vsmall, WHITE, "stockfish", "mac.txt")
+        OTH_TEXT = _renderLines(vsmall, WHITE, "stockfish", "other.txt")
+
+        # Append full paths split into shorter lines for display purposes.
+        for line in splitstr(os.path.abspath("res/stockfish/build/stockfish.exe")):
+            WIN_TEXT.append(vsmall.render(line, True, WHITE))
+
+        for line in splitstr(os.path.abspath("res/stockfish/build/stockfish")):
+            LIN_TEXT2.append(vsmall.render(line, True, WHITE))
+            OTH_TEXT.append(vsmall.render(line, True, WHITE))
+
+        LOADING = head.render("Loading", True, WHITE)
+        _SUCCESS = ("Setup successful, now you can go", "back and play chess.")
+        _NOSUCCESS = (
+            "Setup unsuccessful, try to re-",
+            "configure. Follow instructions",
+            "carefully and try again.",
+        )
+        SUCCESS = [vsmall.render(i, True, GREEN) for i in _SUCCESS]
+        NOSUCCESS = [vsmall.render(i, True, RED) for i in _NOSUCCESS]
+
+        PROMPT = (
+            small.render("Do you want to quit?", True, WHITE),
+            vsmall.render("Stockfish is not configured yet.", True, WHITE)
+        )
+        YES = small.render("Yes", True, WHITE)
+        NO = small.render("No", True, WHITE)
+    return STOCKFISH
+
+def _buildAbout():
+    """Render and load the ABOUT resources; called once, by [`__getattr__`](Source/tools/loader.py)."""
+    class ABOUT:
+        """
+        Holds the 'About' texts for the application.
+        """
+        HEAD = large.render("About PyChess", True, WHITE)
+        TEXT = _renderLines(vsmall, WHITE, "about.txt")
+    return ABOUT
+
+def _buildHowto():
+    """Render and load the HOWTO resources; called once, by [`__getattr__`](Source/tools/loader.py)."""
+    class HOWTO:
+        """
+        Provides instructions and help texts for new users.
+        """
+        HEAD = large.render("Chess Howto", True, WHITE)
+        TEXT = _renderLines(vsmall, WHITE, "howto.txt")
+    return HOWTO
 
 class TIMER:
     """
@@ -495,8 +607,41 @@ class TIMER:
     NO = small.render("No", True, WHITE)
     
     PROMPT = vsmall.render("Do you want to set timer?", True, WHITE)
-    with open(os.path.join("res", "texts", "timer.txt"), "r") as f:
-        TEXT = [vsmall.render(i, True, WHITE) for i in f.read().splitlines()]
+    TEXT = _renderLines(vsmall, WHITE, "timer.txt")
+
+# Resource classes no module of this tree imports at startup, and the functions
+# building them. Their texts are only rendered and their files only read the
+# first time they are looked up.
+_LAZY = {
+    "LOADGAME": _buildLoadgame,
+    "SINGLE": _buildSingle,
+    "STOCKFISH": _buildStockfish,
+    "ABOUT": _buildAbout,
+    "HOWTO": _buildHowto,
+}
+
+def __getattr__(name):
+    """
+    Build a lazily loaded resource class on its first lookup (PEP 562).
 
-# Quit the font module after all fonts are loaded to free related resources.
-pygame.font.quit()
\ No newline at end of file
+    The class is then stored in the module globals, so that later lookups,
+    including `from tools.loader import NAME`, find it without calling this again.
+
+    Args:
+        name (str): Name of the module attribute not found in the globals.
+
+    Returns:
+        type: The resource class named name.
+
+    Raises:
+        AttributeError: If name is not a lazily loaded resource class.
+    """
+    if name not in _LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = _LAZY[name]()
+    return globals()[name]
+
+# Python 3.6 does not look up module level __getattr__, so build them all now.
+if sys.version_info < (3, 7):
+    for _name in _LAZY:
+        __getattr__(_name)
@@ -13,11 +13,16 @@ to play any audio, ensuring graceful fallback if sound initialization fails.
 """
 
 import os.path
-import time
 
 try:
     import pygame.mixer
-    pygame.mixer.init()
+    # Open the audio device at 44.1 kHz, 16 bit stereo, the format of the background
+    # music. Every Sound is converted to this format once, when it is loaded, so
+    # playing one only mixes it in. The small buffer keeps the delay between a click
+    # or move and its sound short (Pygame 1 defaults to 4096 samples, about 93 ms).
+    # This module is imported before pygame.init() in pychess.py, which then keeps
+    # the mixer as opened here.
+    pygame.mixer.init(44100, -16, 2, 512)
     # SUCCESS flag indicates whether the mixer was successfully initialized
     SUCCESS = pygame.mixer.get_init() is not None
 
@@ -74,7 +79,6 @@ def play_click(load):
     """
     if SUCCESS and load.get("sounds"):
         click.play()
-        time.sleep(0.1)  # Short delay to ensure the sound effect is audible
 
 def play_start(load):
     """Play the start sound effect if sound is enabled.
@@ -93,7 +97,6 @@ def play_move(load):
     """
     if SUCCESS and load.get("sounds"):
         move.play()
-        time.sleep(0.1)  # Delay for better synchronization with move animations
 
 def play_drag(load):
     """Play the drag sound effect if sound is enabled.
@@ -103,9 +106,3 @@ def play_drag(load):
     """
     if SUCCESS and load.get("sounds"):
         drag.play()
-
-# The following cleanup call quits the mixer if initialization was successful.
-# Note: Calling pygame.mixer.quit() here will unload sound resources immediately.
-# Ensure this is intended for your application's lifecycle, as it might affect subsequent sound playback.
-if SUCCESS:
-    pygame.mixer.quit()
\ No newline at end of file
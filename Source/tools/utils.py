@@ -6,15 +6,22 @@
 
 """
 This module provides a set of utility functions for the Chess application. 
-These utilities include graphics functions for drawing rounded rectangles using Pygame 
-and a decorator for simple performance measurement of functions.
+These utilities include graphics functions for drawing rounded rectangles using Pygame,
+cached rounded rectangle layers, and a decorator for simple performance measurement of functions.
 """
 
+import atexit
 import time
 
 import pygame
 import pygame.gfxdraw
 
+# Rounded rectangles drawn by rounded_rect_layer, by their arguments.
+_rounded_cache = {}
+
+# Anti-aliased discs drawn by _corner, by (color, radius).
+_corner_cache = {}
+
 def rounded_rect(surf, color, rect, radius=10, border=2, incolor=(0, 0, 0)):
     """
     Draw a rounded rectangle with an optional border on a given surface.
@@ -45,13 +52,75 @@ def rounded_rect(surf, color, rect, radius=10, border=2, incolor=(0, 0, 0)):
         # Draw the inner rounded rectangle.
         _filled_rounded_rect(surf, incolor, inner_rect, radius)
 
+def rounded_rect_layer(color, size, radius=10, border=2, incolor=(0, 0, 0), bgcolor=(0, 0, 0)):
+    """
+    Get a rounded rectangle drawn on a surface of its own, ready to be blitted.
+
+    Each combination of arguments is drawn with [`rounded_rect`](#rounded_rect) only
+    once. The corners outside the rounded outline are filled with bgcolor, so
+    blitting the layer gives the same pixels as rounded_rect only over a
+    background of that color. Only call this once the display mode is set.
+
+    Args:
+        color (tuple): The color (R, G, B) of the border.
+        size (tuple): The (width, height) of the rectangle.
+        radius (int): The radius of the rounded corners.
+        border (int): The border thickness.
+        incolor (tuple): The inner fill color (R, G, B).
+        bgcolor (tuple): The color (R, G, B) of the background the layer is blitted on.
+
+    Returns:
+        pygame.Surface: The rounded rectangle on a surface of the given size.
+    """
+    key = (color, size, radius, border, incolor, bgcolor)
+    layer = _rounded_cache.get(key)
+    if layer is None:
+        layer = pygame.Surface(size).convert()
+        layer.fill(bgcolor)
+        rounded_rect(layer, color, (0, 0) + tuple(size), radius, border, incolor)
+        _rounded_cache[key] = layer
+    return layer
+
+def _corner(color, r):
+    """
+    Get an anti-aliased filled circle on a transparent surface, drawn only once.
+
+    gfxdraw blends the edge of a circle drawn on a transparent surface with
+    too little opacity, so the circle is drawn in white on black instead, and
+    the brightness of each pixel becomes the opacity of the circle's color.
+    Blitting the result then gives the pixels of drawing the circle straight on
+    the target, give or take 1 in a color channel.
+
+    Args:
+        color (tuple): The color (R, G, B) of the circle.
+        r (int): The radius of the circle.
+
+    Returns:
+        pygame.Surface: The circle, centered on a (2r + 1) x (2r + 1) surface.
+    """
+    key = (tuple(color[:3]), r)
+    disc = _corner_cache.get(key)
+    if disc is None:
+        size = 2 * r + 1
+        mask = pygame.Surface((size, size))
+        # Anti-aliased circle for smooth edges.
+        pygame.gfxdraw.aacircle(mask, r, r, r, (255, 255, 255))
+        pygame.gfxdraw.filled_circle(mask, r, r, r, (255, 255, 255))
+
+        disc = pygame.Surface((size, size), pygame.SRCALPHA)
+        for y in range(size):
+            for x in range(size):
+                disc.set_at((x, y), key[0] + (mask.get_at((x, y))[0],))
+        _corner_cache[key] = disc
+    return disc
+
 def _filled_rounded_rect(surf, color, rect, r):
     """
     Draw a solid rounded rectangle on a given surface.
 
-    The function creates smooth rounded corners by drawing filled circles at the corners,
-    and then fills in the central rectangular area. This breakdown ensures that the drawing
-    is both efficient and visually appealing.
+    The rounded corners are the four quarters of a cached circle from
+    [`_corner`](#_corner), blitted in a single call, and two central rectangles
+    fill in the rest of the area.
 
     Args:
         surf (pygame.Surface): The surface to draw on.
@@ -59,38 +128,66 @@ def _filled_rounded_rect(surf, color, rect, r):
         rect (tuple): The rectangle (x, y, width, height) representing the area.
         r (int): The radius for the rounded corners.
     """
-    # Draw circles at each corner to achieve the rounded effect.
-    for x, y in [
-            (rect[0] + r, rect[1] + r),
-            (rect[0] + rect[2] - r - 1, rect[1] + r),
-            (rect[0] + r, rect[1] + rect[3] - r - 1),
-            (rect[0] + rect[2] - r - 1, rect[1] + rect[3] - r - 1)
-    ]:
-        # Anti-aliased circle for smooth edges.
-        pygame.gfxdraw.aacircle(surf, x, y, r, color)
-        pygame.gfxdraw.filled_circle(surf, x, y, r, color)
-    
+    disc = _corner(color, r)
+    right = rect[0] + rect[2] - r
+    bottom = rect[1] + rect[3] - r
+
+    # Blit each quarter of the circle into the corner the central rectangles leave uncovered.
+    surf.blits((
+        (disc, (rect[0], rect[1]), (0, 0, r, r)),
+        (disc, (right, rect[1]), (r + 1, 0, r, r)),
+        (disc, (rect[0], bottom), (0, r + 1, r, r)),
+        (disc, (right, bottom), (r + 1, r + 1, r, r)),
+    ), False)
+
     # Draw central rectangles to cover the remaining areas between corner circles.
     pygame.draw.rect(surf, color, (rect[0] + r, rect[1], rect[2] - 2 * r, rect[3]))
     pygame.draw.rect(surf, color, (rect[0], rect[1] + r, rect[2], rect[3] - 2 * r))
 
+# Execution times in ms recorded by timeit, by the qualified name of the measured function.
+_timings = {}
+
+def _print_timings():
+    """
+    Print a summary of the execution times recorded by [`timeit`](#timeit).
+
+    Registered with atexit, so the summary is printed once, when the program exits.
+    """
+    for name, samples in _timings.items():
+        if not samples:
+            continue  # Decorated, but never called.
+        samples.sort()
+        print(
+            "Time:", name, "called", len(samples), "times,",
+            "mean", round(sum(samples) / len(samples), 4), "ms,",
+            "median", round(samples[len(samples) // 2], 4), "ms,",
+            "p99", round(samples[(len(samples) * 99) // 100], 4), "ms,",
+            "max", round(samples[-1], 4), "ms",
+        )
+
+atexit.register(_print_timings)
+
 def timeit(func):
     """
-    Decorator to measure and print the execution time of a function.
+    Decorator to measure the execution time of a function.
 
     This decorator is useful during testing and debugging to quickly assess 
-    the performance of code segments without altering their logic.
+    the performance of code segments without altering their logic. Every call
+    only records its time; [`_print_timings`](#_print_timings) prints a summary
+    of them at exit, so that slow console output neither stalls the program nor
+    skews the measurements.
 
     Args:
         func (function): The function to be measured.
 
     Returns:
-        function: A wrapped version of the original function that prints its execution time.
+        function: A wrapped version of the original function that records its execution time.
     """
+    samples = _timings.setdefault(func.__qualname__, [])
+
     def inner(*args, **kwargs):
         start = time.perf_counter()
         ret = func(*args, **kwargs)
-        end = time.perf_counter()
-        print("Time:", round((end - start) * 1000, 4), "ms")
+        samples.append((time.perf_counter() - start) * 1000)
         return ret
-    return inner
\ No newline at end of file
+    return inner